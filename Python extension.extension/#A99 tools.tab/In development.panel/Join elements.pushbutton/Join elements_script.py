@@ -6,9 +6,9 @@
 import clr
 clr.AddReference('RevitAPI')
 clr.AddReference('RevitAPIUI')
-from Autodesk.Revit.DB import (FilteredElementCollector, BuiltInCategory, JoinGeometryUtils,
-                               Outline, BoundingBoxIntersectsFilter, Transaction)
+from Autodesk.Revit.DB import BuiltInCategory, JoinGeometryUtils, Transaction
 from Autodesk.Revit.UI import TaskDialog
+from rpw.db import Collector
 
 # Import pyRevit forms
 from pyrevit import forms
@@ -34,18 +34,19 @@ def join_intersecting_elements(selected_categories):
     t = Transaction(doc, 'Join Intersecting Elements')
     t.Start()
 
-    elements = []
-    for category in selected_categories:
-        elements.extend(FilteredElementCollector(doc, uidoc.ActiveView.Id).OfCategory(category).WhereElementIsNotElementType().ToElements())
-
-    selected_category_ids = [doc.Settings.Categories.get_Item(cat).Id for cat in selected_categories]
+    view = uidoc.ActiveView
+    elements = Collector(doc=doc, view=view, of_categories=selected_categories,
+                         is_not_type=True).get_elements(wrapped=False)
 
     for elem in elements:
-        outline = Outline(elem.BoundingBox[uidoc.ActiveView].Min, elem.BoundingBox[uidoc.ActiveView].Max)
-        bbFilter = BoundingBoxIntersectsFilter(outline)
-        intersecting_elements = FilteredElementCollector(doc, uidoc.ActiveView.Id).WherePasses(bbFilter).ToElements()
+        bbox = elem.BoundingBox[view]
+        if bbox is None:
+            continue
+        # rpw applies the category filter before the bounding box filter
+        intersecting_elements = Collector(doc=doc, view=view, of_categories=selected_categories,
+                                          bbox_intersects=bbox, exclude=elem).get_elements(wrapped=False)
         for other_elem in intersecting_elements:
-            if other_elem.Category.Id in selected_category_ids and elem.Id != other_elem.Id and not JoinGeometryUtils.AreElementsJoined(doc, elem, other_elem):
+            if not JoinGeometryUtils.AreElementsJoined(doc, elem, other_elem):
                 try:
                     JoinGeometryUtils.JoinGeometry(doc, elem, other_elem)
                     join_count += 1
@@ -9,7 +9,7 @@ Builds a room code from four parameters in this order:
 Podlaží rules:
   - '1NP', '1.NP', '10.NP', ...   -> '01', '10', ...
   - '1PP', '1.PP', '2.PP', ...    -> '1P', '2P', ...
-Writes the result into the parameter "Číslo" without pre-checks.
+Writes the result into the parameter "Číslo", skipping rooms that already have it.
 Counts unplaced rooms as "Počet neumístěných místností".
 Adds a clickable report of all skipped rooms (name, level, ID, missing parameter).
 _____________________________________________________________________
@@ -25,6 +25,7 @@ import re
 from Autodesk.Revit.DB import *
 from Autodesk.Revit.DB import Transaction, FilteredElementCollector, BuiltInCategory
 from pyrevit import script
+from rpw.db import ParameterHandle, bulk_set
 
 # ==================================================
 # Revit context
@@ -41,6 +42,10 @@ PARAM_LEVEL = u"Podlaží"
 PARAM_OCC   = u"Obsazení"
 PARAM_NUM   = u"Číslo místnosti"
 
+# Each parameter is resolved once, on the first room that has it
+HANDLES = dict((name, ParameterHandle(name))
+               for name in (PARAM_OUT, PARAM_PART, PARAM_LEVEL, PARAM_OCC, PARAM_NUM))
+
 DELIM = u"."
 
 # ==================================================
@@ -49,7 +54,7 @@ def _get_param(elem, name):
     if not elem:
         return None
     try:
-        return elem.LookupParameter(name)
+        return HANDLES[name].get_parameter(elem)
     except Exception:
         return None
 
@@ -127,6 +132,7 @@ def _room_level_name(room):
 # ==================================================
 # Main
 processed = 0
+unchanged = 0
 errors = 0
 skipped_unplaced = 0
 skipped_missing_inputs = 0
@@ -134,6 +140,10 @@ skipped_missing_inputs = 0
 # Collect detailed info for skipped rooms
 skipped_details = []   # each item: dict(name, level, id, reason)
 
+# Rooms to write and their codes
+rooms_to_write = []
+codes = {}             # room.Id -> code
+
 rooms = FilteredElementCollector(doc)\
     .OfCategory(BuiltInCategory.OST_Rooms)\
     .WhereElementIsNotElementType()\
@@ -188,19 +198,24 @@ try:
             part=part, lvl=level_code, occ=occ, num=num, d=DELIM
         )
 
-        # Write to "Číslo" without pre-checks (per your preference)
-        try:
-            p_out = _get_param(room, PARAM_OUT)
-            p_out.Set(value)  # may fail if None/readonly/wrong type
-            processed += 1
-        except Exception as ex:
-            errors += 1
-            skipped_details.append(dict(
-                name=_room_name(room),
-                level=_room_level_name(room),
-                id=room.Id,
-                reason=u"Zápis do 'Číslo' selhal: {}".format(ex)
-            ))
+        rooms_to_write.append(room)
+        codes[room.Id] = value
+
+    # Write to "Číslo" with rpw bulk_set: rooms that already have the
+    # code are skipped, since Set() on the same value still marks the
+    # room as modified. Failed writes are collected, not raised
+    result = bulk_set(rooms_to_write, {HANDLES[PARAM_OUT]: lambda room: codes[room.Id]})
+    unchanged = result.unchanged
+    errors = len(result.errors)
+    processed = len(rooms_to_write) - errors
+    for room_id, _, ex in result.errors:
+        room = doc.GetElement(room_id)
+        skipped_details.append(dict(
+            name=_room_name(room),
+            level=_room_level_name(room),
+            id=room_id,
+            reason=u"Zápis do 'Číslo' selhal: {}".format(ex)
+        ))
 
 finally:
     t.Commit()
@@ -211,7 +226,8 @@ skipped_total = total - processed
 # =======================
 # Summary
 print(u"Hotovo ({})".format(__title__))
-print(u"Zpracováno: {} | Přeskočeno: {} | Chyby: {}".format(processed, skipped_total, errors))
+print(u"Zpracováno: {} (beze změny: {}) | Přeskočeno: {} | Chyby: {}".format(
+    processed, unchanged, skipped_total, errors))
 print(u"- Počet neumístěných místností: {}".format(skipped_unplaced))
 print(u"- Chybějící/Neplatné vstupní parametry: {}".format(skipped_missing_inputs))
 
@@ -26,7 +26,9 @@ __helpurl__ = "https://atelier99cz.sharepoint.com/sites/Atelier99/SitePages/Main
 # ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
 # ==================================================
 from pyrevit import revit, DB, forms
+from System import Type
 from System.Collections.Generic import List
+import clr
 from Autodesk.Revit.UI import TaskDialog
 
 # ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
@@ -42,19 +44,22 @@ app   = __revit__.Application                 # Represents the Autodesk Revit Ap
 # ╩ ╩╩ ╩╩╝╚╝ MAIN
 # ==================================================
 def get_linked_models_and_dwg():
-    linked_elements = []
+    linked_models = []
+    linked_dwgs = []
     doc = revit.doc
 
-    for elem in DB.FilteredElementCollector(doc).OfClass(DB.RevitLinkInstance):
-        file_name = elem.Name
-        linked_elements.append((file_name, elem.Id))
+    # Links and imports in one collector pass
+    link_classes = List[Type]([clr.GetClrType(DB.RevitLinkInstance),
+                               clr.GetClrType(DB.ImportInstance)])
+    link_filter = DB.ElementMulticlassFilter(link_classes)
 
-    for elem in DB.FilteredElementCollector(doc).OfClass(DB.ImportInstance):
-        if elem.IsLinked:
-            dwg_name = elem.Category.Name
-            linked_elements.append((dwg_name, elem.Id))
+    for elem in DB.FilteredElementCollector(doc).WherePasses(link_filter):
+        if isinstance(elem, DB.RevitLinkInstance):
+            linked_models.append((elem.Name, elem.Id))
+        elif elem.IsLinked:
+            linked_dwgs.append((elem.Category.Name, elem.Id))
 
-    return linked_elements
+    return linked_models + linked_dwgs
 
 
 def main():
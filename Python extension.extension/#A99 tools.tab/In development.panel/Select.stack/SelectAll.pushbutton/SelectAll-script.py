@@ -62,12 +62,10 @@ if __name__ == '__main__':
     # Finding the corresponding Category objects for the names selected
     selected_categories = [cat for cat in categories if cat.Name in selected_cat_names]
 
-    # Collecting elements from selected categories
-    selected_element_ids = []
-    for cat in selected_categories:
-        cat_filter = ElementCategoryFilter(cat.Id)
-        collector = FilteredElementCollector(doc).WherePasses(cat_filter).WhereElementIsNotElementType().ToElementIds()
-        selected_element_ids.extend(collector)
+    # Collecting elements from selected categories in a single pass
+    category_ids = List[ElementId]([cat.Id for cat in selected_categories])
+    cat_filter = ElementMulticategoryFilter(category_ids)
+    selected_element_ids = FilteredElementCollector(doc).WherePasses(cat_filter).WhereElementIsNotElementType().ToElementIds()
 
     # Selecting elements in Revit
     select_elements(selected_element_ids)
\ No newline at end of file
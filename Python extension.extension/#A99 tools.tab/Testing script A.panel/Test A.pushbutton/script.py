@@ -9,7 +9,8 @@ Author: Robert Perry Lackowski (modified for Revit 2023)
 """
 
 from Autodesk.Revit.DB import ElementLevelFilter, FilteredElementCollector
-from Autodesk.Revit.DB import Document, BuiltInParameter, BuiltInCategory, ElementFilter, ElementCategoryFilter, LogicalOrFilter, ElementIsElementTypeFilter, ElementId
+from Autodesk.Revit.DB import Document, BuiltInParameter, BuiltInCategory, ElementFilter, ElementMulticategoryFilter, ElementIsElementTypeFilter, ElementId
+from System.Collections.Generic import List
 from Autodesk.Revit.Exceptions import OperationCanceledException
 # from pyrevit import DB
 doc = __revit__.ActiveUIDocument.Document
@@ -159,12 +160,7 @@ if target_level_id is not None:
         BuiltInCategory.OST_Wire,
     ]
 
-    category_filters = []
-
-    for BIC in BICs:
-        category_filters.append(ElementCategoryFilter(BIC))
-
-    final_filter = LogicalOrFilter(category_filters)
+    final_filter = ElementMulticategoryFilter(List[BuiltInCategory](BICs))
 
     # Apply filter to create list of elements
     all_elements = FilteredElementCollector(doc).WherePasses(final_filter).WhereElementIsNotElementType().WhereElementIsViewIndependent().ToElements()
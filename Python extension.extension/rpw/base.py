@@ -35,8 +35,29 @@ import rpw
 from rpw.utils.logger import logger
 
 
+def _get_type_member(revit_object, attr):
+    """
+    Returns descriptor of ``attr`` on the type of ``revit_object``, or
+    ``None`` if the attribute must be looked up on the object itself.
+    """
+    if hasattr(revit_object, '__dict__'):
+        # Instance attributes can shadow members of the type
+        return None
+    member = getattr(type(revit_object), attr, None)
+    if not hasattr(member, '__get__'):
+        return None
+    return member
+
+
+_revit_members = {}     # (Wrapped type, attr): Member of type, or None
+_revit_attributes = {}  # (Wrapped type, attr): Wrapped object has attr
+
+
 class BaseObject(object):
 
+        # Subclasses without __slots__ still get a __dict__
+        __slots__ = ()
+
         def __init__(self, *args, **kwargs):
             pass
 
@@ -61,8 +82,22 @@ class BaseObjectWrapper(BaseObject):
     """
     Arguments:
         element(APIObject): Revit Element to store
+
+    Note:
+        Members read from the wrapped object are kept per wrapped type,
+        and ``__setattr__`` remembers which names belong to the wrapped
+        type, so repeated access skips reflection. Wrapper classes are
+        not modified. Objects with a ``__dict__`` are always looked up again.
+
+        ``_revit_object`` is stored in a slot. Wrappers that define
+        ``__slots__`` (ie. :any:`Element`, :any:`Parameter`, :any:`XYZ`)
+        do not have a ``__dict__``, so they can only set attributes listed
+        in their ``__slots__``, or attributes of the wrapped object.
+        Wrappers without ``__slots__`` can set any attribute.
     """
 
+    __slots__ = ('_revit_object',)
+
     def __init__(self, revit_object, enforce_type=True):
         """
         Child classes can use self._revit_object to refer back to Revit Element
@@ -90,7 +125,7 @@ class BaseObjectWrapper(BaseObject):
         already exists.
         """
         try:
-            return getattr(self.__dict__['_revit_object'], attr)
+            revit_object = object.__getattribute__(self, '_revit_object')
         # except AttributeError:
             # This lower/snake case to be converted.
             # This automatically gives acess to all names in lower case format
@@ -98,16 +133,35 @@ class BaseObjectWrapper(BaseObject):
             # Note: will not Work for setters, unless defined by wrapper
             # attr_pascal_case = rpw.utils.coerce.to_pascal_case(attr)
             # return getattr(self.__dict__['_revit_object'], attr_pascal_case)
-        except KeyError:
+        except AttributeError:
             raise rpw.exceptions.RpwException('BaseObjectWrapper is missing _revit_object')
+        if attr.startswith('__'):
+            return getattr(revit_object, attr)
+        revit_type = type(revit_object)
+        key = (revit_type, attr)
+        try:
+            member = _revit_members[key]
+        except KeyError:
+            member = _revit_members[key] = _get_type_member(revit_object, attr)
+        if member is None:
+            return getattr(revit_object, attr)
+        return member.__get__(revit_object, revit_type)
 
     def __setattr__(self, attr, value):
         """
         Setter allows setting of wrapped object properties, for example
         ```WrappedWall.Pinned = True``
         """
-        if hasattr(self._revit_object, attr):
-            self._revit_object.__setattr__(attr, value)
+        revit_object = self._revit_object
+        key = (type(revit_object), attr)
+        try:
+            is_revit_attribute = _revit_attributes[key]
+        except KeyError:
+            is_revit_attribute = hasattr(revit_object, attr)
+            if not hasattr(revit_object, '__dict__'):
+                _revit_attributes[key] = is_revit_attribute
+        if is_revit_attribute:
+            revit_object.__setattr__(attr, value)
         else:
             object.__setattr__(self, attr, value)
 
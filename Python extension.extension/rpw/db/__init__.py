@@ -7,7 +7,7 @@ wrapper classes stay available in rpw.db
 
 import rpw.db
 
-from rpw.db.element import Element
+from rpw.db.element import Element, register_wrapper
 from rpw.db.family import FamilyInstance, FamilySymbol, Family
 from rpw.db.category import Category
 
@@ -23,7 +23,7 @@ from rpw.db.view import ViewFamily, ViewType, ViewPlanType  # Enums
 
 from rpw.db.pattern import LinePatternElement, FillPatternElement
 
-from rpw.db.parameter import Parameter, ParameterSet
+from rpw.db.parameter import Parameter, ParameterSet, ParameterHandle, bulk_set
 from rpw.db.builtins import BicEnum, BipEnum
 
 from rpw.db.xyz import XYZ
@@ -34,9 +34,10 @@ from rpw.db.bounding_box import BoundingBox
 from rpw.db.reference import Reference
 
 from rpw.db.collection import ElementSet, ElementCollection
-from rpw.db.collection import XyzCollection
+from rpw.db.collection import XyzCollection, IdBitmap
 
-from rpw.db.collector import Collector, ParameterFilter
+from rpw.db.collector import Collector, LinkedCollector, ParameterFilter, P, F
+from rpw.db.index import ParameterIndex
 from rpw.db.transaction import Transaction, TransactionGroup
 
 __all__ = [cls for cls in locals().values() if isinstance(cls, type)]
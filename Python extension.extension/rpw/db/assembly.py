@@ -20,6 +20,7 @@ class AssemblyInstance(Element, CategoryMixin):
     """
 
     _revit_object_class = DB.AssemblyInstance
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class, 'is_type': False}
 
     @property
@@ -53,6 +54,7 @@ class AssemblyType(FamilySymbol, CategoryMixin):
     """
 
     _revit_object_class = DB.AssemblyType
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class, 'is_type': True}
 
     @property
@@ -13,13 +13,80 @@ Note:
 ----------------------------------------------------------------
 """ ###
 
-import re
 from rpw import revit, DB
 from rpw.base import BaseObject, BaseObjectWrapper
 from rpw.utils.dotnet import Enum
 from rpw.exceptions import RpwCoerceError
 
 
+class _EnumIndex(object):
+    """
+    Name index of an Enumeration, built once per process on first use.
+
+    Members are indexed by name, and by fuzzy name: lower case, without
+    spaces and without ``prefix``. Member ``ElementId`` are also kept,
+    so name lookups do not scan the enumeration.
+
+    >>> _EnumIndex(DB.BuiltInCategory, prefix='OST_').fuzzy_get('walls')
+    Revit.DB.BuiltInCategory.OST_Walls
+    """
+
+    def __init__(self, enum_type, prefix=''):
+        self.enum_type = enum_type
+        self.prefix = prefix.lower()
+        self.localized = False      # Localized names were added
+        self._members = None        # name: member
+        self._fuzzy_members = None  # fuzzy name: member
+        self._ids = {}              # name: DB.ElementId
+
+    def fuzzy_name(self, name):
+        """ Lower case name, without spaces and ``prefix`` """
+        name = name.replace(' ', '').lower()
+        return name.replace(self.prefix, '') if self.prefix else name
+
+    def _build(self):
+        members = {}
+        fuzzy_members = {}
+        for name in sorted(Enum.GetNames(self.enum_type)):
+            member = getattr(self.enum_type, name)
+            members[name] = member
+            if name.lower().startswith(self.prefix):
+                fuzzy_members.setdefault(self.fuzzy_name(name), member)
+        self._members = members
+        self._fuzzy_members = fuzzy_members
+
+    def get(self, name):
+        """ Member by exact name, or ``None`` """
+        if self._members is None:
+            self._build()
+        return self._members.get(name)
+
+    def get_id(self, name):
+        """ ``DB.ElementId`` of member by exact name, or ``None`` """
+        element_id = self._ids.get(name)
+        if element_id is None:
+            member = self.get(name)
+            if member is None:
+                return None
+            element_id = self._ids[name] = DB.ElementId(member)
+        return element_id
+
+    def fuzzy_get(self, name):
+        """ Member by fuzzy name, or ``None`` """
+        if self._fuzzy_members is None:
+            self._build()
+        return self._fuzzy_members.get(self.fuzzy_name(name))
+
+    def add(self, name, member):
+        """ Adds a fuzzy name, like a localized name. Existing names are kept """
+        if self._fuzzy_members is None:
+            self._build()
+        self._fuzzy_members.setdefault(self.fuzzy_name(name), member)
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+
 class _BiParameter(BaseObjectWrapper):
     """
     BuiltInParameter Wrapper
@@ -50,9 +117,8 @@ class _BiParameter(BaseObjectWrapper):
             ``DB.BuiltInParameter``: BuiltInParameter Enumeration Member
 
         """
-        try:
-            enum = getattr(DB.BuiltInParameter, parameter_name)
-        except AttributeError:
+        enum = _bip_index.get(parameter_name)
+        if enum is None:
             raise RpwCoerceError(parameter_name, DB.BuiltInParameter)
         return enum
 
@@ -66,8 +132,14 @@ class _BiParameter(BaseObjectWrapper):
         Returns:
             ``DB.BuitInParameter``: BuiltInParameter Enumeration Member
         """
-        enum = self.get(parameter_name)
-        return DB.ElementId(enum)
+        element_id = _bip_index.get_id(parameter_name)
+        if element_id is None:
+            raise RpwCoerceError(parameter_name, DB.BuiltInParameter)
+        return element_id
+
+    def __contains__(self, parameter_name):
+        """ ``True`` if ``parameter_name`` is a BuiltInParameter name """
+        return parameter_name in _bip_index
 
     def __repr__(self):
         return super(_BiParameter, self).__repr__(to_string='Autodesk.Revit.DB.BuiltInParameter')
@@ -101,15 +173,16 @@ class _BiCategory(BaseObjectWrapper):
             ``DB.BuiltInCategory``: BuiltInCategory Enumeration Member
         """
 
-        try:
-            enum = getattr(DB.BuiltInCategory, category_name)
-        except AttributeError:
+        enum = _bic_index.get(category_name)
+        if enum is None:
             raise RpwCoerceError(category_name, DB.BuiltInCategory)
         return enum
 
     def fuzzy_get(self, loose_category_name):
         """ Gets Built In Category by Fuzzy Name.
         Similar to get() but ignores case, and does not require OST_ prefix.
+        Localized category names of the active document are also found.
+        Names are looked up in an index built once, see :any:`_EnumIndex`
 
         >>> BiCategory.fuzzy_get('OST_Rooms')
         < BuiltInCategory >
@@ -124,14 +197,26 @@ class _BiCategory(BaseObjectWrapper):
         Returns:
             ``DB.BuiltInCategory``: BuiltInCategory Enumeration Member
         """
-        loose_category_name = loose_category_name.replace(' ', '').lower()
-        loose_category_name = loose_category_name.replace('ost_', '')
-        for category_name in dir(DB.BuiltInCategory):
-            exp = '(OST_)({})$'.format(loose_category_name)
-            if re.search(exp, category_name, re.IGNORECASE):
-                return self.get(category_name)
-        # If not Found Try regular method, handle error
-        return self.get(loose_category_name)
+        enum = _bic_index.fuzzy_get(loose_category_name)
+        if enum is None and not _bic_index.localized and revit.doc is not None:
+            self._add_category_names(revit.doc)
+            enum = _bic_index.fuzzy_get(loose_category_name)
+        if enum is None:
+            # If not Found Try regular method, handle error
+            return self.get(loose_category_name)
+        return enum
+
+    def _add_category_names(self, doc):
+        """
+        Adds localized ``Category.Name`` of the document categories to the
+        fuzzy names, ie: ``'Murs'`` for ``OST_Walls``. Done once.
+        """
+        _bic_index.localized = True
+        for category in doc.Settings.Categories:
+            category_id = category.Id.IntegerValue
+            if category_id < -1:
+                _bic_index.add(category.Name,
+                               Enum.ToObject(DB.BuiltInCategory, category_id))
 
     def get_id(self, category_name):
         """ Gets ElementId of Category by name
@@ -142,8 +227,14 @@ class _BiCategory(BaseObjectWrapper):
         Returns:
             ``DB.BuiltInCategory``: BuiltInCategory Enumeration Member
         """
-        enum = self.get(category_name)
-        return DB.ElementId(enum)
+        element_id = _bic_index.get_id(category_name)
+        if element_id is None:
+            raise RpwCoerceError(category_name, DB.BuiltInCategory)
+        return element_id
+
+    def __contains__(self, category_name):
+        """ ``True`` if ``category_name`` is a BuiltInCategory name """
+        return category_name in _bic_index
 
     def from_category_id(self, category_id):
         """
@@ -169,6 +260,9 @@ class _BiCategory(BaseObjectWrapper):
         return super(_BiCategory, self).__repr__(to_string='Autodesk.Revit.DB.BuiltInCategory')
 
 
+_bip_index = _EnumIndex(DB.BuiltInParameter)
+_bic_index = _EnumIndex(DB.BuiltInCategory, prefix='OST_')
+
 # Classes should already be instantiated
 BiParameter = _BiParameter()
 BiCategory = _BiCategory()
@@ -0,0 +1,410 @@
+"""
+Document Caches
+
+Caches are scoped by document and are cleared when an
+:any:`rpw.db.Transaction` or :any:`rpw.db.TransactionGroup` ends,
+whether it commits or rolls back.
+
+>>> from rpw.db.cache import collector_cache
+>>> collector_cache.enable()
+>>> rooms = db.Collector(of_category='Rooms')   # Runs query
+>>> rooms = db.Collector(of_category='Rooms')   # Uses cached ids
+
+Wrappers and element types can also be reused, see :any:`ElementCache`:
+
+>>> from rpw.db.cache import element_cache
+>>> element_cache.enable()
+>>> db.Element(wall) is db.Element(wall)
+True
+
+Changes made outside of rpw transactions, for example by other tools
+or by the user, can be tracked with the ``DocumentChanged`` event:
+
+>>> DocumentCache.watch()
+
+"""
+
+import weakref
+from collections import OrderedDict
+
+import rpw
+from rpw import revit, DB
+from rpw.base import BaseObject
+from rpw.utils.dotnet import List, Enum, Guid
+from rpw.utils.logger import logger
+
+
+class DocumentCache(BaseObject):
+    """
+    Base class of document scoped caches.
+
+    Every instance is registered, so :any:`invalidate` clears all
+    caches of a document at once.
+    Subclasses store values in ``self._cache``, keyed by tuples that
+    start with the document.
+    """
+
+    _caches = []          # All DocumentCache instances
+    _watched_app = None   # Application with DocumentChanged handler
+
+    def __init__(self):
+        self._cache = OrderedDict()
+        DocumentCache._caches.append(self)
+
+    def clear(self, doc=None):
+        """ Clears entries of ``doc``, or all entries if ``doc`` is ``None`` """
+        if doc is None:
+            self._cache.clear()
+            return
+        for key in [k for k in self._cache if k[0] == doc]:
+            self._remove(key)
+
+    def _remove(self, key):
+        del self._cache[key]
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __contains__(self, key):
+        return key in self._cache
+
+    @staticmethod
+    def invalidate(doc=None):
+        """ Clears all registered caches for ``doc``, or all documents """
+        logger.debug('Invalidating document caches: {}'.format(doc))
+        for cache in DocumentCache._caches:
+            cache.clear(doc)
+
+    @staticmethod
+    def watch(app=None):
+        """
+        Invalidates caches of a document when the ``DocumentChanged`` event
+        reports added, deleted or modified elements.
+
+        Args:
+            app (``Application``, optional): Revit Application. Default is ``revit.app``
+        """
+        app = app or revit.app
+        if DocumentCache._watched_app is not None:
+            return
+        app.DocumentChanged += DocumentCache._on_document_changed
+        DocumentCache._watched_app = app
+
+    @staticmethod
+    def unwatch():
+        """ Removes the ``DocumentChanged`` handler added by :any:`watch` """
+        app = DocumentCache._watched_app
+        if app is not None:
+            app.DocumentChanged -= DocumentCache._on_document_changed
+            DocumentCache._watched_app = None
+
+    @staticmethod
+    def _on_document_changed(sender, args):
+        if args.GetAddedElementIds().Count or \
+           args.GetDeletedElementIds().Count or \
+           args.GetModifiedElementIds().Count:
+            DocumentCache.invalidate(args.GetDocument())
+
+
+class CollectorCache(DocumentCache):
+    """
+    Element ids of :any:`Collector` queries, keyed by document and
+    normalized filter spec.
+
+    The cache is opt-in: use :any:`enable` to cache all collectors, or
+    ``Collector(cache=True)`` for a single query.
+    Entries are evicted least recently used first, when the total number
+    of cached ids goes over ``max_size``.
+
+    Elements and lists of elements are keyed by their ElementIds, and
+    :any:`ParameterFilter` by its parameter id and conditions.
+    Queries with ``where`` functions, or with values that cannot be
+    compared by value, like other wrappers or native filters, are not
+    cached.
+    """
+
+    def __init__(self, max_size=500000):
+        """
+        Args:
+            max_size (``int``): Max number of ElementIds in cache
+        """
+        super(CollectorCache, self).__init__()
+        self.max_size = max_size
+        self.enabled = False
+        self.size = 0
+
+    def enable(self, max_size=None):
+        """ Caches all Collector queries. """
+        self.enabled = True
+        if max_size is not None:
+            self.max_size = max_size
+
+    def disable(self):
+        """ Stops caching and clears the cache. """
+        self.enabled = False
+        self.clear()
+
+    def get_key(self, doc, filters):
+        """
+        Returns cache key for the filter spec, or ``None`` if the spec
+        cannot be cached.
+        """
+        try:
+            spec = tuple(sorted((k, _normalize(v)) for k, v in filters.items()))
+        except _NotCacheable:
+            return None
+        return (doc, spec)
+
+    def get(self, key):
+        """ Cached ``List[DB.ElementId]``, or ``None`` """
+        element_ids = self._cache.get(key)
+        if element_ids is not None:
+            # Move to end: most recently used
+            del self._cache[key]
+            self._cache[key] = element_ids
+        return element_ids
+
+    def set(self, key, element_ids):
+        element_ids = List[DB.ElementId](element_ids)
+        if element_ids.Count > self.max_size:
+            return
+        if key in self._cache:
+            self._remove(key)
+        self._cache[key] = element_ids
+        self.size += element_ids.Count
+        while self.size > self.max_size:
+            self._remove(next(iter(self._cache)))
+
+    def clear(self, doc=None):
+        super(CollectorCache, self).clear(doc)
+        if doc is None:
+            self.size = 0
+
+    def _remove(self, key):
+        self.size -= self._cache.pop(key).Count
+
+    def __repr__(self):
+        return super(CollectorCache, self).__repr__(data={'queries': len(self),
+                                                         'size': self.size})
+
+
+class LinkCache(DocumentCache):
+    """
+    Loaded Revit links of host documents: link instance ``ElementId``,
+    link ``DB.Document`` and total ``DB.Transform``.
+
+    Links of a document are read once, on first use, and kept until
+    a transaction ends in the host document, or the cache is
+    invalidated. Loading or moving links outside of rpw transactions
+    is only tracked with :any:`DocumentCache.watch`.
+
+    >>> from rpw.db.cache import link_cache
+    >>> for link_instance_id, link_doc, transform in link_cache.get_links(doc):
+    ...     print(link_doc.Title)
+    """
+
+    def get_links(self, doc):
+        """
+        Returns:
+            (``list``): ``(link_instance_id, link_doc, transform)`` tuple
+            of each loaded link of ``doc``
+        """
+        return list(self._get_links(doc).values())
+
+    def get_link(self, doc, link_instance_id):
+        """
+        Returns:
+            (``tuple``): ``(link_instance_id, link_doc, transform)``, or
+            ``None`` if the link is not loaded
+        """
+        return self._get_links(doc).get(link_instance_id.IntegerValue)
+
+    def get_link_document(self, doc, link_instance_id):
+        """ Link ``DB.Document`` of a link instance, or ``None`` if not loaded """
+        link = self.get_link(doc, link_instance_id)
+        return link[1] if link else None
+
+    def _get_links(self, doc):
+        key = (doc,)
+        links = self._cache.get(key)
+        if links is None:
+            links = OrderedDict()
+            collector = DB.FilteredElementCollector(doc).OfClass(DB.RevitLinkInstance)
+            for link_instance in collector:
+                link_doc = link_instance.GetLinkDocument()
+                if link_doc is None:
+                    # Link is not loaded
+                    continue
+                links[link_instance.Id.IntegerValue] = (link_instance.Id, link_doc,
+                                                        link_instance.GetTotalTransform())
+            self._cache[key] = links
+        return links
+
+
+class ParameterIdCache(DocumentCache):
+    """
+    ElementIds of Project and Shared parameter names, used to compile
+    :any:`P` predicates.
+
+    Names are read once per document, from its ``ParameterElement``, and
+    are kept until a transaction ends in the document. Display names of
+    built-in parameters, like ``'Width'``, are not resolved: the same name
+    can be a different ``BuiltInParameter`` in each category.
+
+    >>> from rpw.db.cache import parameter_id_cache
+    >>> parameter_id_cache.get_parameter_id(doc, 'Fire Rating')
+    <ElementId 354621>
+    """
+
+    def get_parameter_id(self, doc, name):
+        """
+        Returns:
+            (``DB.ElementId``): Id of the ``ParameterElement`` named
+            ``name``, or ``None`` if the document has none
+        """
+        return self._get_parameter_ids(doc).get(name)
+
+    def _get_parameter_ids(self, doc):
+        key = (doc,)
+        parameter_ids = self._cache.get(key)
+        if parameter_ids is None:
+            parameter_ids = {}
+            collector = DB.FilteredElementCollector(doc).OfClass(DB.ParameterElement)
+            for parameter_element in collector:
+                name = parameter_element.GetDefinition().Name
+                parameter_ids.setdefault(name, parameter_element.Id)
+            self._cache[key] = parameter_ids
+        return parameter_ids
+
+
+class ElementCache(DocumentCache):
+    """
+    Opt-in identity map and type cache of wrapped elements.
+
+    While enabled, :any:`Element` returns the same wrapper for the same
+    element, as long as the wrapper is still referenced: wrappers are
+    weakly referenced, so the map does not keep them alive.
+    Element types are kept per type id, so many instances of a few types
+    only fetch and wrap each type once:
+
+    >>> element_cache.enable()
+    >>> types = [db.Element(wall).type for wall in walls]
+
+    Both are cleared when a transaction ends in the document.
+    """
+
+    def __init__(self):
+        super(ElementCache, self).__init__()
+        self.enabled = False
+
+    def enable(self):
+        """ Reuses wrappers and element types """
+        self.enabled = True
+
+    def disable(self):
+        """ Stops reusing wrappers and clears the cache """
+        self.enabled = False
+        self.clear()
+
+    def get_wrapper(self, element):
+        """ Wrapper of an unwrapped ``DB.Element``, or ``None`` """
+        wrappers = self._cache.get((element.Document, 'wrappers'))
+        if wrappers is None:
+            return None
+        return wrappers.get(element.Id.IntegerValue)
+
+    def add_wrapper(self, wrapper):
+        """ Adds a wrapped element to the identity map """
+        element = wrapper.unwrap()
+        key = (element.Document, 'wrappers')
+        wrappers = self._cache.get(key)
+        if wrappers is None:
+            wrappers = self._cache[key] = weakref.WeakValueDictionary()
+        wrappers[element.Id.IntegerValue] = wrapper
+
+    def get_type(self, element, wrapped=True):
+        """
+        Element type of an unwrapped ``DB.Element``, using ``GetTypeId()``.
+        Wrapped types are cached if the cache is enabled.
+
+        Returns:
+            (``DB.ElementType``, :any:`Element`): Element type, wrapped
+            with :any:`Element` if ``wrapped``. ``None`` if element
+            has no type, or its type is not in the document
+        """
+        doc = element.Document
+        type_id = element.GetTypeId()
+        if type_id == DB.ElementId.InvalidElementId:
+            return None
+        if not self.enabled:
+            element_type = doc.GetElement(type_id)
+            if element_type is None or not wrapped:
+                return element_type
+            return rpw.db.Element(element_type)
+
+        key = (doc, 'type', type_id.IntegerValue)
+        wrapped_type = self._cache.get(key)
+        if wrapped_type is None:
+            element_type = doc.GetElement(type_id)
+            if element_type is None:
+                # Type id of a deleted type. Not cached
+                return None
+            wrapped_type = rpw.db.Element(element_type)
+            self._cache[key] = wrapped_type
+        return wrapped_type if wrapped else wrapped_type.unwrap()
+
+    def __repr__(self):
+        return super(ElementCache, self).__repr__(data={'enabled': self.enabled})
+
+
+class _NotCacheable(Exception):
+    pass
+
+
+def _normalize(value):
+    """ Hashable representation of a filter value """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, DB.ElementId):
+        return ('id', value.IntegerValue)
+    if hasattr(value, 'Id') and isinstance(value.Id, DB.ElementId):
+        return ('id', value.Id.IntegerValue)
+    if isinstance(value, type):
+        return ('type', value.__name__)
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(v) for v in value)
+    if hasattr(value, 'parameter_id') and hasattr(value, 'conditions'):
+        # ParameterFilter: native filters only compare by identity
+        return (type(value).__name__, _normalize(value.parameter_id),
+                tuple(sorted((k, _normalize(v)) for k, v in value.conditions.items())))
+    if hasattr(value, 'unwrap'):
+        # Other wrappers without Id
+        raise _NotCacheable
+    if isinstance(value, BaseObject):
+        # rpw objects like P, F, ParameterPredicate
+        return (type(value).__name__,
+                tuple(sorted((k, _normalize(v)) for k, v in vars(value).items())))
+    if callable(value):
+        # Function identity is not stable across calls
+        raise _NotCacheable
+    if isinstance(value, (Enum, Guid)):
+        # Enumeration members and Guids compare by value
+        return (type(value).__name__, value)
+    # Other objects, like native filters, compare by identity
+    raise _NotCacheable
+
+
+def get_empty_collector(doc):
+    """
+    Collector that never yields elements.
+    ``FilteredElementCollector`` cannot be scoped to an empty list of ids.
+    """
+    return DB.FilteredElementCollector(doc).WherePasses(
+                DB.LogicalAndFilter(DB.ElementIsElementTypeFilter(False),
+                                    DB.ElementIsElementTypeFilter(True)))
+
+
+collector_cache = CollectorCache()
+element_cache = ElementCache()
+link_cache = LinkCache()
+parameter_id_cache = ParameterIdCache()
@@ -33,12 +33,12 @@ class Category(BaseObjectWrapper):
             same category
 
         """
-        # There has to be a better way, but perhaps not: https://goo.gl/MqdzWg
-        unique_family_ids = set()
-        for symbol in self.get_symbols(wrapped=True):
-            unique_family_ids.add(symbol.family.Id)
+        # Families have no category filter: group symbols by family instead
         doc = doc or revit.doc
-        elements = [doc.GetElement(family_id) for family_id in unique_family_ids]
+        collector = rpw.db.Collector(of_category=self.builtin, is_type=True, doc=doc)
+        family_ids = collector.group_by('family').keys()
+        elements = [doc.GetElement(family_id) for family_id in family_ids
+                    if family_id != DB.ElementId.InvalidElementId]
         return [Element(e) for e in elements] if wrapped else elements
 
     @property
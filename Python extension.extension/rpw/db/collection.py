@@ -1,6 +1,7 @@
 """ API Related Sets and Collections """
 
 
+import binascii
 from collections import OrderedDict
 
 import rpw
@@ -9,6 +10,7 @@ from rpw.db.xyz import XYZ
 from rpw.db.element import Element
 from rpw.base import BaseObject
 from rpw.utils.coerce import to_elements, to_element_ids, to_element_id
+from rpw.utils.coerce import IdBuffer, get_id_value, ID_TYPECODE
 from rpw.utils.dotnet import List
 from rpw.utils.logger import deprecate_warning
 
@@ -16,7 +18,8 @@ from rpw.utils.logger import deprecate_warning
 class ElementSet(BaseObject):
     """
     Provides helpful methods for managing a set of unique of ``DB.ElementId``
-    Sets are unordered.
+    Sets keep insertion order, and are hashed by ElementId value, so
+    ``add``, ``pop``, ``in`` and item lookups do not scan the set.
 
     >>> element_set = ElementSet([element, element])
     >>> element_set = ElementSet()
@@ -25,6 +28,12 @@ class ElementSet(BaseObject):
     True
     >>> element_set.clear()
 
+    Sets can be combined with other sets or element references:
+
+    >>> walls_in_view = walls.intersection(Collector(view=view))
+    >>> walls_in_view = walls & Collector(view=view)
+    >>> walls.update(more_walls)
+
     NOTE:
         Similar to DB.ElementSet, doesnt wrap since there is no advantage
 
@@ -35,7 +44,8 @@ class ElementSet(BaseObject):
 
     def __init__(self, elements_or_ids=None, doc=revit.doc):
         self.doc = doc
-        self._element_id_set = []
+        self._element_id_set = OrderedDict()   # Id value: DB.ElementId
+        self._element_id_list = None           # Cached List[DB.ElementId]
         if elements_or_ids:
             self.add(elements_or_ids)
 
@@ -47,10 +57,54 @@ class ElementSet(BaseObject):
             element_reference (`DB.Element`, DB.Element_ids): Iterable Optional
 
         """
-        element_ids = to_element_ids(elements_or_ids)
-        for id_ in element_ids:
-            if id_ not in self._element_id_set:
-                self._element_id_set.append(id_)
+        ElementSet.update(self, elements_or_ids)
+
+    def update(self, elements_or_ids):
+        """ Adds elements or element_ids of a list or set, in place """
+        element_id_set = self._element_id_set
+        if isinstance(elements_or_ids, ElementSet):
+            element_ids = elements_or_ids._element_id_set.items()
+        else:
+            element_ids = ((get_id_value(id_), id_)
+                           for id_ in to_element_ids(elements_or_ids))
+        for key, id_ in element_ids:
+            if key not in element_id_set:
+                element_id_set[key] = id_
+                self._element_id_list = None
+
+    def union(self, elements_or_ids):
+        """ New :any:`ElementSet` with elements of both sets. Same as ``|`` """
+        element_set = self._copy()
+        ElementSet.update(element_set, elements_or_ids)
+        return element_set
+
+    def intersection(self, elements_or_ids):
+        """ New :any:`ElementSet` with elements in both sets. Same as ``&`` """
+        other_keys = self._get_keys(elements_or_ids)
+        return self._copy([(key, id_) for key, id_ in self._element_id_set.items()
+                           if key in other_keys])
+
+    def difference(self, elements_or_ids):
+        """ New :any:`ElementSet` with elements not in other set. Same as ``-`` """
+        other_keys = self._get_keys(elements_or_ids)
+        return self._copy([(key, id_) for key, id_ in self._element_id_set.items()
+                           if key not in other_keys])
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def _get_keys(self, elements_or_ids):
+        if isinstance(elements_or_ids, ElementSet):
+            return elements_or_ids._element_id_set
+        return set(get_id_value(id_) for id_ in to_element_ids(elements_or_ids))
+
+    def _copy(self, items=None):
+        """ New ElementSet with same document. Selections copy to ElementSet """
+        element_set = ElementSet(doc=self.doc)
+        element_set._element_id_set = OrderedDict(
+                        self._element_id_set if items is None else items)
+        return element_set
 
     def pop(self, element_reference, wrapped=True):
         """
@@ -64,21 +118,26 @@ class ElementSet(BaseObject):
 
         """
         element_id = to_element_id(element_reference)
-        element = self.__getitem__(element_id)
-        self._element_id_set.remove(element_id)
-        return element if wrapped else element.unwrap()
+        try:
+            del self._element_id_set[get_id_value(element_id)]
+        except KeyError:
+            raise KeyError(element_id)
+        self._element_id_list = None
+        element = self.doc.GetElement(element_id)
+        return Element(element) if wrapped else element
 
     def clear(self):
         """ Clears Set """
-        self._element_id_set = []
+        self._element_id_set = OrderedDict()
+        self._element_id_list = None
 
     @property
     def _elements(self):
-        return [self.doc.GetElement(e) for e in self._element_id_set]
+        return [self.doc.GetElement(e) for e in self._element_id_set.values()]
 
     @property
     def _wrapped_elements(self):
-        return Element.from_list(self._element_id_set)
+        return Element.from_list(list(self._element_id_set.values()), doc=self.doc)
 
     def get_elements(self, wrapped=True, as_list=False):
         """
@@ -128,13 +187,18 @@ class ElementSet(BaseObject):
                 for regular python list. Default is True
 
         Returns:
-            ElementIds (List, List[DB.ElementId]): List of ElementIds Objects
+            ElementIds (List, List[DB.ElementId]): List of ElementIds Objects.
+            The same ``List[DB.ElementId]`` is returned until the set
+            changes, so it should not be modified
 
         """
         if as_list:
-            return List[DB.ElementId](self._element_id_set)
+            if self._element_id_list is None:
+                self._element_id_list = List[DB.ElementId](
+                                                self._element_id_set.values())
+            return self._element_id_list
         else:
-            return list(self._element_id_set)
+            return list(self._element_id_set.values())
 
     @property
     def element_ids(self):
@@ -150,15 +214,15 @@ class ElementSet(BaseObject):
 
     def select(self):
         """ Selects Set in UI """
-        return rpw.ui.Selection(self._element_id_set)
+        return rpw.ui.Selection(list(self._element_id_set.values()))
 
     def __len__(self):
         return len(self._element_id_set)
 
     def __iter__(self):
         """ Iterator: Wrapped """
-        for element in self._element_id_set:
-            yield Element.from_id(element)
+        for element_id in self._element_id_set.values():
+            yield Element.from_id(element_id, doc=self.doc)
 
     def __getitem__(self, element_reference):
         """
@@ -171,10 +235,10 @@ class ElementSet(BaseObject):
             (wrapped_element): Wrapped Element. Raises Key Error if not found.
         """
         eid_key = to_element_id(element_reference)
-        for element in self.__iter__():
-            if element.Id == eid_key:
-                return element
-        raise KeyError(eid_key)
+        element_id = self._element_id_set.get(get_id_value(eid_key))
+        if element_id is None:
+            raise KeyError(eid_key)
+        return Element.from_id(element_id, doc=self.doc)
 
     def __contains__(self, element_or_id):
         """
@@ -186,13 +250,14 @@ class ElementSet(BaseObject):
         Returns:
             bool: ``True`` or ``False``
         """
-        # TODO Write Tests
         element_id = to_element_id(element_or_id)
-        return bool(element_id in self._element_id_set)
+        return get_id_value(element_id) in self._element_id_set
 
     def __bool__(self):
         return bool(self._element_id_set)
 
+    __nonzero__ = __bool__
+
     def __repr__(self, data=None):
         return super(ElementSet, self).__repr__(data={'count': len(self)})
 
@@ -201,31 +266,54 @@ class ElementCollection(BaseObject):
     """
     List Collection for managing a list of ``DB.Element``.
 
+    Elements are stored unwrapped, and wrapped one at a time when
+    accessed, so ``collection[k]`` only wraps element ``k``.
+    Positions are indexed by ElementId value for ``in`` and ``index()``.
+
     >>> element_set = ElementCollection([element, element])
     >>> element_set = ElementCollection()
     >>> element_set.add(SomeElement)
     >>> SomeElement in element_set
     True
+    >>> element_set[0]
+    <rpw:Element>
+    >>> element_set[10:20]
+    <rpw:ElementCollection | count:10>
     >>> element_set.clear()
 
     Args:
         (`DB.Element`, `DB.ElementID`, optional): Elements or Element Ids.
     """
-    def __init__(self, elements_or_ids=None, doc=revit.doc):
+    def __init__(self, elements_or_ids=None, doc=revit.doc, memoize=False):
+        """
+        Args:
+            elements_or_ids (optional): Elements or Element Ids
+            doc (``DB.Document``, optional): Document of Element Ids
+            memoize (``bool``, optional): Keeps wrapped elements, so each
+                element is wrapped once. Default is False
+        """
         self.doc = doc
+        self.memoize = memoize
         self._elements = []
+        self._positions = {}      # Id value: first position
+        self._wrappers = {}       # Id value: wrapped element, if memoize
         if elements_or_ids:
             self.append(elements_or_ids)
 
     def append(self, elements_or_ids):
         """ Adds elements or element_ids to set. Handles single or list """
-        elements = to_elements(elements_or_ids)
+        elements = to_elements(elements_or_ids, doc=self.doc)
+        positions = self._positions
         for element in elements:
+            if positions is not None and element is not None:
+                positions.setdefault(get_id_value(element.Id), len(self._elements))
             self._elements.append(element)
 
     def clear(self):
         """ Clears Set """
         self._elements = []
+        self._positions = {}
+        self._wrappers = {}
 
     def pop(self, index=0, wrapped=True):
         """
@@ -235,7 +323,27 @@ class ElementCollection(BaseObject):
             index (``int``): Index of Element [Default: 0]
         """
         element = self._elements.pop(index)
-        return Element(element) if wrapped else element
+        # Positions after index changed. Index is rebuilt when needed
+        self._positions = None
+        return self._wrap(element) if wrapped else element
+
+    def _get_positions(self):
+        if self._positions is None:
+            positions = {}
+            for position, element in enumerate(self._elements):
+                if element is not None:
+                    positions.setdefault(get_id_value(element.Id), position)
+            self._positions = positions
+        return self._positions
+
+    def _wrap(self, element):
+        if not self.memoize:
+            return Element(element)
+        key = get_id_value(element.Id)
+        wrapped_element = self._wrappers.get(key)
+        if wrapped_element is None:
+            wrapped_element = self._wrappers[key] = Element(element)
+        return wrapped_element
 
     @property
     def _element_ids(self):
@@ -243,7 +351,7 @@ class ElementCollection(BaseObject):
 
     @property
     def _wrapped_elements(self):
-        return Element.from_list(self._elements)
+        return [self._wrap(element) for element in self._elements]
 
     def get_elements(self, wrapped=True, as_list=False):
         """
@@ -330,22 +438,41 @@ class ElementCollection(BaseObject):
         except IndexError:
             return None
         else:
-            return Element(element) if wrapped else element
+            return self._wrap(element) if wrapped else element
+
+    def index(self, element_or_id):
+        """
+        Position of the first occurrence of an element.
+
+        Args:
+            Reference: Element, ElementId, or Integer
+
+        Returns:
+            (``int``): Position. Raises ``ValueError`` if not found
+        """
+        element_id = to_element_id(element_or_id)
+        position = self._get_positions().get(get_id_value(element_id))
+        if position is None:
+            raise ValueError('{} is not in collection'.format(element_id))
+        return position
 
     def __iter__(self):
-        """ Iterator: Wrapped """
-        for wrapped_element in self._wrapped_elements:
-            yield wrapped_element
+        """ Iterator: Wrapped, one element at a time """
+        for element in self._elements:
+            yield self._wrap(element)
 
     def __len__(self):
         return len(self._elements)
 
     def __getitem__(self, index):
-        """ Getter: Wrapped """
-        for n, wrapped_element in enumerate(self.__iter__()):
-            if n == index:
-                return wrapped_element
-        raise IndexError(index)
+        """
+        Getter: Wrapped. Slices return a new :any:`ElementCollection`
+        """
+        if isinstance(index, slice):
+            collection = ElementCollection(doc=self.doc, memoize=self.memoize)
+            collection.append(self._elements[index])
+            return collection
+        return self._wrap(self._elements[index])
 
     def __contains__(self, element_or_id):
         """
@@ -358,7 +485,7 @@ class ElementCollection(BaseObject):
             bool: ``True`` or ``False``
         """
         element_id = to_element_id(element_or_id)
-        return bool(element_id in self.get_element_ids(as_list=False))
+        return get_id_value(element_id) in self._get_positions()
 
     def __bool__(self):
         return bool(self._elements)
@@ -368,6 +495,246 @@ class ElementCollection(BaseObject):
                                                     data={'count': len(self)})
 
 
+class IdBitmap(BaseObject):
+    """
+    Compressed bitmap of ElementId values, for set algebra on very large
+    sets of ids.
+
+    Like a roaring bitmap, values are split in chunks of 65536 by their
+    high bits. Sparse chunks keep a ``set`` of the low bits, chunks with
+    more than ``DENSE_SIZE`` values keep an integer bit mask, so unions
+    and intersections of dense chunks are single integer operations.
+
+    >>> in_view = IdBitmap(Collector(view=view))
+    >>> walls = IdBitmap(Collector(of_category='Walls'))
+    >>> len(in_view & walls)
+    1520
+    >>> (walls - in_view).to_list()
+    List[DB.ElementId]
+
+    Accepts the same references as :any:`IdBuffer`, and other bitmaps.
+    """
+
+    CHUNK_BITS = 16
+    CHUNK_SIZE = 1 << CHUNK_BITS
+    LOW_MASK = CHUNK_SIZE - 1
+    DENSE_SIZE = 4096
+
+    def __init__(self, element_references=None):
+        """
+        Args:
+            element_references (``list``, optional): Element references,
+                :any:`IdBuffer`, ``List[DB.ElementId]`` or Collector
+        """
+        self._chunks = {}   # High bits: set of low bits, or bit mask
+        if element_references is not None:
+            self.update(element_references)
+
+    def add(self, element_reference):
+        """ Adds one element reference """
+        self.update([element_reference])
+
+    def update(self, element_references):
+        """ Adds element references. Handles single or list """
+        # Group low bits by chunk first, so each chunk is merged once
+        new_chunks = {}
+        for value in _get_id_values(element_references):
+            key = value >> self.CHUNK_BITS
+            lows = new_chunks.get(key)
+            if lows is None:
+                lows = new_chunks[key] = set()
+            lows.add(value & self.LOW_MASK)
+        chunks = self._chunks
+        for key, lows in new_chunks.items():
+            chunk = chunks.get(key)
+            if chunk is not None:
+                lows = _union(chunk, lows)
+            self._set_chunk(chunks, key, lows)
+
+    def discard(self, element_reference):
+        """ Removes an element reference, if present """
+        value = get_id_value(to_element_id(element_reference))
+        key = value >> self.CHUNK_BITS
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            return
+        low = value & self.LOW_MASK
+        if isinstance(chunk, set):
+            chunk.discard(low)
+            self._set_chunk(self._chunks, key, chunk)
+        else:
+            self._set_chunk(self._chunks, key, chunk & ~(1 << low))
+
+    def clear(self):
+        self._chunks = {}
+
+    def union(self, other):
+        """ Ids in this bitmap or ``other``. Same as ``|`` """
+        return self._combine(other, _union)
+
+    def intersection(self, other):
+        """ Ids in this bitmap and ``other``. Same as ``&`` """
+        return self._combine(other, _intersection)
+
+    def difference(self, other):
+        """ Ids in this bitmap but not in ``other``. Same as ``-`` """
+        return self._combine(other, _difference)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def _combine(self, other, operation):
+        if not isinstance(other, IdBitmap):
+            other = IdBitmap(other)
+        chunks = {}
+        if operation is _union:
+            keys = set(self._chunks).union(other._chunks)
+        else:
+            keys = self._chunks
+        for key in keys:
+            chunk = self._chunks.get(key)
+            other_chunk = other._chunks.get(key)
+            if other_chunk is None:
+                if operation is not _intersection:
+                    self._set_chunk(chunks, key, _copy(chunk))
+                continue
+            if chunk is None:
+                self._set_chunk(chunks, key, _copy(other_chunk))
+                continue
+            self._set_chunk(chunks, key, operation(chunk, other_chunk))
+        bitmap = IdBitmap()
+        bitmap._chunks = chunks
+        return bitmap
+
+    def _set_chunk(self, chunks, key, chunk):
+        """ Stores chunk as set or bit mask, depending on its size """
+        if isinstance(chunk, set):
+            if len(chunk) > self.DENSE_SIZE:
+                chunk = _mask_from_lows(chunk, self.CHUNK_SIZE)
+        elif _count_bits(chunk) <= self.DENSE_SIZE:
+            chunk = set(_lows_from_mask(chunk))
+        if chunk:
+            chunks[key] = chunk
+        else:
+            chunks.pop(key, None)
+
+    def iter_values(self):
+        """ Iterates ElementId values in ascending order """
+        for key in sorted(self._chunks):
+            chunk = self._chunks[key]
+            base = key << self.CHUNK_BITS
+            lows = sorted(chunk) if isinstance(chunk, set) else _lows_from_mask(chunk)
+            for low in lows:
+                yield base + low
+
+    def to_buffer(self):
+        """ :any:`IdBuffer` of the bitmap ids, in ascending order """
+        return IdBuffer.from_values(self.iter_values())
+
+    def to_list(self):
+        """ ``List[DB.ElementId]`` of the bitmap ids, in ascending order """
+        return self.to_buffer().to_list()
+
+    def __iter__(self):
+        """ Iterates ``DB.ElementId`` """
+        return iter(self.to_list())
+
+    def __contains__(self, element_reference):
+        value = get_id_value(to_element_id(element_reference))
+        chunk = self._chunks.get(value >> self.CHUNK_BITS)
+        if chunk is None:
+            return False
+        low = value & self.LOW_MASK
+        if isinstance(chunk, set):
+            return low in chunk
+        return bool(chunk >> low & 1)
+
+    def __len__(self):
+        """ Number of ids """
+        return sum(len(chunk) if isinstance(chunk, set) else _count_bits(chunk)
+                   for chunk in self._chunks.values())
+
+    def __bool__(self):
+        return bool(self._chunks)
+
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        return super(IdBitmap, self).__repr__(data={'count': len(self)})
+
+
+def _get_id_values(element_references):
+    """ ElementId values of references, as integers """
+    if isinstance(element_references, IdBitmap):
+        return element_references.iter_values()
+    if not isinstance(element_references, IdBuffer):
+        element_references = IdBuffer(element_references)
+    if ID_TYPECODE == 'd':
+        return (int(value) for value in element_references.values)
+    return element_references.values
+
+
+def _union(chunk, other_chunk):
+    if isinstance(chunk, set) and isinstance(other_chunk, set):
+        return chunk | other_chunk
+    return _to_mask(chunk) | _to_mask(other_chunk)
+
+
+def _intersection(chunk, other_chunk):
+    if isinstance(chunk, set) and isinstance(other_chunk, set):
+        return chunk & other_chunk
+    return _to_mask(chunk) & _to_mask(other_chunk)
+
+
+def _difference(chunk, other_chunk):
+    if isinstance(chunk, set) and isinstance(other_chunk, set):
+        return chunk - other_chunk
+    return _to_mask(chunk) & ~_to_mask(other_chunk)
+
+
+def _copy(chunk):
+    return set(chunk) if isinstance(chunk, set) else chunk
+
+
+def _to_mask(chunk):
+    if isinstance(chunk, set):
+        return _mask_from_lows(chunk, IdBitmap.CHUNK_SIZE)
+    return chunk
+
+
+def _mask_from_lows(lows, size):
+    """ Integer bit mask with bits ``lows`` set """
+    bits = bytearray(size // 8)
+    for low in lows:
+        bits[low >> 3] |= 1 << (low & 7)
+    bits.reverse()
+    return int(binascii.hexlify(bytes(bits)), 16)
+
+
+def _lows_from_mask(mask):
+    """ Sorted list of the bits set in an integer bit mask """
+    if not mask:
+        return []
+    hex_mask = '%x' % mask
+    if len(hex_mask) % 2:
+        hex_mask = '0' + hex_mask
+    bits = bytearray(binascii.unhexlify(hex_mask))
+    bits.reverse()
+    lows = []
+    for index, byte in enumerate(bits):
+        if byte:
+            base = index << 3
+            for bit in range(8):
+                if byte >> bit & 1:
+                    lows.append(base + bit)
+    return lows
+
+
+def _count_bits(mask):
+    return bin(mask).count('1')
+
+
 class XyzCollection(BaseObject):
     """
     Provides helpful methods for managing a
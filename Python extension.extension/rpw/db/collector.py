@@ -11,6 +11,16 @@ Note:
 
     | ``ElementCategoryFilter`` = ``of_category``
     | ``ElementClassFilter`` = ``of_class``
+    | ``ElementMulticategoryFilter`` = ``of_categories``
+    | ``ElementMulticlassFilter`` = ``of_classes``
+    | ``ElementWorksetFilter`` = ``workset``
+    | ``ElementDesignOptionFilter`` = ``design_option``
+    | ``ElementStructuralTypeFilter`` = ``structural_type``
+    | ``BoundingBoxIntersectsFilter`` = ``bbox_intersects``
+    | ``BoundingBoxIsInsideFilter`` = ``bbox_inside``
+    | ``BoundingBoxContainsPointFilter`` = ``bbox_contains_point``
+    | ``ElementIntersectsElementFilter`` = ``intersects_element``
+    | ``ElementIntersectsSolidFilter`` = ``intersects_solid``
     | ``ElementIsCurveDrivenFilter`` = ``is_curve_driven``
     | ``ElementIsElementTypeFilter`` = ``is_type`` + ``is_not_type``
     | ``ElementOwnerViewFilter`` = ``view``
@@ -21,21 +31,31 @@ Note:
     | ``ElementParameterFilter`` = ``parameter_filter``
     | ``Exclusion`` = ``exclude``
     | ``UnionWith`` = ``or_collector``
+    | ``LogicalAndFilter`` + ``LogicalOrFilter`` = ``filter`` + :any:`F`
     | ``IntersectWith`` = ``and_collector``
     | ``Custom`` = where
+    | ``ElementParameterFilter`` = where + :any:`P` predicates
 
 """
 
+import operator
+from collections import OrderedDict
+
 from rpw import revit, DB
-from rpw.utils.dotnet import List
+from rpw.utils.dotnet import List, Enum, Type, Stopwatch, Guid, clr
 from rpw.base import BaseObjectWrapper, BaseObject
 from rpw.exceptions import RpwException, RpwTypeError, RpwCoerceError
 from rpw.db.element import Element
+from rpw.db.parameter import Parameter, ParameterReader, read_value
+from rpw.db.parameter import get_storage_getter
 from rpw.db.builtins import BicEnum, BipEnum
 from rpw.ui.selection import Selection
 from rpw.db.collection import ElementSet
-from rpw.utils.coerce import to_element_id, to_element_ids
-from rpw.utils.coerce import to_category, to_class
+from rpw.db.cache import collector_cache, link_cache, parameter_id_cache
+from rpw.db.cache import get_empty_collector
+from rpw.utils.coerce import to_element_id, to_element_ids, to_element
+from rpw.utils.coerce import to_xyz, to_outline
+from rpw.utils.coerce import to_category, to_category_id, to_class, to_iterable
 from rpw.utils.logger import logger
 from rpw.utils.logger import deprecate_warning
 
@@ -47,6 +67,29 @@ class BaseFilter(BaseObject):
     """ Base Filter and Apply Logic """
 
     method = 'WherePasses'
+    cost = 1              # Relative cost inside its priority_group
+    requires_doc = False  # process_value() receives the collector doc
+    uses_tolerance = False  # value is packed with Collector tolerance=
+    invertible = False    # process_value() accepts inverted=True
+
+    @classmethod
+    def get_priority(cls, value):
+        """
+        Priority group of this filter with ``value``. Used by :any:`QueryPlan`
+        before :any:`get_cost`. Defaults to ``priority_group``.
+        """
+        return cls.priority_group
+
+    @classmethod
+    def get_cost(cls, value):
+        """
+        Estimated cost of applying this filter with ``value``.
+        Used by :any:`QueryPlan` to order filters that share the same
+        ``priority_group``: lower cost runs first. Filters can override this
+        when the cost depends on the input, for example the number of
+        elements being excluded.
+        """
+        return cls.cost
 
     @classmethod
     def process_value(cls, value):
@@ -63,6 +106,26 @@ class BaseFilter(BaseObject):
         """
         raise NotImplemented
 
+    @classmethod
+    def build(cls, value, doc, inverted=False):
+        """
+        Returns the native filter for ``value``.
+        Passes ``doc`` to ``process_value()`` if the filter ``requires_doc``.
+
+        Raises:
+            :class:`RpwException`: If ``inverted`` and filter is not ``invertible``
+        """
+        options = {}
+        if inverted:
+            if not cls.invertible:
+                raise RpwException('Filter cannot be inverted: {}'.format(cls.keyword))
+            options['inverted'] = True
+
+        if cls.requires_doc:
+            return cls.process_value(value, doc, **options)
+        else:
+            return cls.process_value(value, **options)
+
     @classmethod
     def apply(cls, doc, collector, value):
         """
@@ -72,14 +135,7 @@ class BaseFilter(BaseObject):
         """
         method_name = cls.method
         method = getattr(collector, method_name)
-
-        # FamilyInstanceFilter is the only Filter that  requires Doc
-        if cls is not FilterClasses.FamilyInstanceFilter:
-            value = cls.process_value(value)
-        else:
-            value = cls.process_value(value, doc)
-
-        return method(value)
+        return method(cls.build(value, doc))
 
 
 class SuperQuickFilter(BaseFilter):
@@ -122,14 +178,14 @@ class FilterClasses():
         X Revit.DB.ExclusionFilter = exclude
         X Revit.DB.IntersectWidth = and_collector
         X Revit.DB.UnionWidth = or_collector
-        _ Revit.DB.BoundingBoxContainsPointFilter
-        _ Revit.DB.BoundingBoxIntersectsFilter
-        _ Revit.DB.BoundingBoxIsInsideFilter
-        _ Revit.DB.ElementDesignOptionFilter
-        _ Revit.DB.ElementMulticategoryFilter
-        _ Revit.DB.ElementMulticlassFilter
-        _ Revit.DB.ElementStructuralTypeFilter
-        _ Revit.DB.ElementWorksetFilter
+        X Revit.DB.BoundingBoxContainsPointFilter = bbox_contains_point
+        X Revit.DB.BoundingBoxIntersectsFilter = bbox_intersects
+        X Revit.DB.BoundingBoxIsInsideFilter = bbox_inside
+        X Revit.DB.ElementDesignOptionFilter = design_option
+        X Revit.DB.ElementMulticategoryFilter = of_categories
+        X Revit.DB.ElementMulticlassFilter = of_classes
+        X Revit.DB.ElementStructuralTypeFilter = structural_type
+        X Revit.DB.ElementWorksetFilter = workset
         _ Revit.DB.ExtensibleStorage ExtensibleStorageFilter
     Slow
         X Revit.DB.ElementLevelFilter
@@ -140,7 +196,8 @@ class FilterClasses():
         _ Revit.DB.AreaFilter
         _ Revit.DB.AreaTagFilter
         _ Revit.DB.CurveElementFilter
-        _ Revit.DB.ElementIntersectsFilter
+        X Revit.DB.ElementIntersectsElementFilter = intersects_element
+        X Revit.DB.ElementIntersectsSolidFilter = intersects_solid
         _ Revit.DB.ElementPhaseStatusFilter
         _ Revit.DB.Mechanical SpaceFilter
         _ Revit.DB.Mechanical SpaceTagFilter
@@ -152,13 +209,17 @@ class FilterClasses():
         _ Autodesk.Revit.UI.Selection SelectableInViewFilter
 
     Logical
-        _ Revit.DB.LogicalAndFilter = and_filter
-        _ Revit.DB.LogicalOrFilter = or_filter
+        X Revit.DB.LogicalAndFilter = filter=F(...) & F(...)
+        X Revit.DB.LogicalOrFilter = filter=F(...) | F(...)
 
     Others
         X Custom where - uses lambda
 
     """
+
+    _sorted_filters = None      # Memoized by get_sorted()
+    _keyword_map = None         # Memoized by get_by_keyword()
+
     @classmethod
     def get_available_filters(cls):
         """ Discover all Defined Filter Classes """
@@ -171,41 +232,93 @@ class FilterClasses():
     @classmethod
     def get_sorted(cls):
         """ Returns Defined Filter Classes sorted by priority """
-        return sorted(FilterClasses.get_available_filters(),
-                      key=lambda f: f.priority_group)
+        if FilterClasses._sorted_filters is None:
+            FilterClasses._sorted_filters = sorted(
+                                    FilterClasses.get_available_filters(),
+                                    key=lambda f: (f.priority_group, f.cost))
+        return FilterClasses._sorted_filters
+
+    @classmethod
+    def get_by_keyword(cls, keyword):
+        """
+        Returns the Filter Class registered for a Collector keyword.
+
+        Raises:
+            :class:`RpwException`: If keyword is not a valid filter
+        """
+        if FilterClasses._keyword_map is None:
+            FilterClasses._keyword_map = dict((f.keyword, f) for f in
+                                              FilterClasses.get_sorted())
+        try:
+            return FilterClasses._keyword_map[keyword]
+        except KeyError:
+            raise RpwException('Filter not valid: {}'.format(keyword))
 
     class ClassFilter(SuperQuickFilter):
         keyword = 'of_class'
+        cost = 1
+        invertible = True
 
         @classmethod
-        def process_value(cls, class_reference):
+        def process_value(cls, class_reference, inverted=False):
             class_ = to_class(class_reference)
-            return DB.ElementClassFilter(class_)
+            return DB.ElementClassFilter(class_, inverted)
 
     class CategoryFilter(SuperQuickFilter):
         keyword = 'of_category'
+        cost = 0
+        invertible = True
 
         @classmethod
-        def process_value(cls, category_reference):
+        def process_value(cls, category_reference, inverted=False):
             category = to_category(category_reference)
-            return DB.ElementCategoryFilter(category)
+            return DB.ElementCategoryFilter(category, inverted)
+
+    class MultiCategoryFilter(SuperQuickFilter):
+        keyword = 'of_categories'
+        cost = 1
+        invertible = True
+
+        @classmethod
+        def process_value(cls, category_references, inverted=False):
+            category_ids = []
+            for category_reference in to_iterable(category_references):
+                if isinstance(category_reference, DB.Category):
+                    category_ids.append(category_reference.Id)
+                else:
+                    category_ids.append(to_category_id(category_reference))
+            return DB.ElementMulticategoryFilter(List[DB.ElementId](category_ids),
+                                                 inverted)
+
+    class MultiClassFilter(SuperQuickFilter):
+        keyword = 'of_classes'
+        cost = 2
+        invertible = True
+
+        @classmethod
+        def process_value(cls, class_references, inverted=False):
+            types = [clr.GetClrType(to_class(class_reference))
+                     for class_reference in to_iterable(class_references)]
+            return DB.ElementMulticlassFilter(List[Type](types), inverted)
 
     class IsTypeFilter(QuickFilter):
         keyword = 'is_type'
+        invertible = True
 
         @classmethod
-        def process_value(cls, bool_value):
-            return DB.ElementIsElementTypeFilter(not(bool_value))
+        def process_value(cls, bool_value, inverted=False):
+            return DB.ElementIsElementTypeFilter(not(bool_value) != inverted)
 
     class IsNotTypeFilter(IsTypeFilter):
         keyword = 'is_not_type'
 
         @classmethod
-        def process_value(cls, bool_value):
-            return DB.ElementIsElementTypeFilter(bool_value)
+        def process_value(cls, bool_value, inverted=False):
+            return DB.ElementIsElementTypeFilter(bool(bool_value) != inverted)
 
     class FamilySymbolFilter(QuickFilter):
         keyword = 'family'
+        cost = 0
 
         @classmethod
         def process_value(cls, family_reference):
@@ -214,33 +327,149 @@ class FilterClasses():
 
     class ViewOwnerFilter(QuickFilter):
         keyword = 'owner_view'
+        cost = 2
         reverse = False
+        invertible = True
 
         @classmethod
-        def process_value(cls, view_reference):
+        def process_value(cls, view_reference, inverted=False):
             if view_reference is not None:
                 view_id = to_element_id(view_reference)
             else:
                 view_id = DB.ElementId.InvalidElementId
-            return DB.ElementOwnerViewFilter(view_id, cls.reverse)
+            return DB.ElementOwnerViewFilter(view_id, cls.reverse != inverted)
 
     class ViewIndependentFilter(QuickFilter):
         keyword = 'is_view_independent'
+        cost = 2
+        invertible = True
 
         @classmethod
-        def process_value(cls, bool_value):
+        def process_value(cls, bool_value, inverted=False):
             view_id = DB.ElementId.InvalidElementId
-            return DB.ElementOwnerViewFilter(view_id, not(bool_value))
+            return DB.ElementOwnerViewFilter(view_id, not(bool_value) != inverted)
 
     class CurveDrivenFilter(QuickFilter):
         keyword = 'is_curve_driven'
+        cost = 2
+        invertible = True
+
+        @classmethod
+        def process_value(cls, bool_value, inverted=False):
+            return DB.ElementIsCurveDrivenFilter(not(bool_value) != inverted)
+
+    class WorksetFilter(QuickFilter):
+        keyword = 'workset'
+        cost = 1
+        requires_doc = True
+        invertible = True
 
         @classmethod
-        def process_value(cls, bool_value):
-            return DB.ElementIsCurveDrivenFilter(not(bool_value))
+        def process_value(cls, workset_reference, doc, inverted=False):
+            """ Process workset= input to allow for workset name or id """
+            if isinstance(workset_reference, str):
+                worksets = DB.FilteredWorksetCollector(doc)\
+                             .OfKind(DB.WorksetKind.UserWorkset)
+                for workset in worksets:
+                    if workset.Name == workset_reference:
+                        workset_id = workset.Id
+                        break
+                else:
+                    raise RpwCoerceError(workset_reference, DB.Workset)
+            elif isinstance(workset_reference, DB.WorksetId):
+                workset_id = workset_reference
+            elif isinstance(workset_reference, int):
+                workset_id = DB.WorksetId(workset_reference)
+            elif isinstance(workset_reference, DB.Workset):
+                workset_id = workset_reference.Id
+            else:
+                raise RpwTypeError('Workset, WorksetId, Workset Name',
+                                   type(workset_reference))
+            return DB.ElementWorksetFilter(workset_id, inverted)
+
+    class DesignOptionFilter(QuickFilter):
+        keyword = 'design_option'
+        cost = 1
+        requires_doc = True
+        invertible = True
+
+        @classmethod
+        def process_value(cls, design_option_reference, doc, inverted=False):
+            """
+            Process design_option= input to allow for design option name.
+            ``None`` collects elements of the main model.
+            """
+            if design_option_reference is None:
+                design_option_id = DB.ElementId.InvalidElementId
+            elif isinstance(design_option_reference, str):
+                design_options = DB.FilteredElementCollector(doc)\
+                                   .OfClass(DB.DesignOption)
+                for design_option in design_options:
+                    if design_option.Name == design_option_reference:
+                        design_option_id = design_option.Id
+                        break
+                else:
+                    raise RpwCoerceError(design_option_reference, DB.DesignOption)
+            else:
+                design_option_id = to_element_id(design_option_reference)
+            return DB.ElementDesignOptionFilter(design_option_id, inverted)
+
+    class StructuralTypeFilter(QuickFilter):
+        keyword = 'structural_type'
+        cost = 2
+        invertible = True
+
+        @classmethod
+        def process_value(cls, structural_type, inverted=False):
+            if isinstance(structural_type, str):
+                try:
+                    structural_type = getattr(DB.Structure.StructuralType,
+                                              structural_type)
+                except AttributeError:
+                    raise RpwCoerceError(structural_type,
+                                         DB.Structure.StructuralType)
+            return DB.ElementStructuralTypeFilter(structural_type, inverted)
+
+    class BoundingBoxIntersectsFilter(QuickFilter):
+        keyword = 'bbox_intersects'
+        cost = 2
+        uses_tolerance = True
+        invertible = True
+
+        @classmethod
+        def process_value(cls, value, inverted=False):
+            outline_reference, tolerance = value
+            return DB.BoundingBoxIntersectsFilter(to_outline(outline_reference),
+                                                  tolerance, inverted)
+
+    class BoundingBoxInsideFilter(QuickFilter):
+        keyword = 'bbox_inside'
+        cost = 2
+        uses_tolerance = True
+        invertible = True
+
+        @classmethod
+        def process_value(cls, value, inverted=False):
+            outline_reference, tolerance = value
+            return DB.BoundingBoxIsInsideFilter(to_outline(outline_reference),
+                                                tolerance, inverted)
+
+    class BoundingBoxContainsPointFilter(QuickFilter):
+        keyword = 'bbox_contains_point'
+        cost = 2
+        uses_tolerance = True
+        invertible = True
+
+        @classmethod
+        def process_value(cls, value, inverted=False):
+            point_reference, tolerance = value
+            return DB.BoundingBoxContainsPointFilter(to_xyz(point_reference),
+                                                     tolerance, inverted)
 
     class FamilyInstanceFilter(SlowFilter):
         keyword = 'symbol'
+        cost = 0
+        requires_doc = True
 
         @classmethod
         def process_value(cls, symbol_reference, doc):
@@ -249,37 +478,77 @@ class FilterClasses():
 
     class LevelFilter(SlowFilter):
         keyword = 'level'
+        cost = 1
+        requires_doc = True
         reverse = False
+        invertible = True
 
         @classmethod
-        def process_value(cls, level_reference):
+        def process_value(cls, level_reference, doc, inverted=False):
             """ Process level= input to allow for level name """
             if isinstance(level_reference, str):
-                level = Collector(of_class='Level', is_type=False,
-                                  where=lambda x:
-                                  x.Name == level_reference)
-                try:
-                    level_id = level[0].Id
-                except IndexError:
-                    RpwCoerceError(level_reference, DB.Level)
+                # Compare raw names: Level lookup should not wrap elements
+                levels = DB.FilteredElementCollector(doc).OfClass(DB.Level)
+                for level in levels:
+                    if level.Name == level_reference:
+                        level_id = level.Id
+                        break
+                else:
+                    raise RpwCoerceError(level_reference, DB.Level)
             else:
                 level_id = to_element_id(level_reference)
-            return DB.ElementLevelFilter(level_id, cls.reverse)
+            return DB.ElementLevelFilter(level_id, cls.reverse != inverted)
 
     class NotLevelFilter(LevelFilter):
         keyword = 'not_level'
+        cost = 2
         reverse = True
 
     class ParameterFilter(SlowFilter):
         keyword = 'parameter_filter'
+        cost = 3
+        requires_doc = True
+        invertible = True
 
         @classmethod
-        def process_value(cls, parameter_filter):
+        def process_value(cls, parameter_filter, doc, inverted=False):
             if isinstance(parameter_filter, ParameterFilter):
-                return parameter_filter.unwrap()
-            else:
+                return parameter_filter.get_filter(inverted)
+            elif isinstance(parameter_filter, ParameterPredicate):
+                rule = parameter_filter.get_rule(doc)
+                if rule is None:
+                    raise RpwException('Predicate cannot be compiled: {}'.format(
+                                                            parameter_filter))
+                parameter_filter = DB.ElementParameterFilter(rule)
+            elif not isinstance(parameter_filter, DB.ElementParameterFilter):
+                # ElementParameterFilter is compiled from where= by QueryPlan
                 raise Exception('Shouldnt get here')
 
+            if inverted:
+                return DB.ElementParameterFilter(parameter_filter.GetRules(),
+                                                 not parameter_filter.Inverted)
+            return parameter_filter
+
+    class IntersectsElementFilter(SlowFilter):
+        keyword = 'intersects_element'
+        cost = 4
+        requires_doc = True
+        invertible = True
+
+        @classmethod
+        def process_value(cls, element_reference, doc, inverted=False):
+            element = to_element(element_reference, doc=doc)
+            return DB.ElementIntersectsElementFilter(element, inverted)
+
+    class IntersectsSolidFilter(SlowFilter):
+        keyword = 'intersects_solid'
+        cost = 4
+        invertible = True
+
+        @classmethod
+        def process_value(cls, solid, inverted=False):
+            return DB.ElementIntersectsSolidFilter(solid, inverted)
+
     class WhereFilter(SuperSlowFilter):
         """
         Requires Unpacking of each Element. As per the API design,
@@ -290,16 +559,34 @@ class FilterClasses():
 
         >>> Collector(of_class='FamilyInstance', where=lambda x: 'Desk' in x.name)
         >>> Collector(of_class='Wall', where=lambda x: 'Desk' in x.parameters['Length'] > 5.0)
+
+        A list of functions can be used. :any:`QueryPlan` folds them into
+        a single pass, so each element is only wrapped once:
+
+        >>> Collector(of_class='Wall', where=[is_exterior, is_tall])
+
+        :any:`P` predicates are compiled into an ``ElementParameterFilter``
+        by :any:`QueryPlan`. Predicates that could not be compiled run here,
+        on unwrapped elements.
         """
         keyword = 'where'
 
+        @staticmethod
+        def wraps_elements(funcs):
+            """ True if elements are wrapped with :any:`Element` for ``funcs`` """
+            return not all(isinstance(f, ParameterPredicate) for f in to_iterable(funcs))
+
         @classmethod
-        def apply(cls, doc, collector, func):
+        def apply(cls, doc, collector, funcs):
+            funcs = to_iterable(funcs)
+            wrap = cls.wraps_elements(funcs)
             excluded_elements = set()
             for element in collector:
-                wrapped_element = Element(element)
-                if not func(wrapped_element):
-                    excluded_elements.add(element.Id)
+                test_element = Element(element) if wrap else element
+                for func in funcs:
+                    if not func(test_element):
+                        excluded_elements.add(element.Id)
+                        break
             excluded_elements = List[DB.ElementId](excluded_elements)
             if excluded_elements:
                 return collector.Excluding(excluded_elements)
@@ -308,11 +595,41 @@ class FilterClasses():
 
     class ExclusionFilter(QuickFilter):
         keyword = 'exclude'
+        cost = 3
 
         @classmethod
         def process_value(cls, element_references):
             element_set = ElementSet(element_references)
-            return DB.ExclusionFilter(element_set.as_element_id_list)
+            return DB.ExclusionFilter(element_set.get_element_ids(as_list=True))
+
+    class ComposedFilter(SlowFilter):
+        """
+        Native filter tree built with :any:`F`. Runs with the quick
+        filters when all filters in the tree are quick.
+
+        >>> Collector(filter=F.category('Walls') | F.category('Floors'))
+        """
+        keyword = 'filter'
+        requires_doc = True
+        uses_tolerance = True
+        invertible = True
+
+        @classmethod
+        def get_priority(cls, value):
+            filter_, _ = value
+            return filter_.priority_group
+
+        @classmethod
+        def get_cost(cls, value):
+            filter_, _ = value
+            return filter_.cost
+
+        @classmethod
+        def process_value(cls, value, doc, inverted=False):
+            filter_, tolerance = value
+            if inverted:
+                filter_ = ~filter_
+            return filter_.build(doc, tolerance=tolerance)
 
     class InteresectFilter(LogicalFilter):
         keyword = 'and_collector'
@@ -337,6 +654,369 @@ class FilterClasses():
             return collector.UnionWith(new_collector)
 
 
+class QueryPlan(BaseObject):
+    """
+    Ordered list of filter stages built from the Collector keyword arguments.
+
+    The plan is built once, when the :any:`Collector` is created, and is
+    only executed when the collector is first iterated or counted.
+    Stages are ordered by ``priority_group`` first and by the estimated
+    cost of each filter second, so the most selective quick filters
+    run before slow filters.
+    All ``where`` functions are folded into a single stage which runs
+    after every native filter, so each remaining element is only
+    wrapped once.
+    When a ``doc`` is given, :any:`P` predicates are compiled into a
+    single ``ElementParameterFilter`` stage, and only the predicates
+    that cannot be compiled are left in the ``where`` stage.
+
+    >>> plan = QueryPlan({'level': 'Level 1', 'of_class': 'Wall'})
+    >>> plan.keywords
+    ['of_class', 'level']
+    >>> plan = QueryPlan({'of_class': 'Wall', 'where': P('Mark') == 'A'}, doc)
+    >>> plan.keywords
+    ['of_class', 'parameter_filter']
+
+    Attributes:
+        stages (``list``): List of ``(filter_class, value)`` tuples
+                           in execution order.
+    """
+
+    def __init__(self, filters, doc=None, tolerance=0.0):
+        """
+        Args:
+            filters (``dict``): Collector filter keywords and values
+            doc (``DB.Document``, optional): Document used to compile
+                :any:`P` predicates. Predicates are not compiled if ``None``
+            tolerance (``float``, optional): Tolerance of spatial filters, in feet
+
+        Raises:
+            :class:`RpwException`: If a filter keyword is not valid
+        """
+        stages = []
+        where_functions = []
+        for keyword, value in filters.items():
+            filter_class = FilterClasses.get_by_keyword(keyword)
+            if filter_class is FilterClasses.WhereFilter:
+                where_functions.extend(to_iterable(value))
+            elif filter_class.uses_tolerance:
+                stages.append((filter_class, (value, tolerance)))
+            else:
+                stages.append((filter_class, value))
+
+        if doc is not None:
+            where_functions, rules = self.compile_predicates(where_functions, doc)
+            if rules:
+                parameter_filter = DB.ElementParameterFilter(
+                                                    List[DB.FilterRule](rules))
+                stages.append((FilterClasses.ParameterFilter, parameter_filter))
+
+        if where_functions:
+            stages.append((FilterClasses.WhereFilter, where_functions))
+
+        def sort_key(stage):
+            filter_class, value = stage
+            return (filter_class.get_priority(value), filter_class.get_cost(value))
+
+        self.stages = sorted(stages, key=sort_key)
+
+    @staticmethod
+    def compile_predicates(where_functions, doc):
+        """
+        Splits ``where`` functions into the ones that must run in Python and
+        the ``DB.FilterRule`` compiled from :any:`ParameterPredicate` objects.
+
+        Returns:
+            (``tuple``): ``(functions, rules)``
+        """
+        functions, rules = [], []
+        for func in where_functions:
+            rule = None
+            if isinstance(func, ParameterPredicate):
+                rule = func.get_rule(doc)
+            if rule is None:
+                functions.append(func)
+            else:
+                rules.append(rule)
+        return functions, rules
+
+    @property
+    def keywords(self):
+        """ Filter keywords in execution order """
+        return [filter_class.keyword for filter_class, _ in self.stages]
+
+    def execute(self, doc, collector):
+        """
+        Applies all stages to a collector.
+
+        Args:
+            doc (`DB.Document`): Document of the collector
+            collector (`FilteredElementCollector`): Unfiltered collector
+
+        Returns:
+            collector (`FilteredElementCollector`): Filtered collector
+        """
+        for filter_class, filter_value in self.stages:
+            logger.debug('Applying Filter: {}:{}'.format(filter_class, filter_value))
+            collector = filter_class.apply(doc, collector, filter_value)
+        return collector
+
+    def explain(self, doc, scope=None):
+        """
+        Applies stages one at a time, recording the element count and the
+        time of each stage. Each stage runs on a new collector, scoped to
+        the ElementIds left by the previous stage, so times do not include
+        earlier stages.
+
+        Args:
+            doc (`DB.Document`): Document of the collector
+            scope (``DB.ElementId``, ``List[DB.ElementId]``, optional):
+                View Id or ElementIds of the collector scope
+
+        Returns:
+            (:any:`PlanReport`): Report of all stages in execution order
+        """
+        report = PlanReport()
+        element_ids = None
+        for filter_class, filter_value in self.stages:
+            if element_ids is None:
+                elements_in = get_scoped_collector(doc, scope).GetElementCount()
+            else:
+                elements_in = element_ids.Count
+
+            stopwatch = Stopwatch.StartNew()
+            if element_ids is None:
+                collector = get_scoped_collector(doc, scope)
+            elif element_ids.Count:
+                collector = get_scoped_collector(doc, element_ids)
+            else:
+                # or_collector can still add elements
+                collector = get_empty_collector(doc)
+            collector = filter_class.apply(doc, collector, filter_value)
+            element_ids = collector.ToElementIds()
+            stopwatch.Stop()
+
+            report.add_stage(filter_class, filter_value, elements_in,
+                             element_ids.Count, stopwatch.Elapsed.TotalMilliseconds)
+        return report
+
+    def __len__(self):
+        return len(self.stages)
+
+    def __repr__(self):
+        return super(QueryPlan, self).__repr__(data={'stages': self.keywords})
+
+
+class PlanReport(BaseObject):
+    """
+    Element counts and times of each :any:`QueryPlan` stage.
+    Returned by :any:`Collector.explain`.
+
+    >>> report = Collector(of_class='Wall', level='Level 1').explain()
+    >>> print(report)
+    #  keyword   filter       kind   in    out   ms
+    0  of_class  ClassFilter  quick  9120  412   1.9
+    1  level     LevelFilter  slow   412   37    4.2
+    >>> report.slowest['keyword']
+    'level'
+
+    Attributes:
+        stages (``list``): One dictionary per stage, with ``keyword``,
+            ``filter``, ``kind`` (``quick``, ``slow``, ``python`` or
+            ``logical``), ``elements_in``, ``elements_out``, ``time``
+            (milliseconds) and ``wraps_elements`` (``True`` if the stage
+            wraps elements for ``where`` functions).
+    """
+
+    KINDS = {0: 'quick', 1: 'quick', 2: 'slow', 3: 'python', 4: 'logical'}
+    COLUMNS = ('keyword', 'filter', 'kind', 'elements_in', 'elements_out', 'time')
+    HEADERS = ('keyword', 'filter', 'kind', 'in', 'out', 'ms')
+
+    def __init__(self):
+        self.stages = []
+
+    def add_stage(self, filter_class, filter_value, elements_in, elements_out, time):
+        wraps_elements = (filter_class is FilterClasses.WhereFilter and
+                          FilterClasses.WhereFilter.wraps_elements(filter_value))
+        stage = OrderedDict([
+                            ('keyword', filter_class.keyword),
+                            ('filter', filter_class.__name__),
+                            ('kind', self.KINDS[filter_class.get_priority(filter_value)]),
+                            ('elements_in', elements_in),
+                            ('elements_out', elements_out),
+                            ('time', time),
+                            ('wraps_elements', wraps_elements),
+                            ])
+        self.stages.append(stage)
+
+    @property
+    def total_time(self):
+        """ Time of all stages, in milliseconds """
+        return sum(stage['time'] for stage in self.stages)
+
+    @property
+    def slowest(self):
+        """ Stage with the longest time, or ``None`` if plan is empty """
+        if not self.stages:
+            return None
+        return max(self.stages, key=lambda stage: stage['time'])
+
+    def format(self):
+        """ Report as a text table """
+        rows = [('#',) + self.HEADERS]
+        for index, stage in enumerate(self.stages):
+            row = [str(index)]
+            for column in self.COLUMNS:
+                value = stage[column]
+                row.append('{:.1f}'.format(value) if column == 'time' else str(value))
+            if stage['wraps_elements']:
+                row[-1] += ' (wraps elements)'
+            rows.append(row)
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        lines = ['  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+                 for row in rows]
+        lines.append('total: {:.1f} ms'.format(self.total_time))
+        return '\n'.join(lines)
+
+    def __iter__(self):
+        return iter(self.stages)
+
+    def __len__(self):
+        return len(self.stages)
+
+    def __str__(self):
+        return self.format()
+
+    def __repr__(self):
+        return super(PlanReport, self).__repr__(data={'stages': len(self),
+                                                      'ms': round(self.total_time, 1)})
+
+
+def get_scoped_collector(doc, scope=None):
+    """
+    New ``FilteredElementCollector`` for a view or list of ElementIds,
+    with a pass-all filter applied, so it can be iterated and counted.
+
+    Args:
+        doc (`DB.Document`): Document
+        scope (``DB.ElementId``, ``List[DB.ElementId]``, optional):
+            View Id or ElementIds. Whole document if ``None``
+    """
+    if scope is None:
+        collector = DB.FilteredElementCollector(doc)
+    else:
+        collector = DB.FilteredElementCollector(doc, scope)
+    return collector.WherePasses(DB.LogicalOrFilter(DB.ElementIsElementTypeFilter(False),
+                                                    DB.ElementIsElementTypeFilter(True)))
+
+
+class CollectorResult(BaseObject):
+    """
+    Materialized result of a :any:`Collector`.
+
+    Holds the ElementIds found by the collector in a ``List[DB.ElementId]``
+    so indexing, slicing and ``len`` do not walk the collector again.
+    Elements are only fetched with ``doc.GetElement`` for the rows
+    that are accessed.
+
+    >>> result = Collector(of_class='Wall').snapshot()
+    >>> len(result)
+    120
+    >>> result[0]
+    <Autodesk.Revit.DB.Wall>
+    >>> result[10:20]
+    <rpw:CollectorResult | count:10>
+    >>> result.any()
+    True
+
+    """
+
+    def __init__(self, element_ids, doc=revit.doc):
+        """
+        Args:
+            element_ids (``[DB.ElementId]``): ElementIds of the result
+            doc (``DB.Document``, optional): Document of the elements
+        """
+        self.doc = doc
+        self._element_ids = List[DB.ElementId](element_ids)
+
+    def any(self):
+        """ ``True`` if result has at least one element """
+        return self._element_ids.Count > 0
+
+    def get_element_id(self, index):
+        """ ElementId at ``index`` """
+        return self._element_ids[self._get_index(index)]
+
+    def get_element_ids(self, as_list=True):
+        """
+        ElementIds in the result
+
+        Args:
+            as_list(bool): True if you want list as List[DB.ElementId], False
+                for regular python list. Default is True
+
+        Returns:
+            ElementIds (List, List[DB.ElementId]): List of ElementIds Objects
+        """
+        if as_list:
+            return self._element_ids
+        else:
+            return list(self._element_ids)
+
+    def get_elements(self, wrapped=True):
+        """
+        Returns list with all elements.
+        Elements are instantiated using :any:`Element` if ``wrapped``
+        """
+        return [Element(e) if wrapped else e for e in self.__iter__()]
+
+    def get_first(self, wrapped=True):
+        """ Returns first element or `None` """
+        if not self.any():
+            return None
+        element = self.doc.GetElement(self._element_ids[0])
+        return Element(element) if wrapped else element
+
+    def _get_index(self, index):
+        count = self._element_ids.Count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('Index {} not in result {}'.format(index, self))
+        return index
+
+    def __getitem__(self, index):
+        """
+        Element (unwrapped) at ``index``. Slices return a new
+        :any:`CollectorResult`
+        """
+        if isinstance(index, slice):
+            indexes = range(*index.indices(self._element_ids.Count))
+            return CollectorResult([self._element_ids[n] for n in indexes],
+                                   doc=self.doc)
+        return self.doc.GetElement(self.get_element_id(index))
+
+    def __iter__(self):
+        """ Iterator: Unwrapped. Fetches elements as the iteration goes """
+        for element_id in self._element_ids:
+            yield self.doc.GetElement(element_id)
+
+    def __contains__(self, element_reference):
+        return self._element_ids.Contains(to_element_id(element_reference))
+
+    def __len__(self):
+        return self._element_ids.Count
+
+    def __bool__(self):
+        return self.any()
+
+    __nonzero__ = __bool__  # IronPython 2.7 truth test
+
+    def __repr__(self):
+        return super(CollectorResult, self).__repr__(data={'count': len(self)})
+
+
 class Collector(BaseObjectWrapper):
     """
     Revit FilteredElement Collector Wrapper
@@ -354,6 +1034,11 @@ class Collector(BaseObjectWrapper):
         >>> Collector(owner_view=SomeView)
         >>> Collector(owner_view=None)
         >>> Collector(parameter_filter=parameter_filter)
+        >>> Collector(of_class='Wall', where=P('Mark') == 'A1')
+        >>> Collector(of_categories=['Walls', 'Floors'], workset='Shell')
+        >>> Collector(bbox_intersects=((0, 0, 0), (10, 10, 3)), tolerance=0.1)
+        >>> Collector(of_class='Wall', intersects_element=some_floor)
+        >>> Collector(filter=F.category('Walls') | F.category('Floors') & ~F.level('1NP'))
 
         Use Enumeration member or its name as a string:
 
@@ -371,11 +1056,31 @@ class Collector(BaseObjectWrapper):
         >>> Collector(owner_view=SomeView)
         >>> Collector(owner_view=None)
 
+        Filters are not applied when the Collector is created.
+        A :any:`QueryPlan` is built from all keywords and executed
+        the first time the collector is iterated, counted or unwrapped:
+
+        >>> collector = Collector(of_class='Wall', level='Level 1')
+        >>> collector.plan
+        <rpw:QueryPlan | stages:['of_class', 'level']>
+
+        Results can be cached by document until the next :any:`Transaction`
+        ends. See :any:`rpw.db.cache`
+
+        >>> levels = Collector(of_class='Level', cache=True)
+
     Attributes:
         collector.get_elements(): Returns list of all `collected` elements
         collector.get_first(): Returns first found element, or ``None``
         collector.get_elements(): Returns list with all elements wrapped.
                                     Elements will be instantiated using :any:`Element`
+        collector.snapshot(): Returns a :any:`CollectorResult` with the ElementIds
+        collector.group_by(key): ``List[DB.ElementId]`` per category, type, level, workset, family or parameter value
+        collector.aggregate(key, parameter=None): Element count or parameter sum per group
+        collector.values(*params): Dictionary of parameter value columns, plus an ``id`` column
+        collector.explain(): :any:`PlanReport` with count and time of each filter
+        collector.any(): ``True`` if at least one element passes. Stops at the first one.
+        collector.plan (:any:`QueryPlan`): Filter stages in execution order
 
     Wrapped Element:
         self._revit_object = ``Revit.DB.FilteredElementCollector``
@@ -396,6 +1101,8 @@ class Collector(BaseObjectWrapper):
             * ``view`` `(DB.View)`: View Scope (Optional)
             * ``element_ids`` `([ElementId])`: List of Element Ids to limit Collector Scope
             * ``elements`` `([Element])`: List of Elements to limit Collector Scope
+            * ``tolerance`` `(float)`: Tolerance of bounding box filters, in feet. Default is ``0``
+            * ``cache`` `(bool)`: Use :any:`CollectorCache`. Default is ``collector_cache.enabled``
 
         Warning:
             Only one scope filter should be used per query. If more then one is used,
@@ -406,6 +1113,18 @@ class Collector(BaseObjectWrapper):
             * is_not_type (``bool``): Same as ``WhereElementIsNotElementType``
             * of_class (``Type``): Same as ``OfClass``. Type can be ``DB.SomeType`` or string: ``DB.Wall`` or ``'Wall'``
             * of_category (``BuiltInCategory``): Same as ``OfCategory``. Can be ``DB.BuiltInCategory.OST_Wall`` or ``'Wall'``
+            * of_categories (``[BuiltInCategory]``): List of categories. Applies one ``ElementMulticategoryFilter``.
+              Also accepts ``DB.Category`` objects.
+            * of_classes (``[Type]``): List of classes. Applies one ``ElementMulticlassFilter``
+            * workset (``DB.WorksetId``, ``int``, ``DB.Workset``, ``Workset Name``): Elements in a user workset
+            * design_option (``DB.DesignOption``, ``DB.ElementId``, ``Design Option Name``, ``None``):
+              Elements of a design option. ``None`` for the main model
+            * structural_type (``DB.Structure.StructuralType``, ``str``): Structural type of family instances
+            * bbox_intersects (``DB.Outline``, ``DB.BoundingBoxXYZ``, ``(min, max)``): Bounding box intersects outline
+            * bbox_inside (``DB.Outline``, ``DB.BoundingBoxXYZ``, ``(min, max)``): Bounding box is inside outline
+            * bbox_contains_point (``DB.XYZ``, :any:`XYZ`, ``tuple``): Bounding box contains point
+            * intersects_element (``DB.Element``, ``DB.ElementId``): Geometry intersects element
+            * intersects_solid (``DB.Solid``): Geometry intersects solid
             * owner_view (``DB.ElementId, View`): ``WhereElementIsViewIndependent(True)``
             * is_view_independent (``bool``): ``WhereElementIsViewIndependent(True)``
             * family (``DB.ElementId``, ``DB.Element``): Element or ElementId of Family
@@ -416,59 +1135,106 @@ class Collector(BaseObjectWrapper):
             * exclude (`element_references`): Element(s) or ElementId(s) to exlude from result
             * and_collector (``collector``): Collector to intersect with. Elements must be present in both
             * or_collector (``collector``): Collector to Union with. Elements must be present on of the two.
-            * where (`function`): function to test your elements against
+            * filter (:any:`F`): Filter tree composed with ``&``, ``|`` and ``~``. Applies a single
+              ``LogicalAndFilter`` / ``LogicalOrFilter``
+            * where (`function`, :any:`ParameterPredicate`): function to test your elements against.
+              :any:`P` predicates are compiled into native parameter filter rules
 
         """
         # Define Filtered Element Collector Scope + Doc
         collector_doc = filters.pop('doc') if 'doc' in filters else revit.doc
-
+        use_cache = filters.pop('cache', None)
+        if use_cache is None:
+            use_cache = collector_cache.enabled
+        # Key includes scope and filters, so it is built before they are popped
+        cache_key = collector_cache.get_key(collector_doc, filters) if use_cache else None
+        tolerance = filters.pop('tolerance', 0.0)
+
+        scope = None
         if 'view' in filters:
             view = filters.pop('view')
             view_id = view if isinstance(view, DB.ElementId) else view.Id
             collector = DB.FilteredElementCollector(collector_doc, view_id)
+            scope = view_id
         elif 'elements' in filters:
             elements = filters.pop('elements')
             element_ids = to_element_ids(elements)
-            collector = DB.FilteredElementCollector(collector_doc, List[DB.ElementId](element_ids))
+            scope = List[DB.ElementId](element_ids)
+            collector = DB.FilteredElementCollector(collector_doc, scope)
         elif 'element_ids' in filters:
             element_ids = filters.pop('element_ids')
-            collector = DB.FilteredElementCollector(collector_doc, List[DB.ElementId](element_ids))
+            scope = List[DB.ElementId](element_ids)
+            collector = DB.FilteredElementCollector(collector_doc, scope)
         else:
             collector = DB.FilteredElementCollector(collector_doc)
 
         super(Collector, self).__init__(collector)
-
-        for key in filters.keys():
-            if key not in [f.keyword for f in FilterClasses.get_sorted()]:
-                raise RpwException('Filter not valid: {}'.format(key))
-
-        self._collector = self._collect(collector_doc, collector, filters)
-
-    def _collect(self, doc, collector, filters):
+        self.doc = collector_doc
+        self._scope = scope
+        self.plan = QueryPlan(filters, doc=collector_doc, tolerance=tolerance)
+        self._filtered_collector = None
+        self._result = None
+        self._cache_key = cache_key
+
+    def _get_collector(self):
+        """
+        Filtered collector. Executes the plan on first call, or scopes
+        the collector to the cached ids.
+        """
+        # Not a property: an AttributeError raised while executing the plan
+        # would otherwise be swallowed by __getattr__
+        if self._filtered_collector is None:
+            if self._cache_key is None:
+                self._filtered_collector = self.plan.execute(self.doc,
+                                                             self._revit_object)
+            else:
+                self._filtered_collector = self._get_cached_collector()
+        return self._filtered_collector
+
+    def _get_cached_collector(self):
+        element_ids = collector_cache.get(self._cache_key)
+        if element_ids is None:
+            collector = self.plan.execute(self.doc, self._revit_object)
+            element_ids = collector.ToElementIds()
+            collector_cache.set(self._cache_key, element_ids)
+        self._result = CollectorResult(element_ids, doc=self.doc)
+        if self._result.any():
+            # Collectors scoped to ids must have a filter to be iterated
+            return get_scoped_collector(self.doc, self._result.get_element_ids())
+        return get_empty_collector(self.doc)
+
+    def explain(self):
         """
-        Main Internal Recursive Collector Function.
+        Runs the :any:`QueryPlan` stage by stage, and reports the kind,
+        element count in and out, and time of each filter.
+        The report does not use or fill the :any:`CollectorCache`.
 
-        Args:
-            doc (`UI.UIDocument`): Document for the collector.
-            collector (`FilteredElementCollector`): FilteredElementCollector
-            filters (`dict`): Filters - {'doc': revit.doc, 'of_class': 'Wall'}
+        >>> print(Collector(of_class='Wall', where=is_exterior).explain())
+        #  keyword   filter       kind    in    out  ms
+        0  of_class  ClassFilter  quick   9120  412  1.9
+        1  where     WhereFilter  python  412   96   88.0 (wraps elements)
+        total: 89.9 ms
 
         Returns:
-            collector (`FilteredElementCollector`): FilteredElementCollector
+            (:any:`PlanReport`): Report of each stage in execution order
         """
-        for filter_class in FilterClasses.get_sorted():
-            if filter_class.keyword not in filters:
-                continue
-            filter_value = filters.pop(filter_class.keyword)
-            logger.debug('Applying Filter: {}:{}'.format(filter_class, filter_value))
-            new_collector = filter_class.apply(doc, collector, filter_value)
-            return self._collect(doc, new_collector, filters)
-        return collector
+        return self.plan.explain(self.doc, self._scope)
+
+    def __getattr__(self, attr):
+        """
+        Pass-through to the filtered collector, so original methods
+        never see a collector the plan was not applied to yet.
+        """
+        return getattr(self._get_collector(), attr)
+
+    def unwrap(self):
+        """ Returns the filtered ``DB.FilteredElementCollector`` """
+        return self._get_collector()
 
     def __iter__(self):
         """ Uses iterator to reduce unecessary memory usage """
         # TODO: Depracate or Make return Wrapped ?
-        for element in self._collector:
+        for element in self._get_collector():
             yield element
 
     def get_elements(self, wrapped=True):
@@ -496,7 +1262,39 @@ class Collector(BaseObjectWrapper):
 
     def select(self):
         """ Selects Collector Elements on the UI """
-        Selection(self.element_ids)
+        Selection(self.get_element_ids())
+
+    def snapshot(self):
+        """
+        Materializes the collector into a :any:`CollectorResult`.
+        The result is kept by the collector and used for indexing and
+        ``len``, so call ``snapshot()`` again to refresh it.
+
+        >>> rooms = Collector(of_category='Rooms').snapshot()
+        >>> rooms[0], rooms[-1], len(rooms)
+
+        Returns:
+            (:any:`CollectorResult`): Result with ElementIds of the collector
+        """
+        self._result = CollectorResult(self._get_collector().ToElementIds(),
+                                       doc=self.doc)
+        return self._result
+
+    def _get_result(self):
+        """ Returns current snapshot. Takes one if there is none. """
+        if self._result is None:
+            return self.snapshot()
+        return self._result
+
+    def any(self):
+        """
+        Returns ``True`` if at least one element passes the filters.
+        Uses ``FirstElementId()``, so iteration stops at the first match.
+        """
+        if self._result is not None:
+            return self._result.any()
+        first_id = self._get_collector().FirstElementId()
+        return first_id != DB.ElementId.InvalidElementId
 
     def get_first(self, wrapped=True):
         """
@@ -505,11 +1303,12 @@ class Collector(BaseObjectWrapper):
         Returns:
             Element (`DB.Element`, `None`): First element or None
         """
-        try:
-            element = self[0]
-            return Element(element) if wrapped else element
-        except IndexError:
+        if self._result is not None:
+            return self._result.get_first(wrapped=wrapped)
+        element = self._get_collector().FirstElement()
+        if element is None:
             return None
+        return Element(element) if wrapped else element
 
 
     # @property
@@ -521,7 +1320,7 @@ class Collector(BaseObjectWrapper):
         """
         Returns list with all elements instantiated using :any:`Element`
         """
-        return [element_id for element_id in self._collector.ToElementIds()]
+        return list(self._get_collector().ToElementIds())
 
     @property
     def element_ids(self):
@@ -529,23 +1328,152 @@ class Collector(BaseObjectWrapper):
                           'Collector.get_element_ids()')
         return self.get_element_ids()
 
+    def group_by(self, key):
+        """
+        Groups the ElementIds of the collector in a single pass.
+
+        >>> Collector(of_category='Doors', is_not_type=True).group_by('level')
+        OrderedDict([(<ElementId: Level 1>, List[ElementId]), ...])
+        >>> Collector(of_class='Room').group_by(P('Department'))
+        OrderedDict([('Office', List[ElementId]), ...])
+
+        Args:
+            key: Group key. Can be one of ``category``, ``type``, ``level``,
+                ``workset`` or ``family`` (ElementId of group),
+                a parameter reference (:any:`P`, ``DB.BuiltInParameter`` or
+                parameter ``DB.ElementId``), or a function that takes an
+                unwrapped element and returns its group, like a
+                :any:`ParameterPredicate`.
+
+        Returns:
+            (``OrderedDict``): ``List[DB.ElementId]`` of each group,
+            in order of first appearance. Elements without the group key,
+            for example without level, are grouped under
+            ``DB.ElementId.InvalidElementId``, or ``None`` for parameters.
+        """
+        get_group = _get_group_function(key)
+        groups = OrderedDict()
+        for element in self._get_collector():
+            group = get_group(element)
+            if group not in groups:
+                groups[group] = []
+            groups[group].append(element.Id)
+        return OrderedDict((group, List[DB.ElementId](element_ids))
+                           for group, element_ids in groups.iteritems())
+
+    def aggregate(self, key, parameter=None):
+        """
+        Counts elements per group in a single pass, or sums the values of
+        a numeric parameter per group.
+
+        >>> Collector(of_category='Walls', is_not_type=True).aggregate('type')
+        OrderedDict([(<ElementId: Wall 1>, 12), ...])
+        >>> Collector(of_category='Rooms').aggregate('level', 'ROOM_AREA')
+        OrderedDict([(<ElementId: Level 1>, 1550.0), ...])
+
+        Args:
+            key: Group key. See :any:`group_by`
+            parameter (optional): Parameter to sum. Elements
+                without the parameter, or without a numeric value,
+                are skipped. See :any:`P`
+
+        Returns:
+            (``OrderedDict``): Count or sum of each group
+
+        Raises:
+            :class:`RpwException`: If the first parameter found
+            is not stored as ``Double`` or ``Integer``
+        """
+        get_group = _get_group_function(key)
+        totals = OrderedDict()
+        if parameter is not None:
+            parameter_reference = getattr(parameter, 'parameter_reference', parameter)
+        storage_type = getter = None
+        for element in self._get_collector():
+            group = get_group(element)
+            if parameter is None:
+                totals[group] = totals.get(group, 0) + 1
+                continue
+            element_parameter = _lookup_parameter(element, parameter_reference)
+            if element_parameter is None:
+                continue
+            if getter is None:
+                # Storage type is checked once, on the first parameter found
+                python_type, getter = get_storage_getter(element_parameter)
+                if python_type not in (int, float):
+                    raise RpwException('Parameter is not numeric: {} [{}]'.format(
+                                       element_parameter.Definition.Name,
+                                       element_parameter.StorageType))
+                storage_type = element_parameter.StorageType
+            if element_parameter.StorageType == storage_type:
+                value = getter(element_parameter)
+            else:
+                # Same name, other Definition
+                value = read_value(element_parameter)
+            if not isinstance(value, (int, float)):
+                continue
+            totals[group] = totals.get(group, 0) + value
+        return totals
+
+    def values(self, *parameter_references):
+        """
+        Reads parameters of all elements in a single pass, into columns.
+        Each parameter is resolved once and read with its
+        ``As<StorageType>`` getter, so no :any:`Element` or :any:`Parameter`
+        wrappers are created.
+
+        >>> table = Collector(of_category='Rooms').values('Number', 'ROOM_AREA')
+        >>> table['id'][0], table['Number'][0], table['ROOM_AREA'][0]
+        (<ElementId>, '101', 215.3)
+
+        Args:
+            *parameter_references: Parameter names, ``DB.BuiltInParameter``
+                (or its name), parameter ``DB.ElementId``, Guid or :any:`P`.
+                See :any:`ParameterReader`
+
+        Returns:
+            (``OrderedDict``): ``id`` column with ``DB.ElementId`` of each
+            element, and one column per parameter. Cells of elements
+            without the parameter are ``None``.
+        """
+        readers = OrderedDict()
+        for reference in parameter_references:
+            reader = ParameterReader(getattr(reference, 'parameter_reference', reference))
+            # Repeated references share one column
+            readers.setdefault(reader.name, reader)
+        readers = list(readers.values())
+        id_column = []
+        value_columns = [[] for _ in readers]
+        for element in self._get_collector():
+            id_column.append(element.Id)
+            for reader, column in zip(readers, value_columns):
+                column.append(reader.read(element))
+
+        table = OrderedDict([('id', id_column)])
+        for reader, column in zip(readers, value_columns):
+            table[reader.name] = column
+        return table
+
     def __getitem__(self, index):
+        """
+        Element (unwrapped) at ``index``, from the collector snapshot.
+        See :any:`snapshot`
+        """
         # TODO: Depracate or Make return Wrapped ?
-        for n, element in enumerate(self.__iter__()):
-            if n == index:
-                return element
-        else:
-            raise IndexError('Index {} not in collector {}'.format(index,
-                                                                   self))
+        return self._get_result()[index]
 
     def __bool__(self):
-        """ Evaluates to `True` if Collector.elements is not empty [] """
-        return bool(self.get_elements(wrapped=False))
+        """ Evaluates to `True` if Collector has any element. See :any:`any` """
+        return self.any()
+
+    __nonzero__ = __bool__  # IronPython 2.7 truth test. Avoids __len__
 
     def __len__(self):
         """ Returns length of collector.get_elements() """
+        if self._result is not None:
+            return len(self._result)
         try:
-            return self._collector.GetElementCount()
+            return self._get_collector().GetElementCount()
         except AttributeError:
             return len(self.get_elements(wrapped=False))  # Revit 2015
 
@@ -553,6 +1481,88 @@ class Collector(BaseObjectWrapper):
         return super(Collector, self).__repr__(data={'count': len(self)})
 
 
+class LinkedCollector(BaseObject):
+    """
+    Runs the same filters on the host document and its loaded Revit links,
+    with one :any:`Collector` per document.
+
+    >>> doors = LinkedCollector(of_category='Doors', is_not_type=True)
+    >>> for link_instance_id, element_id, transform in doors:
+    ...     point = transform.OfPoint(location)
+
+    Host elements have ``DB.ElementId.InvalidElementId`` as link instance
+    id, and the identity transform. Link documents and transforms are
+    kept in :any:`LinkCache`.
+
+    Filters are resolved in each document, so level or workset names
+    match elements of the link, and element or view references of the
+    host should not be used. The ``view``, ``elements`` and ``element_ids``
+    scopes, and ``exclude``, refer to host elements and are not supported.
+
+    Attributes:
+        collectors (``list``): ``(link_instance_id, transform, collector)``
+            for each document
+    """
+
+    HOST_ID = DB.ElementId.InvalidElementId
+    HOST_KEYWORDS = ('view', 'elements', 'element_ids', 'exclude')
+
+    def __init__(self, links='all_links', include_host=True, **filters):
+        """
+        Args:
+            links (``str``, ``[DB.RevitLinkInstance]``): ``'all_links'`` or
+                link instances, or their ElementIds. Default is ``'all_links'``
+            include_host (``bool``): Collect the host document too. Default is ``True``
+            **filters (``keyword args``): Filters of :any:`Collector`.
+                ``doc`` is the host document, default is ``revit.doc``
+
+        Raises:
+            :class:`RpwException`: If a host scoped keyword is used
+        """
+        for keyword in self.HOST_KEYWORDS:
+            if keyword in filters:
+                raise RpwException('LinkedCollector does not support '
+                                   'host scoped keyword: {}'.format(keyword))
+        doc = filters.pop('doc') if 'doc' in filters else revit.doc
+        if links == 'all_links':
+            link_ids = None
+        else:
+            link_ids = set(element_id.IntegerValue for element_id
+                           in to_element_ids(to_iterable(links)))
+
+        self.doc = doc
+        self.collectors = []
+        if include_host:
+            self.collectors.append((self.HOST_ID, DB.Transform.Identity,
+                                    Collector(doc=doc, **filters)))
+        for link_instance_id, link_doc, transform in link_cache.get_links(doc):
+            if link_ids is None or link_instance_id.IntegerValue in link_ids:
+                self.collectors.append((link_instance_id, transform,
+                                        Collector(doc=link_doc, **filters)))
+
+    def __iter__(self):
+        """ Yields ``(link_instance_id, element_id, transform)`` tuples """
+        for link_instance_id, transform, collector in self.collectors:
+            for element_id in collector.ToElementIds():
+                yield (link_instance_id, element_id, transform)
+
+    def get_elements(self, wrapped=True):
+        """
+        Returns:
+            (``list``): ``(link_instance_id, element, transform)`` tuples.
+            Elements are wrapped with :any:`Element` if ``wrapped``
+        """
+        return [(link_instance_id, element, transform)
+                for link_instance_id, transform, collector in self.collectors
+                for element in collector.get_elements(wrapped=wrapped)]
+
+    def __len__(self):
+        return sum(len(collector) for _, _, collector in self.collectors)
+
+    def __repr__(self):
+        return super(LinkedCollector, self).__repr__(data={'docs': len(self.collectors)})
+
+
 class ParameterFilter(BaseObjectWrapper):
     """
     Parameter Filter Wrapper.
@@ -563,10 +1573,17 @@ class ParameterFilter(BaseObjectWrapper):
         >>> parameter_filter = ParameterFilter(param_id, equals='Wall 1')
         >>> collector = Collector(parameter_filter=parameter_filter)
 
+    Set and range conditions are built into the same native filter, so
+    the collector still makes a single filtered pass:
+
+        >>> ParameterFilter('ROOM_NUMBER', in_=['101', '102', '205'])
+        >>> ParameterFilter('ROOM_AREA', between=(100.0, 200.0))
+
     Returns:
-        FilterRule: A filter rule object, depending on arguments.
+        ElementFilter: An ``ElementParameterFilter``, or a ``LogicalAndFilter``
+        / ``LogicalOrFilter`` of them when ``in_`` is used.
     """
-    _revit_object_class = DB.ElementParameterFilter
+    _revit_object_class = DB.ElementFilter
 
     RULES = {
             'equals': 'CreateEqualsRule',
@@ -587,9 +1604,15 @@ class ParameterFilter(BaseObjectWrapper):
             'not_less_equal': 'CreateLessOrEqualRule',
            }
 
+    OPTIONS = ('reverse', 'case_sensitive', 'precision')
+    SET_CONDITIONS = ('in_', 'any_of', 'not_in', 'between')
+
     CASE_SENSITIVE = True                 # Override with case_sensitive=False
     FLOAT_PRECISION = 0.0013020833333333  # 1/64" in ft:(1/64" = 0.015625)/12
 
+    _rule_cache = {}         # (parameter id, condition, value, options): FilterRule
+    RULE_CACHE_SIZE = 10000  # Cache is cleared when full
+
     def __init__(self, parameter_reference, **conditions):
         """
         Creates Parameter Filter Rule
@@ -611,9 +1634,14 @@ class ParameterFilter(BaseObjectWrapper):
                 | ``less_equal``, ``not_less_equal``
                 | ``greater``, ``not_greater``
                 | ``greater_equal``, ``not_greater_equal``
+                | ``in_`` (or ``any_of``): Equals any value of a list.
+                  A single value, like a string, is a list of one value
+                | ``not_in``: Equals none of the values of a list
+                | ``between``: ``(min, max)`` tuple, both included
 
             options:
                 | ``case_sensitive``: Enforces case sensitive, String only
+                | ``precision``: Tolerance of Double values
                 | ``reverse``: Reverses result of Collector
 
         """
@@ -623,44 +1651,149 @@ class ParameterFilter(BaseObjectWrapper):
         precision = conditions.get('precision', ParameterFilter.FLOAT_PRECISION)
 
         for condition in conditions.keys():
-            if condition not in ParameterFilter.RULES:
+            if condition not in ParameterFilter.RULES and \
+               condition not in ParameterFilter.SET_CONDITIONS and \
+               condition not in ParameterFilter.OPTIONS:
                 raise RpwException('Rule not valid: {}'.format(condition))
 
-        rules = []
+        def create_rule(condition_name, value):
+            return ParameterFilter.create_rule(parameter_id, condition_name, value,
+                                               case_sensitive=case_sensitive,
+                                               precision=precision)
+
+        rules = []      # All must pass
+        any_rules = []  # One must pass
         for condition_name, condition_value in conditions.iteritems():
+            if condition_name in ParameterFilter.OPTIONS:
+                continue
+            elif condition_name in ('in_', 'any_of'):
+                values = _to_values(condition_value)
+                if not values:
+                    raise RpwException('{} requires at least one value'.format(
+                                                                condition_name))
+                any_rules.extend(create_rule('equals', value) for value in values)
+            elif condition_name == 'not_in':
+                rules.extend(create_rule('not_equals', value)
+                             for value in _to_values(condition_value))
+            elif condition_name == 'between':
+                try:
+                    min_value, max_value = condition_value
+                except (TypeError, ValueError):
+                    raise RpwException('between requires (min, max): {}'.format(
+                                                                condition_value))
+                rules.append(create_rule('greater_equal', min_value))
+                rules.append(create_rule('less_equal', max_value))
+            else:
+                rules.append(create_rule(condition_name, condition_value))
 
-            # Returns on of the CreateRule factory method names above
-            rule_factory_name = ParameterFilter.RULES.get(condition_name)
-            filter_value_rule = getattr(DB.ParameterFilterRuleFactory,
-                                        rule_factory_name)
+        if len(any_rules) == 1:
+            rules.extend(any_rules)
+            any_rules = []
+        if not rules and not any_rules:
+            raise RpwException('malformed filter rule: {}'.format(conditions))
+        logger.debug('ParamFilter Conditions: {}'.format(conditions))
 
-            args = [condition_value]
+        _revit_object = ParameterFilter.build_filter(rules, any_rules, reverse)
+        super(ParameterFilter, self).__init__(_revit_object)
+        self.parameter_id = parameter_id
+        self.conditions = conditions
+        self._rules = rules
+        self._any_rules = any_rules
+        self.reverse = reverse
 
-            if isinstance(condition_value, str):
-                args.append(case_sensitive)
+    @staticmethod
+    def build_filter(rules, any_rules=None, inverted=False):
+        """
+        Builds a native filter that passes elements where all ``rules``
+        and at least one of ``any_rules`` pass.
+
+        Args:
+            rules (``[DB.FilterRule]``): Rules that must all pass
+            any_rules (``[DB.FilterRule]``, optional): Rules where one must pass
+            inverted (``bool``): Passes elements the filter would reject
+
+        Returns:
+            (``DB.ElementFilter``): ``ElementParameterFilter``, or a logical
+            filter of ``ElementParameterFilter``
+        """
+        filters = []
+        if rules:
+            filters.append(DB.ElementParameterFilter(List[DB.FilterRule](rules),
+                                                     inverted))
+        if any_rules:
+            # One filter per rule. Inverted: not (a or b) == not a and not b
+            rule_filters = List[DB.ElementFilter](
+                    [DB.ElementParameterFilter(rule, inverted) for rule in any_rules])
+            if inverted:
+                filters.append(DB.LogicalAndFilter(rule_filters))
+            else:
+                filters.append(DB.LogicalOrFilter(rule_filters))
+        if len(filters) == 1:
+            return filters[0]
+        filters = List[DB.ElementFilter](filters)
+        return DB.LogicalOrFilter(filters) if inverted else DB.LogicalAndFilter(filters)
+
+    def get_filter(self, inverted=False):
+        """ Native filter. Rules are reused if ``inverted`` is ``True`` """
+        if not inverted:
+            return self.unwrap()
+        return ParameterFilter.build_filter(self._rules, self._any_rules,
+                                            not self.reverse)
 
-            if isinstance(condition_value, float):
-                args.append(precision)
+    @staticmethod
+    def create_rule(parameter_id, condition_name, value,
+                    case_sensitive=CASE_SENSITIVE, precision=FLOAT_PRECISION):
+        """
+        Creates a single ``DB.FilterRule`` with ``ParameterFilterRuleFactory``
 
-            filter_rule = filter_value_rule(parameter_id, *args)
-            if 'not_' in condition_name:
-                filter_rule = DB.FilterInverseRule(filter_rule)
+        >>> ParameterFilter.create_rule(param_id, 'not_equals', 'a')
 
-            logger.debug('ParamFilter Conditions: {}'.format(conditions))
-            logger.debug('Case sensitive: {}'.format(case_sensitive))
-            logger.debug('Reverse: {}'.format(reverse))
-            logger.debug('ARGS: {}'.format(args))
-            logger.debug(filter_rule)
-            logger.debug(str(dir(filter_rule)))
+        Args:
+            parameter_id (``DB.ElementId``): ElementId of parameter
+            condition_name (``str``): One of the conditions listed in ``RULES``
+            value (``str``, ``int``, ``float``, ``DB.ElementId``): Rule value
 
-            rules.append(filter_rule)
-        if not rules:
-            raise RpwException('malformed filter rule: {}'.format(conditions))
+        Returns:
+            (``DB.FilterRule``): Filter Rule. ``not_`` conditions return a
+            ``DB.FilterInverseRule``. Rules are cached, so the same rule is
+            only created once.
+        """
+        try:
+            rule_factory_name = ParameterFilter.RULES[condition_name]
+        except KeyError:
+            raise RpwException('Rule not valid: {}'.format(condition_name))
 
-        _revit_object = DB.ElementParameterFilter(List[DB.FilterRule](rules),
-                                                  reverse)
-        super(ParameterFilter, self).__init__(_revit_object)
-        self.conditions = conditions
+        if isinstance(value, DB.ElementId):
+            key_value = ('id', value.IntegerValue)
+        else:
+            key_value = (type(value).__name__, value)
+        if isinstance(value, str):
+            key_value += (case_sensitive,)
+        if isinstance(value, float):
+            key_value += (precision,)
+        cache_key = (parameter_id.IntegerValue, condition_name, key_value)
+        filter_rule = ParameterFilter._rule_cache.get(cache_key)
+        if filter_rule is not None:
+            return filter_rule
+        filter_value_rule = getattr(DB.ParameterFilterRuleFactory,
+                                    rule_factory_name)
+
+        args = [value]
+
+        if isinstance(value, str):
+            args.append(case_sensitive)
+
+        if isinstance(value, float):
+            args.append(precision)
+
+        filter_rule = filter_value_rule(parameter_id, *args)
+        if condition_name.startswith('not_'):
+            filter_rule = DB.FilterInverseRule(filter_rule)
+
+        if len(ParameterFilter._rule_cache) >= ParameterFilter.RULE_CACHE_SIZE:
+            ParameterFilter._rule_cache.clear()
+        ParameterFilter._rule_cache[cache_key] = filter_rule
+        return filter_rule
 
     def coerce_param_reference(self, parameter_reference):
         if isinstance(parameter_reference, str):
@@ -668,7 +1801,7 @@ class ParameterFilter(BaseObjectWrapper):
         elif isinstance(parameter_reference, DB.ElementId):
             param_id = parameter_reference
         else:
-            RpwCoerceError(parameter_reference, ElementId)
+            raise RpwCoerceError(parameter_reference, DB.ElementId)
         return param_id
 
     @staticmethod
@@ -686,3 +1819,472 @@ class ParameterFilter(BaseObjectWrapper):
 
     def __repr__(self):
         return super(ParameterFilter, self).__repr__(data=self.conditions)
+
+
+class P(BaseObject):
+    """
+    Parameter reference used to write ``where`` predicates that
+    :any:`Collector` can compile into native ``ElementParameterFilter`` rules.
+
+    Comparing a ``P`` returns a :any:`ParameterPredicate`:
+
+    >>> Collector(of_class='Wall', where=P('ALL_MODEL_INSTANCE_COMMENTS') == 'x')
+    >>> Collector(of_class='Wall', where=[P('Fire Rating') == '1h', P('Width') > 0.5])
+    >>> Collector(of_class='Wall', where=P('Mark').begins('EXT', case_sensitive=False))
+    >>> Collector(of_class='Wall', where=~P('Mark').contains('TEMP'))
+
+    Parameters can be referenced by ``DB.BuiltInParameter`` member or name,
+    by parameter ``DB.ElementId``, by shared parameter ``Guid``, or by the
+    name of a Project or Shared parameter of the document.
+
+    Note:
+        Predicates that cannot be compiled, for example when the parameter
+        cannot be resolved or the storage type does not match the value,
+        are tested in Python against each element, like a regular
+        ``where`` function. Display names of built-in parameters, like
+        ``'Width'``, are one of these: the same name can be a different
+        ``BuiltInParameter`` in each category.
+    """
+
+    def __init__(self, parameter_reference):
+        """
+        Args:
+            parameter_reference (``str``, ``DB.BuiltInParameter``, ``DB.ElementId``, ``Guid``):
+                Parameter name, BuiltInParameter, parameter ElementId or
+                shared parameter Guid
+        """
+        self.parameter_reference = parameter_reference
+
+    def _predicate(self, condition, value, **options):
+        return ParameterPredicate(self.parameter_reference, condition, value,
+                                  **options)
+
+    def __eq__(self, value):
+        return self._predicate('equals', value)
+
+    def __ne__(self, value):
+        return self._predicate('not_equals', value)
+
+    def __gt__(self, value):
+        return self._predicate('greater', value)
+
+    def __ge__(self, value):
+        return self._predicate('greater_equal', value)
+
+    def __lt__(self, value):
+        return self._predicate('less', value)
+
+    def __le__(self, value):
+        return self._predicate('less_equal', value)
+
+    def equals(self, value, case_sensitive=ParameterFilter.CASE_SENSITIVE):
+        return self._predicate('equals', value, case_sensitive=case_sensitive)
+
+    def contains(self, value, case_sensitive=ParameterFilter.CASE_SENSITIVE):
+        return self._predicate('contains', value, case_sensitive=case_sensitive)
+
+    def begins(self, value, case_sensitive=ParameterFilter.CASE_SENSITIVE):
+        return self._predicate('begins', value, case_sensitive=case_sensitive)
+
+    def ends(self, value, case_sensitive=ParameterFilter.CASE_SENSITIVE):
+        return self._predicate('ends', value, case_sensitive=case_sensitive)
+
+    def __repr__(self):
+        return super(P, self).__repr__(data={'parameter': self.parameter_reference})
+
+
+class ParameterPredicate(BaseObject):
+    """
+    Parameter condition created by comparing a :any:`P`.
+
+    The predicate can be compiled into a ``DB.FilterRule`` with
+    :any:`get_rule`, or called with an element as a regular
+    ``where`` function. Elements without the parameter never pass,
+    which matches ``ElementParameterFilter``.
+
+    >>> predicate = P('Mark') == 'A1'
+    >>> predicate(some_element)
+    True
+    >>> ~predicate
+    <rpw:ParameterPredicate | parameter:Mark condition:not_equals value:A1>
+    """
+
+    STRING_CONDITIONS = ('contains', 'begins', 'ends')
+
+    OPERATORS = {
+        'equals': operator.eq,
+        'greater': operator.gt,
+        'greater_equal': operator.ge,
+        'less': operator.lt,
+        'less_equal': operator.le,
+        'contains': lambda value, other: other in value,
+        'begins': lambda value, other: value.startswith(other),
+        'ends': lambda value, other: value.endswith(other),
+        }
+
+    def __init__(self, parameter_reference, condition, value,
+                 case_sensitive=ParameterFilter.CASE_SENSITIVE,
+                 precision=ParameterFilter.FLOAT_PRECISION):
+        """
+        Args:
+            parameter_reference: See :any:`P`
+            condition (``str``): One of :any:`ParameterFilter` conditions
+            value: Value to compare the parameter to
+        """
+        if condition not in ParameterFilter.RULES:
+            raise RpwException('Rule not valid: {}'.format(condition))
+        self.parameter_reference = parameter_reference
+        self.condition = condition
+        self.value = int(value) if isinstance(value, bool) else value
+        self.case_sensitive = case_sensitive
+        self.precision = precision
+
+    @property
+    def is_inverted(self):
+        return self.condition.startswith('not_')
+
+    @property
+    def base_condition(self):
+        """ Condition without ``not_`` prefix """
+        return self.condition[4:] if self.is_inverted else self.condition
+
+    def get_rule(self, doc):
+        """
+        Compiles the predicate into a ``DB.FilterRule``.
+
+        Args:
+            doc (``DB.Document``): Document used to resolve parameter names
+
+        Returns:
+            (``DB.FilterRule``, ``None``): Filter Rule, or ``None`` if the
+            predicate can only be tested in Python.
+        """
+        value = self.value
+        if not isinstance(value, (str, int, float, DB.ElementId)):
+            return None
+        if self.base_condition in self.STRING_CONDITIONS and \
+           not isinstance(value, str):
+            return None
+
+        parameter_id = _get_parameter_id(self.parameter_reference, doc)
+        if parameter_id is None:
+            return None
+
+        storage_type = _get_storage_type(parameter_id, doc)
+        if storage_type is float and isinstance(value, int):
+            value = float(value)
+        elif storage_type is None and isinstance(value, int):
+            # Integer rules never pass on Double parameters
+            return None
+        elif storage_type not in (None, type(value)):
+            return None
+
+        return ParameterFilter.create_rule(parameter_id, self.condition, value,
+                                           case_sensitive=self.case_sensitive,
+                                           precision=self.precision)
+
+    def __call__(self, element):
+        """
+        Tests a wrapped or unwrapped element.
+        Used when the predicate could not be compiled.
+        """
+        if hasattr(element, 'unwrap'):
+            element = element.unwrap()
+        parameter = _lookup_parameter(element, self.parameter_reference)
+        if parameter is None:
+            return False
+
+        parameter_value = read_value(parameter)
+        value = self.value
+        if isinstance(value, str):
+            parameter_value = parameter_value or ''
+            if not self.case_sensitive:
+                parameter_value, value = parameter_value.lower(), value.lower()
+
+        condition = self.base_condition
+        if condition == 'equals' and isinstance(parameter_value, float):
+            passes = abs(parameter_value - value) <= self.precision
+        else:
+            try:
+                passes = self.OPERATORS[condition](parameter_value, value)
+            except (TypeError, AttributeError):
+                passes = False
+        return not passes if self.is_inverted else bool(passes)
+
+    def __invert__(self):
+        condition = self.base_condition if self.is_inverted else \
+                    'not_{}'.format(self.condition)
+        return ParameterPredicate(self.parameter_reference, condition, self.value,
+                                  case_sensitive=self.case_sensitive,
+                                  precision=self.precision)
+
+    def __repr__(self):
+        return super(ParameterPredicate, self).__repr__(data={
+                                        'parameter': self.parameter_reference,
+                                        'condition': self.condition,
+                                        'value': self.value})
+
+
+def _get_parameter_id(parameter_reference, doc):
+    """ ElementId of a parameter reference, or ``None`` if not found """
+    if isinstance(parameter_reference, DB.ElementId):
+        return parameter_reference
+    if isinstance(parameter_reference, DB.BuiltInParameter):
+        return DB.ElementId(parameter_reference)
+    if isinstance(parameter_reference, Guid):
+        shared_parameter = DB.SharedParameterElement.Lookup(doc, parameter_reference)
+        return shared_parameter.Id if shared_parameter else None
+    if isinstance(parameter_reference, str):
+        if parameter_reference in BipEnum:
+            return BipEnum.get_id(parameter_reference)
+        # Display names of built-in parameters are not unique across
+        # categories, so they are only resolved per element, in Python
+        return parameter_id_cache.get_parameter_id(doc, parameter_reference)
+    return None
+
+
+def _get_storage_type(parameter_id, doc):
+    """
+    Python type of a BuiltInParameter storage.
+    ``None`` for Project and Shared parameters: storage is only known
+    per element.
+    """
+    if parameter_id.IntegerValue >= 0:
+        return None
+    builtin = Enum.ToObject(DB.BuiltInParameter, parameter_id.IntegerValue)
+    storage_type = doc.get_TypeOfStorage(builtin)
+    return Parameter.STORAGE_TYPES.get(storage_type.ToString())
+
+
+def _to_values(condition_value):
+    """
+    List of values of a set condition. A single value, including a string,
+    is one value: ``in_='101'`` is not ``in_=['1', '0', '1']``
+    """
+    if isinstance(condition_value, str):
+        return [condition_value]
+    return list(to_iterable(condition_value))
+
+
+def _lookup_parameter(element, parameter_reference):
+    """ Parameter of an unwrapped element, or ``None`` """
+    if isinstance(parameter_reference, (DB.BuiltInParameter, Guid)):
+        return element.get_Parameter(parameter_reference)
+    if isinstance(parameter_reference, DB.ElementId):
+        if parameter_reference.IntegerValue < 0:
+            builtin = Enum.ToObject(DB.BuiltInParameter,
+                                    parameter_reference.IntegerValue)
+            return element.get_Parameter(builtin)
+        parameter_element = element.Document.GetElement(parameter_reference)
+        return element.get_Parameter(parameter_element.GetDefinition())
+    parameter = element.LookupParameter(parameter_reference)
+    if parameter is None and parameter_reference in BipEnum:
+        parameter = element.get_Parameter(BipEnum.get(parameter_reference))
+    return parameter
+
+
+class F(BaseObject):
+    """
+    Composable Collector filter.
+
+    Filters are combined with ``&`` (and), ``|`` (or) and ``~`` (not), and
+    the result is passed to the Collector ``filter`` keyword.
+    The whole tree is built into one native ``ElementFilter``, so the
+    collector only makes one pass over the document.
+
+    >>> walls_or_floors = F.category('Walls') | F.category('Floors')
+    >>> Collector(filter=walls_or_floors & ~F.level('1NP'))
+    >>> Collector(filter=F('is_type', False) & (F.of_class('Wall') | F.parameter(P('Mark') == 'A')))
+
+    Any Collector filter keyword can be used with ``F(keyword, value)``,
+    except ``where``, ``and_collector``, ``or_collector`` and ``filter``,
+    which are not native filters.
+
+    Note:
+        ``~`` is pushed down to each filter with De Morgan's laws:
+        ``~(a & b)`` is built as ``~a | ~b``.
+        Revit filters are inverted with their ``inverted`` argument, so
+        filters that do not have one, like ``family`` or ``exclude``,
+        raise :class:`RpwException` when inverted.
+
+        Inside an ``and`` / ``or`` group, filters are ordered by priority
+        group and cost, like :any:`QueryPlan` stages.
+    """
+
+    NOT_COMPOSABLE = ('where', 'and_collector', 'or_collector', 'filter')
+
+    def __init__(self, keyword, value, inverted=False):
+        """
+        Args:
+            keyword (``str``): Collector filter keyword
+            value: Filter value, same as Collector
+            inverted (``bool``): Inverts filter. Default is ``False``
+
+        Raises:
+            :class:`RpwException`: If keyword is not valid, not composable,
+                                   or cannot be inverted
+        """
+        if keyword in F.NOT_COMPOSABLE:
+            raise RpwException('Filter cannot be composed: {}'.format(keyword))
+        filter_class = FilterClasses.get_by_keyword(keyword)
+        if inverted and not filter_class.invertible:
+            raise RpwException('Filter cannot be inverted: {}'.format(keyword))
+        self.filter_class = filter_class
+        self.keyword = keyword
+        self.value = value
+        self.inverted = inverted
+
+    @classmethod
+    def category(cls, category_reference):
+        return cls('of_category', category_reference)
+
+    @classmethod
+    def categories(cls, category_references):
+        return cls('of_categories', category_references)
+
+    @classmethod
+    def of_class(cls, class_reference):
+        return cls('of_class', class_reference)
+
+    @classmethod
+    def classes(cls, class_references):
+        return cls('of_classes', class_references)
+
+    @classmethod
+    def level(cls, level_reference):
+        return cls('level', level_reference)
+
+    @classmethod
+    def workset(cls, workset_reference):
+        return cls('workset', workset_reference)
+
+    @classmethod
+    def parameter(cls, parameter_filter):
+        """ :any:`ParameterPredicate` or :any:`ParameterFilter` """
+        return cls('parameter_filter', parameter_filter)
+
+    @property
+    def priority_group(self):
+        return self.filter_class.get_priority(self.value)
+
+    @property
+    def cost(self):
+        return self.filter_class.get_cost(self.value)
+
+    def build(self, doc, tolerance=0.0):
+        """
+        Builds the native filter.
+
+        Args:
+            doc (``DB.Document``): Document used to resolve names
+            tolerance (``float``, optional): Tolerance of bounding box filters
+
+        Returns:
+            (``DB.ElementFilter``): Native Filter
+        """
+        value = self.value
+        if self.filter_class.uses_tolerance:
+            value = (value, tolerance)
+        return self.filter_class.build(value, doc, inverted=self.inverted)
+
+    def __and__(self, other):
+        return LogicalF('and', [self, other])
+
+    def __or__(self, other):
+        return LogicalF('or', [self, other])
+
+    def __invert__(self):
+        return F(self.keyword, self.value, inverted=not self.inverted)
+
+    def __repr__(self):
+        keyword = '~{}'.format(self.keyword) if self.inverted else self.keyword
+        return super(F, self).__repr__(data={keyword: self.value})
+
+
+class LogicalF(F):
+    """
+    ``and`` / ``or`` group of :any:`F` filters. Created with ``&`` and ``|``.
+    Nested groups of the same operator are flattened.
+    """
+
+    def __init__(self, operator_name, filters):
+        """
+        Args:
+            operator_name (``str``): ``and`` or ``or``
+            filters ([:any:`F`]): Filters in the group
+        """
+        if operator_name not in ('and', 'or'):
+            raise RpwException('Operator not valid: {}'.format(operator_name))
+        self.operator_name = operator_name
+        self.filters = []
+        for filter_ in filters:
+            if not isinstance(filter_, F):
+                raise RpwTypeError(F, type(filter_))
+            if isinstance(filter_, LogicalF) and \
+               filter_.operator_name == operator_name:
+                self.filters.extend(filter_.filters)
+            else:
+                self.filters.append(filter_)
+
+    @property
+    def priority_group(self):
+        """ A group is as slow as its slowest filter """
+        return max(filter_.priority_group for filter_ in self.filters)
+
+    @property
+    def cost(self):
+        return sum(filter_.cost for filter_ in self.filters)
+
+    def build(self, doc, tolerance=0.0):
+        filters = sorted(self.filters,
+                         key=lambda f: (f.priority_group, f.cost))
+        element_filters = List[DB.ElementFilter]([f.build(doc, tolerance)
+                                                  for f in filters])
+        if self.operator_name == 'and':
+            return DB.LogicalAndFilter(element_filters)
+        return DB.LogicalOrFilter(element_filters)
+
+    def __invert__(self):
+        operator_name = 'or' if self.operator_name == 'and' else 'and'
+        return LogicalF(operator_name, [~filter_ for filter_ in self.filters])
+
+    def __repr__(self):
+        return BaseObject.__repr__(self, data={self.operator_name: self.filters})
+
+
+def _get_family_id(element):
+    if isinstance(element, DB.FamilyInstance):
+        return element.Symbol.Family.Id
+    if isinstance(element, DB.FamilySymbol):
+        return element.Family.Id
+    return DB.ElementId.InvalidElementId
+
+
+def _get_category_id(element):
+    category = element.Category
+    return category.Id if category is not None else DB.ElementId.InvalidElementId
+
+
+GROUP_KEYS = {
+    'category': _get_category_id,
+    'type': lambda element: element.GetTypeId(),
+    'level': lambda element: element.LevelId,
+    'workset': lambda element: element.WorksetId,
+    'family': _get_family_id,
+    }
+
+
+def _get_group_function(key):
+    """ Function that returns the group of an unwrapped element """
+    if isinstance(key, str) and key in GROUP_KEYS:
+        return GROUP_KEYS[key]
+    if callable(key):
+        # Functions and ParameterPredicate
+        return key
+
+    parameter_reference = getattr(key, 'parameter_reference', key)
+
+    def get_parameter_value(element):
+        parameter = _lookup_parameter(element, parameter_reference)
+        return read_value(parameter) if parameter is not None else None
+    return get_parameter_value
@@ -9,11 +9,12 @@ from rpw import revit, DB
 from rpw.db.parameter import Parameter, ParameterSet
 from rpw.base import BaseObjectWrapper
 from rpw.exceptions import RpwException, RpwWrongStorageType
-from rpw.exceptions import RpwParameterNotFound, RpwTypeError
+from rpw.exceptions import RpwParameterNotFound, RpwTypeError, RpwElementNotFound
 from rpw.utils.logger import logger, deprecate_warning
 from rpw.utils.mixins import CategoryMixin
 from rpw.db.builtins import BicEnum, BipEnum
-from rpw.utils.coerce import to_element_ids
+from rpw.utils.coerce import to_element_id, to_iterable
+from rpw.db.cache import element_cache
 
 
 class Element(BaseObjectWrapper, CategoryMixin):
@@ -52,6 +53,7 @@ class Element(BaseObjectWrapper, CategoryMixin):
     Attributes:
 
         parameters (:any:`ParameterSet`): Access :any:`ParameterSet` class.
+            Created on first access
         parameters.builtins (:any:`ParameterSet`): BuitIn :any:`ParameterSet` object
 
     Methods:
@@ -60,16 +62,18 @@ class Element(BaseObjectWrapper, CategoryMixin):
     """
 
     _revit_object_class = DB.Element
+    __slots__ = ('doc', '_parameters', '__weakref__')
 
     def __new__(cls, element, **kwargs):
         """
         Factory Constructor will chose the best Class for the Element.
-        This function iterates through all classes in the rpw.db module,
-        and will find one that wraps the corresponding class. If and exact
-        match is not found :any:`Element` is used
+        The wrapper is looked up in the wrapper registry, using the
+        closest class of the element type that has a wrapper.
+        See :any:`register_wrapper`. If a wrapper is not found, or it does
+        not inherit from the class called, the class called is used.
+        If :any:`ElementCache` is enabled, an existing wrapper of the
+        element is returned.
         """
-        defined_wrapper_classes = rpw.db.__all__
-
         _revit_object_class = cls._revit_object_class
 
         if element is None:
@@ -80,31 +84,26 @@ class Element(BaseObjectWrapper, CategoryMixin):
             raise RpwTypeError('revit element', 'wrapped element: {}'.format(element))
 
         # Ensure Wrapped Element is instance of Class Wrapper or decendent
-        if not isinstance(element, _revit_object_class):
+        element_type = type(element)
+        if element_type is not _revit_object_class and \
+           not isinstance(element, _revit_object_class):
             raise RpwTypeError(_revit_object_class.__name__,
                                element.__class__.__name__)
 
-        # Ensure Wrapped Element is instance of Class Wrapper or decendent
-        if not isinstance(element, _revit_object_class):
-            raise RpwTypeError(_revit_object_class, element.__class__)
+        if element_cache.enabled and isinstance(element, DB.Element):
+            wrapper = element_cache.get_wrapper(element)
+            if isinstance(wrapper, cls):
+                return wrapper
 
         # If explicit constructor was called, use that and skip discovery
-        if type(element) is _revit_object_class:
+        if element_type is _revit_object_class:
             return super(Element, cls).__new__(cls, element, **kwargs)
 
-        for wrapper_class in defined_wrapper_classes:
-            class_name = wrapper_class.__name__
-            if type(element) is getattr(wrapper_class, '_revit_object_class', None):
-                # Found Mathing Class, Use Wrapper
-                # print('Found Mathing Class, Use Wrapper: {}'.format(class_name))
-                return super(Element, cls).__new__(wrapper_class, element, **kwargs)
-        else:
+        wrapper_class = get_wrapper(element_type)
+        if wrapper_class is None or not issubclass(wrapper_class, cls):
             # Could Not find a Matching Class, Use Element if related
-            return super(Element, cls).__new__(cls, element, **kwargs)
-
-        # No early return. Should not reach this point
-        element_class_name = element.__class__.__name__
-        raise RpwException('Factory does not support type: {}'.format(element_class_name))
+            wrapper_class = cls
+        return super(Element, cls).__new__(wrapper_class, element, **kwargs)
 
     def __init__(self, element, doc=None):
         """
@@ -126,14 +125,28 @@ class Element(BaseObjectWrapper, CategoryMixin):
 
         """
         # rpw.ui.forms.Console(context=locals())
+        if element_cache.enabled and self._is_initialized():
+            # Wrapper from ElementCache
+            return
         super(Element, self).__init__(element)
-        self.doc = element.Document if doc is None else revit.doc
-        if isinstance(element, DB.Element):
-            # WallKind Inherits from Family/Element, but is not Element,
-            # so ParameterSet fails. Parameters are only added if Element
-            # inherits from element
-            # NOTE: This is no longer the case. Verify if it can be removed
-            self.parameters = ParameterSet(element)
+        self.doc = element.Document if doc is None else doc
+        self._parameters = None
+        if element_cache.enabled and isinstance(element, DB.Element):
+            element_cache.add_wrapper(self)
+
+    def _is_initialized(self):
+        try:
+            object.__getattribute__(self, '_revit_object')
+        except AttributeError:
+            return False
+        return True
+
+    @property
+    def parameters(self):
+        """ :any:`ParameterSet` of the element. Created on first access """
+        if self._parameters is None:
+            self._parameters = ParameterSet(self._revit_object)
+        return self._parameters
 
     @property
     def type(self):
@@ -148,9 +161,7 @@ class Element(BaseObjectWrapper, CategoryMixin):
             (``Element``): Wrapped ``rpw.db.Element`` element type
 
         """
-        element_type_id = self._revit_object.GetTypeId()
-        element_type = self._revit_object.Document.GetElement(element_type_id)
-        return Element(element_type)
+        return element_cache.get_type(self._revit_object)
 
     @property
     def name(self):
@@ -184,6 +195,11 @@ class Element(BaseObjectWrapper, CategoryMixin):
         >>> rooms = db.WallInstance.collect(level="Level 1")
         [<rpw:WallInstance % DB.Wall symbol:Basic Wall>]
 
+        Repeated calls can reuse the ids of the first query with
+        ``cache=True``. See :any:`rpw.db.cache`
+
+        >>> wall_types = db.WallType.collect(cache=True)
+
         """
         _collector_params = getattr(cls, '_collector_params', None)
 
@@ -237,17 +253,71 @@ class Element(BaseObjectWrapper, CategoryMixin):
         Returns:
             (``list``): List of ``rpw.db.Element`` instances
 
+        Raises:
+            :class:`RpwElementNotFound`: If an ElementId is not in the document
+        """
+        return Element.from_ids(element_references, doc=doc, on_missing='raise')
+
+    @staticmethod
+    def from_ids(element_references, doc=None, on_missing='skip',
+                 wrapped=True, lazy=False):
+        """
+        Instantiate Elements from element references, in a single pass.
+        ElementIds of deleted elements, like ids of old warnings or saved
+        selections, are skipped, raised or collected.
+
+        >>> elements = Element.from_ids(failure.GetFailingElements())
+        >>> elements, missing_ids = Element.from_ids(ids, on_missing='collect')
+        >>> for element in Element.from_ids(ids, lazy=True):
+        ...     pass
+
+        Args:
+            element_references (``[DB.ElementId, int, DB.Element]``): Element references
+            doc (``DB.Document``, optional): Document of Elements [default: revit.doc]
+            on_missing (``str``): ``skip`` ignores ids not found, ``raise``
+                raises :class:`RpwElementNotFound` with all ids not found,
+                ``collect`` also returns the ids not found. Default is ``skip``
+            wrapped (``bool``): Wrap elements with :any:`Element`. Default is ``True``
+            lazy (``bool``): Return a generator instead of a list. With
+                ``collect``, the list of ids not found is filled as the
+                generator is consumed, and ``raise`` raises at the first
+                id not found. Default is ``False``
+
+        Returns:
+            (``list``, ``generator``): Elements found. ``(elements, missing_ids)``
+            tuple if ``on_missing`` is ``collect``
         """
+        if on_missing not in ('skip', 'raise', 'collect'):
+            raise RpwException('on_missing not valid: {}'.format(on_missing))
         doc = doc or revit.doc
-        try:
-            return [Element(e) for e in element_references]
-        except RpwTypeError:
-            pass
-        try:
-            element_ids = to_element_ids(element_references)
-            return [Element.from_id(id_, doc=doc) for id_ in element_ids]
-        except RpwTypeError:
-            raise
+        missing_ids = []
+        elements = Element._iter_from_ids(to_iterable(element_references), doc,
+                                          missing_ids, on_missing == 'raise' and lazy,
+                                          wrapped)
+        if not lazy:
+            elements = list(elements)
+            if missing_ids and on_missing == 'raise':
+                raise RpwElementNotFound(missing_ids, doc)
+        if on_missing == 'collect':
+            return elements, missing_ids
+        return elements
+
+    @staticmethod
+    def _iter_from_ids(element_references, doc, missing_ids, raise_missing, wrapped):
+        for element_reference in element_references:
+            if isinstance(element_reference, DB.Element):
+                element = element_reference
+            elif hasattr(element_reference, 'unwrap'):
+                element = element_reference.unwrap()
+            else:
+                element_id = to_element_id(element_reference)
+                element = doc.GetElement(element_id)
+                if element is None:
+                    if raise_missing:
+                        raise RpwElementNotFound([element_id], doc)
+                    missing_ids.append(element_id)
+                    continue
+            yield Element(element) if wrapped else element
 
 
     @staticmethod
@@ -266,3 +336,61 @@ class Element(BaseObjectWrapper, CategoryMixin):
         if element_id:
             data.update({'id': element_id})
         return super(Element, self).__repr__(data=data)
+
+
+_wrappers = {}           # Revit class: Wrapper class
+_resolved_wrappers = {}  # Element type: Wrapper class or None. Memoized MRO lookup
+_default_wrappers_loaded = False
+
+
+def register_wrapper(wrapper_class, revit_class=None):
+    """
+    Registers an :any:`Element` wrapper, so ``Element(element)`` returns
+    it for elements of ``revit_class`` and its subclasses that do not
+    have a closer wrapper. Replaces any wrapper of ``revit_class``.
+
+    >>> class Grid(db.Element):
+    ...     _revit_object_class = DB.Grid
+    >>> db.register_wrapper(Grid)
+    >>> db.Element(some_grid)
+    <rpw:Grid % Autodesk.Revit.DB.Grid>
+
+    Args:
+        wrapper_class (``type``): Class that inherits from :any:`Element`
+        revit_class (``type``, optional): Revit class to wrap. Default is
+            ``wrapper_class._revit_object_class``
+    """
+    if not (isinstance(wrapper_class, type) and issubclass(wrapper_class, Element)):
+        raise RpwTypeError('Element subclass', wrapper_class)
+    revit_class = revit_class or wrapper_class._revit_object_class
+    _wrappers[revit_class] = wrapper_class
+    _resolved_wrappers.clear()
+
+
+def get_wrapper(element_type):
+    """
+    Returns the wrapper class registered for ``element_type`` or its
+    closest base class, or ``None``. Resolved once per type.
+    """
+    try:
+        return _resolved_wrappers[element_type]
+    except KeyError:
+        pass
+    if not _default_wrappers_loaded:
+        _load_default_wrappers()
+    wrapper_class = None
+    for revit_class in element_type.__mro__:
+        if revit_class in _wrappers:
+            wrapper_class = _wrappers[revit_class]
+            break
+    _resolved_wrappers[element_type] = wrapper_class
+    return wrapper_class
+
+
+def _load_default_wrappers():
+    """ Registers Element wrappers of ``rpw.db``, unless already registered """
+    global _default_wrappers_loaded
+    for wrapper_class in rpw.db.__all__:
+        if issubclass(wrapper_class, Element):
+            _wrappers.setdefault(wrapper_class._revit_object_class, wrapper_class)
+    _default_wrappers_loaded = True
@@ -29,6 +29,7 @@ from rpw.utils.logger import logger, deprecate_warning
 from rpw.utils.mixins import CategoryMixin
 from rpw.db.builtins import BicEnum
 from rpw.db.category import Category
+from rpw.db.cache import element_cache
 
 
 class FamilyInstance(Element, CategoryMixin):
@@ -49,12 +50,14 @@ class FamilyInstance(Element, CategoryMixin):
     """
 
     _revit_object_class = DB.FamilyInstance
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class, 'is_not_type': True}
 
     def get_symbol(self, wrapped=True):
         """ ``DB.FamilySymbol`` of the ``DB.FamilyInstance`` """
-        symbol = self._revit_object.Symbol
-        return FamilySymbol(symbol) if wrapped else symbol
+        if wrapped:
+            return element_cache.get_type(self._revit_object)
+        return self._revit_object.Symbol
 
     @property
     def symbol(self):
@@ -134,6 +137,7 @@ class FamilySymbol(Element, CategoryMixin):
         _revit_object (DB.FamilySymbol): Wrapped ``DB.FamilySymbol``
     """
     _revit_object_class = DB.FamilySymbol
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class, 'is_type': True}
 
     def get_family(self, wrapped=True):
@@ -203,17 +207,25 @@ class Family(Element, CategoryMixin):
     """
 
     _revit_object_class = DB.Family
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class}
 
     def get_instances(self, wrapped=True):
         """Returns:
             [``DB.FamilyInstance``]: List of model instances in this family (unwrapped)
         """
-        # There has to be a better way
+        # One collector grouped by type, instead of one collector per symbol
+        filters = {'of_class': DB.FamilyInstance, 'doc': self.doc}
+        family_category = self._revit_object.FamilyCategory
+        if family_category is not None:
+            filters['of_category'] = family_category.Id
+        instance_ids = rpw.db.Collector(**filters).group_by('type')
+
         instances = []
-        for symbol in self.get_symbols(wrapped=True):
-            symbol_instances = symbol.get_instances(wrapped=wrapped)
-            instances.append(symbol_instances)
+        for symbol_id in self._revit_object.GetFamilySymbolIds():
+            elements = [self.doc.GetElement(element_id) for element_id
+                        in instance_ids.get(symbol_id, [])]
+            instances.append([Element(e) for e in elements] if wrapped else elements)
         return instances
 
     @property
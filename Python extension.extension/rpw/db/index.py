@@ -0,0 +1,201 @@
+"""
+Parameter Index
+
+Maps parameter values to the elements that have them, so repeated
+lookups do not loop over all elements of a category.
+
+>>> rooms_by_number = ParameterIndex(revit.doc, 'Rooms', 'Number')
+>>> rooms_by_number['101']
+[<ElementId>]
+>>> rooms_by_number.startswith('1')
+[<ElementId>, <ElementId>, ...]
+>>> rooms_by_number.duplicates()
+OrderedDict([('102', [<ElementId>, <ElementId>])])
+
+"""
+
+from bisect import bisect_left
+from collections import OrderedDict
+
+from rpw import revit, DB
+from rpw.base import BaseObject
+from rpw.db.collector import Collector
+from rpw.db.parameter import ParameterReader
+from rpw.utils.coerce import to_element_id, to_category_id
+
+
+_MISSING = object()   # Read default of elements without the parameter
+
+
+class ParameterIndex(BaseObject):
+    """
+    Reverse index of one parameter: value to ``ElementId`` of the
+    elements of a category.
+
+    The index is built in a single pass over the category, reading the
+    parameter with a :any:`ParameterReader`. Elements without the
+    parameter are not indexed. After elements change, :any:`update`
+    re-reads only those elements:
+
+    >>> with db.Transaction('Renumber'):
+    ...     result = db.bulk_set(rooms, {'Number': new_number})
+    >>> rooms_by_number.update(result.changed)
+
+    Attributes:
+        doc (``DB.Document``): Indexed document
+        category_id (``DB.ElementId``): Indexed category
+        reader (:any:`ParameterReader`): Reader of the indexed parameter
+    """
+
+    def __init__(self, doc, category, parameter_reference):
+        """
+        Args:
+            doc (``DB.Document``): Document. ``None`` uses ``revit.doc``
+            category (``str``, ``DB.BuiltInCategory``, ``DB.ElementId``):
+                Category of indexed elements. Element types are not indexed
+            parameter_reference (``str``, ``DB.BuiltInParameter``, ``Guid``):
+                Parameter to index. See :any:`ParameterReader`
+        """
+        self.doc = doc or revit.doc
+        self.category_id = to_category_id(category)
+        self.reader = ParameterReader(parameter_reference)
+        self._ids = {}            # value: [DB.ElementId]
+        self._values = {}         # ElementId.IntegerValue: value
+        self._sorted_keys = None  # Sorted string values, for prefix lookups
+        self.build()
+
+    @property
+    def name(self):
+        """ Name of the indexed parameter """
+        return self.reader.name
+
+    def build(self):
+        """ Reads the parameter of all elements of the category """
+        self._ids = {}
+        self._values = {}
+        self._sorted_keys = None
+        collector = Collector(doc=self.doc, of_category=self.category_id,
+                              is_not_type=True)
+        for element in collector:
+            self._add(element)
+
+    def update(self, element_ids):
+        """
+        Re-reads changed elements. Deleted elements, and elements that
+        are no longer in the category, are removed from the index.
+        Element types are skipped, like in :any:`build`.
+
+        Args:
+            element_ids (``list``): ``DB.ElementId``, ``int``, or elements
+        """
+        for element_reference in element_ids:
+            element_id = to_element_id(element_reference)
+            self._remove(element_id.IntegerValue)
+            element = self.doc.GetElement(element_id)
+            if element is None or element.Category is None:
+                continue
+            if isinstance(element, DB.ElementType):
+                # Same as build(): element types are not indexed
+                continue
+            if element.Category.Id.IntegerValue != self.category_id.IntegerValue:
+                continue
+            self._add(element)
+
+    def _add(self, element):
+        value = self.reader.read(element, _MISSING)
+        if value is _MISSING:
+            return
+        self._values[element.Id.IntegerValue] = value
+        element_ids = self._ids.get(value)
+        if element_ids is None:
+            element_ids = self._ids[value] = []
+            self._sorted_keys = None
+        element_ids.append(element.Id)
+
+    def _remove(self, element_id_value):
+        if element_id_value not in self._values:
+            return
+        value = self._values.pop(element_id_value)
+        element_ids = self._ids[value]
+        element_ids[:] = [element_id for element_id in element_ids
+                          if element_id.IntegerValue != element_id_value]
+        if not element_ids:
+            del self._ids[value]
+            self._sorted_keys = None
+
+    def get(self, value):
+        """ ``ElementId`` list of elements with ``value``. Empty if none """
+        return list(self._ids.get(value, []))
+
+    def __getitem__(self, value):
+        return self.get(value)
+
+    def __contains__(self, value):
+        return value in self._ids
+
+    def get_value(self, element_reference):
+        """ Indexed value of an element. ``KeyError`` if not indexed """
+        return self._values[to_element_id(element_reference).IntegerValue]
+
+    def startswith(self, prefix):
+        """
+        ``ElementId`` list of elements with a string value that starts
+        with ``prefix``, ordered by value.
+        """
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(key for key in self._ids
+                                       if isinstance(key, str))
+        keys = self._sorted_keys
+        element_ids = []
+        for index in range(bisect_left(keys, prefix), len(keys)):
+            if not keys[index].startswith(prefix):
+                break
+            element_ids.extend(self._ids[keys[index]])
+        return element_ids
+
+    def duplicates(self, include_blank=False):
+        """
+        Values shared by more than one element.
+
+        Args:
+            include_blank (``bool``): Include ``None`` and blank values
+
+        Returns:
+            (``OrderedDict``): value and ``ElementId`` list, ordered by value
+        """
+        duplicates = OrderedDict()
+        for value in sorted(self._ids):
+            if not include_blank and (value is None or value == ''):
+                continue
+            if len(self._ids[value]) > 1:
+                duplicates[value] = list(self._ids[value])
+        return duplicates
+
+    def conflicts(self, value, element_reference=None):
+        """
+        Elements that already have ``value``, other than the given element.
+        Used to check that a value is unique before setting it.
+
+        >>> if not rooms_by_number.conflicts('101', room):
+        ...     room.parameters['Number'] = '101'
+
+        Returns:
+            (``list``): ``ElementId`` of conflicting elements
+        """
+        element_ids = self._ids.get(value, [])
+        if element_reference is None:
+            return list(element_ids)
+        element_id_value = to_element_id(element_reference).IntegerValue
+        return [element_id for element_id in element_ids
+                if element_id.IntegerValue != element_id_value]
+
+    def __len__(self):
+        """ Number of indexed elements """
+        return len(self._values)
+
+    def __repr__(self):
+        return super(ParameterIndex, self).__repr__(data={
+                                            'name': self.name,
+                                            'elements': len(self._values),
+                                            'values': len(self._ids)
+                                            })
@@ -9,12 +9,427 @@ Parameter Wrapper
 """  #
 from rpw import revit, DB
 from rpw.db.builtins import BipEnum
-from rpw.base import BaseObjectWrapper
+from rpw.base import BaseObjectWrapper, BaseObject
 from rpw.exceptions import RpwException, RpwWrongStorageType
 from rpw.exceptions import RpwParameterNotFound, RpwTypeError
+from rpw.utils.dotnet import Enum, Guid
 from rpw.utils.logger import logger
 
 
+STORAGE_GETTERS = {
+                'String': 'AsString',
+                'Double': 'AsDouble',
+                'Integer': 'AsInteger',
+                'ElementId': 'AsElementId',
+                 }
+
+
+def get_storage_getter(parameter):
+    """
+    Python type and ``As<StorageType>`` getter of an unwrapped ``DB.Parameter``.
+    Storage type is read once, so the getter can be reused to read
+    many parameters with the same ``Definition``.
+
+    >>> python_type, getter = get_storage_getter(parameter)
+    >>> getter(parameter)
+    'Some String'
+
+    Returns:
+        (``tuple``): ``(python_type, getter)``. ``getter`` is an unbound
+        ``DB.Parameter`` method, or ``None`` if storage type is ``None``
+    """
+    storage_type_name = parameter.StorageType.ToString()
+    getter_name = STORAGE_GETTERS.get(storage_type_name)
+    getter = getattr(DB.Parameter, getter_name) if getter_name else None
+    return Parameter.STORAGE_TYPES[storage_type_name], getter
+
+
+def read_value(parameter):
+    """
+    Python value of an unwrapped ``DB.Parameter``.
+    Same as :any:`Parameter.value`, without creating a wrapper.
+
+    >>> read_value(element.LookupParameter('Comments'))
+    'Some String'
+
+    Returns:
+        (``type``): parameter value in python type,
+        ``None`` if storage type is ``None``
+    """
+    storage_type = parameter.StorageType
+    if storage_type == DB.StorageType.String:
+        return parameter.AsString()
+    if storage_type == DB.StorageType.Double:
+        return parameter.AsDouble()
+    if storage_type == DB.StorageType.ElementId:
+        return parameter.AsElementId()
+    if storage_type == DB.StorageType.Integer:
+        return parameter.AsInteger()
+    return None
+
+
+def coerce_value(value, python_type):
+    """
+    Casts a value to the python type of a parameter storage type,
+    like :any:`Parameter.value` setter.
+
+    Args:
+        value: Value to cast
+        python_type (``type``): Python type of the storage type.
+            See :any:`Parameter.STORAGE_TYPES`
+
+    Raises:
+        :class:`RpwWrongStorageType`
+    """
+    # Check if value provided matches storage type
+    if python_type is not None and isinstance(value, python_type):
+        return value
+    # If not, try to handle
+    if python_type is str:
+        return '' if value is None else str(value)
+    if python_type is DB.ElementId and value is None:
+        return DB.ElementId.InvalidElementId
+    if isinstance(value, int) and python_type is float:
+        return float(value)
+    if isinstance(value, float) and python_type is int:
+        return int(value)
+    raise RpwWrongStorageType(python_type, value)
+
+
+def write_value(parameter, value, python_type=None):
+    """
+    Sets value of an unwrapped ``DB.Parameter`` (must be in Transaction Context).
+    Same as :any:`Parameter.value` setter, without creating a wrapper.
+
+    Args:
+        parameter (``DB.Parameter``): Parameter to set
+        value: New value. Cast to the storage type with :any:`coerce_value`
+        python_type (``type``, optional): Python type of the storage type,
+            if already known. See :any:`Parameter.STORAGE_TYPES`
+
+    Returns:
+        (``bool``): Result of ``DB.Parameter.Set``
+    """
+    if parameter.IsReadOnly:
+        definition_name = parameter.Definition.Name
+        raise RpwException('Parameter is Read Only: {}'.format(definition_name))
+
+    if python_type is None:
+        python_type = Parameter.STORAGE_TYPES[parameter.StorageType.ToString()]
+    return parameter.Set(coerce_value(value, python_type))
+
+
+class ParameterReader(BaseObject):
+    """
+    Reads one parameter from many unwrapped elements, without creating
+    :any:`Parameter` wrappers.
+
+    The parameter is resolved once: names are looked up with
+    ``LookupParameter`` on the first element that has the parameter,
+    and later elements use ``get_Parameter`` with the same ``Definition``.
+    The ``As<StorageType>`` getter is also picked once, from the first
+    parameter found.
+
+    >>> reader = ParameterReader('Comments')
+    >>> [reader.read(room) for room in rooms]
+    ['Some String', None, ...]
+
+    Used by :any:`Collector.values`
+    """
+
+    def __init__(self, parameter_reference):
+        """
+        Args:
+            parameter_reference (``str``, ``DB.BuiltInParameter``,
+                ``DB.ElementId``, ``Guid``, ``DB.Definition``): Parameter name,
+                BuiltInParameter (or its name), parameter ElementId,
+                shared parameter Guid, or Definition
+        """
+        self.parameter_reference = parameter_reference
+        self._key = None          # Argument of element.get_Parameter()
+        self._getter = None       # Unbound DB.Parameter.As<StorageType>
+        self._python_type = None  # Parameter.STORAGE_TYPES value
+        self._by_name = False     # Definition is resolved by LookupParameter
+
+        if isinstance(parameter_reference, DB.BuiltInParameter):
+            self._key = parameter_reference
+        elif isinstance(parameter_reference, (Guid, DB.Definition)):
+            self._key = parameter_reference
+        elif isinstance(parameter_reference, DB.ElementId):
+            if parameter_reference.IntegerValue < 0:
+                self._key = Enum.ToObject(DB.BuiltInParameter,
+                                          parameter_reference.IntegerValue)
+        elif isinstance(parameter_reference, str):
+            if parameter_reference in BipEnum:
+                self._key = BipEnum.get(parameter_reference)
+            else:
+                self._by_name = True
+        else:
+            raise RpwTypeError('Parameter Name, BuiltInParameter, ElementId, '
+                               'Guid or Definition', type(parameter_reference))
+
+    @property
+    def name(self):
+        """ Column name of the parameter """
+        reference = self.parameter_reference
+        if isinstance(reference, str):
+            return reference
+        if isinstance(reference, DB.Definition):
+            return reference.Name
+        return reference.ToString()
+
+    def get_parameter(self, element):
+        """ ``DB.Parameter`` of an unwrapped element, or ``None`` """
+        return self._get_parameter(element)[0]
+
+    def _get_parameter(self, element):
+        """
+        Returns ``(parameter, resolved)``. ``resolved`` is ``False`` if
+        the parameter was not found with the resolved key, so its storage
+        type can be different.
+        """
+        if self._key is not None:
+            parameter = element.get_Parameter(self._key)
+            if parameter is not None or not self._by_name:
+                return parameter, True
+
+        reference = self.parameter_reference
+        if isinstance(reference, DB.ElementId):
+            # Project or Shared parameter ElementId. Resolve Definition once
+            parameter_element = element.Document.GetElement(reference)
+            if not isinstance(parameter_element, DB.ParameterElement):
+                # Not a parameter, or id of another document
+                return None, True
+            self._key = parameter_element.GetDefinition()
+            return element.get_Parameter(self._key), True
+
+        # Parameter name: resolve Definition from first element found
+        parameter = element.LookupParameter(reference)
+        if parameter is None:
+            return None, True
+        if self._key is None:
+            self._key = parameter.Definition
+            return parameter, True
+        return parameter, False
+
+    def read(self, element, default=None):
+        """
+        Value of the parameter of an unwrapped element.
+
+        Returns:
+            (``type``): parameter value in python type,
+            ``default`` if element does not have the parameter
+        """
+        parameter, resolved = self._get_parameter(element)
+        if parameter is None:
+            return default
+        if not resolved:
+            # Same name, other Definition
+            return read_value(parameter)
+        if self._getter is None:
+            self._set_storage_type(parameter)
+            if self._getter is None:
+                return None
+        return self._getter(parameter)
+
+    def write(self, element, value, skip_unchanged=False):
+        """
+        Sets value of the parameter of an unwrapped element
+        (must be in Transaction Context). See :any:`write_value`
+
+        Args:
+            skip_unchanged (``bool``): Does not set the parameter if it
+                already has the value. Blank and ``None`` strings are equal
+
+        Returns:
+            (``bool``): ``True`` if the parameter was set
+
+        Raises:
+            :class:`RpwParameterNotFound`
+        """
+        parameter, resolved = self._get_parameter(element)
+        if parameter is None:
+            raise RpwParameterNotFound(element, self.name)
+        if not resolved:
+            # Same name, other Definition
+            python_type = Parameter.STORAGE_TYPES[parameter.StorageType.ToString()]
+        else:
+            if self._python_type is None:
+                self._set_storage_type(parameter)
+            python_type = self._python_type
+        if skip_unchanged:
+            value = coerce_value(value, python_type)
+            current_value = read_value(parameter)
+            if current_value == value:
+                return False
+            if python_type is str and not current_value and not value:
+                return False
+        return write_value(parameter, value, python_type)
+
+    def _set_storage_type(self, parameter):
+        """ Picks getter and python type once, from the first resolved parameter """
+        self._python_type, self._getter = get_storage_getter(parameter)
+
+    def __repr__(self):
+        return super(ParameterReader, self).__repr__(data={'name': self.name})
+
+
+class ParameterHandle(BaseObject):
+    """
+    Parameter resolved once per document, to read and write it on many
+    elements. Elements can be wrapped or unwrapped.
+
+    Definitions and storage types are document specific, so the handle
+    keeps one :any:`ParameterReader` per document.
+
+    >>> number = ParameterHandle('Number')
+    >>> [number.get_value(room) for room in rooms]
+    ['101', '102', ...]
+    >>> with db.Transaction('Renumber'):
+    ...     number.set_value(room, '201')
+
+    >>> comments = ParameterHandle(DB.BuiltInParameter.ALL_MODEL_INSTANCE_COMMENTS)
+    >>> shared = ParameterHandle(Guid('9b679ab7-ea2e-49ce-90ab-0549d5aa36ff'))
+    """
+
+    def __init__(self, parameter_reference):
+        """
+        Args:
+            parameter_reference (``str``, ``DB.BuiltInParameter``, ``Guid``):
+                Parameter name, BuiltInParameter (or its name), or shared
+                parameter Guid. See :any:`ParameterReader`
+        """
+        self.parameter_reference = parameter_reference
+        self._readers = {}        # DB.Document: ParameterReader
+        # Validates reference
+        self.name = ParameterReader(parameter_reference).name
+
+    def get_reader(self, element):
+        """ :any:`ParameterReader` of the document of an unwrapped element """
+        doc = element.Document
+        reader = self._readers.get(doc)
+        if reader is None:
+            reader = ParameterReader(self.parameter_reference)
+            self._readers[doc] = reader
+        return reader
+
+    def get_parameter(self, element):
+        """ ``DB.Parameter`` of the element, or ``None`` """
+        if hasattr(element, 'unwrap'):
+            element = element.unwrap()
+        return self.get_reader(element).get_parameter(element)
+
+    def get_value(self, element, default_value=None):
+        """
+        Returns:
+            (``type``): parameter value in python type, ``default_value``
+            if element does not have the parameter
+        """
+        if hasattr(element, 'unwrap'):
+            element = element.unwrap()
+        return self.get_reader(element).read(element, default_value)
+
+    def set_value(self, element, value):
+        """
+        Sets parameter value (must be in Transaction Context). Value is
+        cast to the storage type like :any:`Parameter.value`
+
+        Raises:
+            :class:`RpwParameterNotFound`
+        """
+        if hasattr(element, 'unwrap'):
+            element = element.unwrap()
+        return self.get_reader(element).write(element, value)
+
+    def has_parameter(self, element):
+        """ ``True`` if element has the parameter """
+        return self.get_parameter(element) is not None
+
+    def __repr__(self):
+        return super(ParameterHandle, self).__repr__(data={'name': self.name})
+
+
+class BulkSetResult(BaseObject):
+    """
+    Result of :any:`bulk_set`
+
+    Attributes:
+        changed (``list``): ``ElementId`` of elements with at least one
+            parameter set
+        unchanged (``int``): Number of values skipped, because the parameter
+            already had the value
+        errors (``list``): ``(ElementId, parameter name, exception)`` of
+            each value that could not be set
+    """
+
+    def __init__(self):
+        self.changed = []
+        self.unchanged = 0
+        self.errors = []
+
+    def __repr__(self):
+        return super(BulkSetResult, self).__repr__(data={
+                                            'changed': len(self.changed),
+                                            'unchanged': self.unchanged,
+                                            'errors': len(self.errors)
+                                            })
+
+
+def bulk_set(elements, values):
+    """
+    Sets parameter values of many elements, only where the value changes
+    (must be in Transaction Context).
+
+    Setting a parameter to its current value still marks the element
+    as modified, so unchanged values are skipped. Each parameter is
+    resolved once per document with a :any:`ParameterHandle`, and its
+    storage type is read once. Errors are collected per element instead
+    of stopping at the first one.
+
+    >>> with db.Transaction('Renumber'):
+    ...     result = db.bulk_set(rooms, {
+    ...                          'Comments': 'Checked',
+    ...                          'Number': lambda room: room.Name.upper()
+    ...                          })
+    >>> result
+    <rpw:BulkSetResult | changed:10 unchanged:90 errors:0>
+
+    Args:
+        elements (``list``): Wrapped or unwrapped elements
+        values (``dict``): Parameter reference or :any:`ParameterHandle`,
+            and value. Callable values are called with each element
+            and return its value
+
+    Returns:
+        :any:`BulkSetResult`
+    """
+    handles = []
+    for parameter_reference, value in values.items():
+        if not isinstance(parameter_reference, ParameterHandle):
+            parameter_reference = ParameterHandle(parameter_reference)
+        handles.append((parameter_reference, value))
+
+    result = BulkSetResult()
+    for element in elements:
+        revit_element = element.unwrap() if hasattr(element, 'unwrap') else element
+        changed = False
+        for handle, value in handles:
+            try:
+                if callable(value):
+                    value = value(element)
+                reader = handle.get_reader(revit_element)
+                if reader.write(revit_element, value, skip_unchanged=True):
+                    changed = True
+                else:
+                    result.unchanged += 1
+            except Exception as errmsg:
+                logger.debug('bulk_set failed: {} {}'.format(handle.name, errmsg))
+                result.errors.append((revit_element.Id, handle.name, errmsg))
+        if changed:
+            result.changed.append(revit_element.Id)
+    return result
+
+
 class ParameterSet(BaseObjectWrapper):
     """
     Allows you to treat an element's parameters as a dictionary.
@@ -38,6 +453,7 @@ class ParameterSet(BaseObjectWrapper):
     """
 
     _revit_object_class = DB.Element
+    __slots__ = ('_builtins',)
 
     def __init__(self, element):
         """
@@ -45,13 +461,21 @@ class ParameterSet(BaseObjectWrapper):
             element(DB.Element): Element to create ParameterSet
         """
         super(ParameterSet, self).__init__(element)
-        self.builtins = _BuiltInParameterSet(self._revit_object)
+        self._builtins = None
+
+    @property
+    def builtins(self):
+        """ :any:`_BuiltInParameterSet` of the element. Created on first access """
+        if self._builtins is None:
+            self._builtins = _BuiltInParameterSet(self._revit_object)
+        return self._builtins
 
     def get_value(self, param_name, default_value=None):
-        try:
-            return self.__getitem__(param_name).value
-        except RpwParameterNotFound:
+        """ Parameter value, or ``default_value`` if element does not have it """
+        parameter = self._revit_object.LookupParameter(param_name)
+        if parameter is None:
             return default_value
+        return Parameter(parameter).value
 
     def __getitem__(self, param_name):
         """ Get's parameter by name.
@@ -118,6 +542,7 @@ class _BuiltInParameterSet(BaseObjectWrapper):
     """
 
     _revit_object_class = DB.Element
+    __slots__ = ()
 
     def __getitem__(self, builtin_enum):
         """ Retrieves Built In Parameter. """
@@ -169,6 +594,7 @@ class Parameter(BaseObjectWrapper):
     """
 
     _revit_object_class = DB.Parameter
+    __slots__ = ('_storage',)
     STORAGE_TYPES = {
                     'String': str,
                     'Double': float,
@@ -189,6 +615,15 @@ class Parameter(BaseObjectWrapper):
         if not isinstance(parameter, DB.Parameter):
             raise RpwTypeError(DB.Parameter, type(parameter))
         super(Parameter, self).__init__(parameter)
+        # (python type, As<StorageType> getter), read on first use
+        object.__setattr__(self, '_storage', None)
+
+    def _get_storage(self):
+        storage = self._storage
+        if storage is None:
+            storage = get_storage_getter(self._revit_object)
+            object.__setattr__(self, '_storage', storage)
+        return storage
 
     @property
     def type(self):
@@ -201,10 +636,7 @@ class Parameter(BaseObjectWrapper):
             (``type``): Python Built in type
 
         """
-        storage_type_name = self._revit_object.StorageType.ToString()
-        python_type = Parameter.STORAGE_TYPES[storage_type_name]
-
-        return python_type
+        return self._get_storage()[0]
 
     @property
     def parameter_type(self):
@@ -243,43 +675,14 @@ class Parameter(BaseObjectWrapper):
             * Storage is ``float`` and value is ``int``; value is converted to ``float``
 
         """
-        if self.type is str:
-            return self._revit_object.AsString()
-        if self.type is float:
-            return self._revit_object.AsDouble()
-        if self.type is DB.ElementId:
-            return self._revit_object.AsElementId()
-        if self.type is int:
-            return self._revit_object.AsInteger()
-
-        raise RpwException('could not get storage type: {}'.format(self.type))
+        python_type, getter = self._get_storage()
+        if getter is None:
+            raise RpwException('could not get storage type: {}'.format(python_type))
+        return getter(self._revit_object)
 
     @value.setter
     def value(self, value):
-        if self._revit_object.IsReadOnly:
-            definition_name = self._revit_object.Definition.Name
-            raise RpwException('Parameter is Read Only: {}'.format(definition_name))
-
-        # Check if value provided matches storage type
-        if not isinstance(value, self.type):
-            # If not, try to handle
-            if self.type is str and value is None:
-                value = ''
-            if self.type is str and value is not None:
-                value = str(value)
-            elif self.type is DB.ElementId and value is None:
-                value = DB.ElementId.InvalidElementId
-            elif isinstance(value, int) and self.type is float:
-                value = float(value)
-            elif isinstance(value, float) and self.type is int:
-                value = int(value)
-            elif isinstance(value, bool) and self.type is int:
-                value = int(value)
-            else:
-                raise RpwWrongStorageType(self.type, value)
-
-        param = self._revit_object.Set(value)
-        return param
+        return write_value(self._revit_object, value, self._get_storage()[0])
 
     @property
     def value_string(self):
@@ -17,6 +17,7 @@ class LinePatternElement(Element, ByNameCollectMixin):
     """
 
     _revit_object_class = DB.LinePatternElement
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class, 'is_type': False}
 
     def __repr__(self):
@@ -34,4 +35,5 @@ class FillPatternElement(LinePatternElement):
     """
 
     _revit_object_class = DB.FillPatternElement
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class, 'is_type': False}
@@ -19,6 +19,7 @@ import rpw
 from rpw import revit, DB
 from rpw.db.element import Element
 from rpw.db.xyz import XYZ
+from rpw.db.cache import link_cache
 from rpw.utils.logger import logger
 # from rpw.db.builtins import BipEnum
 
@@ -33,16 +34,19 @@ class Reference(Element):
     Attribute:
         _revit_object (DB.Reference): Wrapped ``DB.Reference``
         doc (Document): Element Document
+
+    Link documents are resolved with :any:`LinkCache`, so wrapping many
+    references of the same link does not look the link up again.
     """
 
     _revit_object_class = DB.Reference
+    __slots__ = ('linked',)
 
     def __init__(self, reference, linked=False):
         if not linked:
             doc = revit.doc
         else:
-            link_instance = revit.doc.GetElement(reference.ElementId)
-            doc = link_instance.GetLinkDocument()
+            doc = link_cache.get_link_document(revit.doc, reference.ElementId)
 
         super(Reference, self).__init__(reference, doc=doc)
         self.doc = doc
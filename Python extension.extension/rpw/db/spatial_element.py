@@ -32,6 +32,7 @@ class Room(Element):
     """
 
     _revit_object_class = DB.Architecture.Room
+    __slots__ = ()
     _revit_object_category = DB.BuiltInCategory.OST_Rooms
     _collector_params = {'of_category': _revit_object_category,
                          'is_not_type': True}
@@ -98,6 +99,7 @@ class Area(Room):
     """
 
     _revit_object_class = DB.Area
+    __slots__ = ()
     _revit_object_category = DB.BuiltInCategory.OST_Areas
     _collector_params = {'of_category': _revit_object_category,
                          'is_not_type': True}
@@ -139,6 +141,7 @@ class AreaScheme(Element):
     """
 
     _revit_object_class = DB.AreaScheme
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class}
 
     @property
@@ -1,6 +1,7 @@
 import traceback
 from rpw import revit, DB
 from rpw.base import BaseObjectWrapper
+from rpw.db.cache import DocumentCache
 from rpw.exceptions import RpwException
 from rpw.utils.logger import logger
 
@@ -20,6 +21,9 @@ class Transaction(BaseObjectWrapper):
     >>>     assert t.HasStarted() is True
     >>> assert t.HasEnded() is True
 
+    Document caches are invalidated when the transaction ends, whether
+    it commits or rolls back. See :any:`rpw.db.cache`
+
     Wrapped Element:
         self._revit_object = `Revit.DB.Transaction`
 
@@ -32,25 +36,31 @@ class Transaction(BaseObjectWrapper):
             name = 'RPW Transaction'
         super(Transaction, self).__init__(DB.Transaction(doc, name))
         self.transaction = self._revit_object
+        self.doc = doc
 
     def __enter__(self):
         self.transaction.Start()
         return self
 
     def __exit__(self, exception, exception_msg, tb):
-        if exception:
-            self.transaction.RollBack()
-            logger.error('Error in Transaction Context: has rolled back.')
-            # traceback.print_tb(tb)
-            # raise exception # Let exception through
-        else:
-            try:
-                self.transaction.Commit()
-            except Exception as exc:
+        try:
+            if exception:
                 self.transaction.RollBack()
-                logger.error('Error in Transaction Commit: has rolled back.')
-                logger.error(exc)
-                raise
+                logger.error('Error in Transaction Context: has rolled back.')
+                # traceback.print_tb(tb)
+                # raise exception # Let exception through
+            else:
+                try:
+                    self.transaction.Commit()
+                except Exception as exc:
+                    self.transaction.RollBack()
+                    logger.error('Error in Transaction Commit: has rolled back.')
+                    logger.error(exc)
+                    raise
+        finally:
+            # Queries cached inside the transaction are stale after
+            # commit or rollback
+            DocumentCache.invalidate(self.doc)
 
     @staticmethod
     def ensure(name):
@@ -99,6 +109,9 @@ class TransactionGroup(BaseObjectWrapper):
     >>> with db.TransacationGroup('Do Major Task', assimilate=False):
     >>>     with db.Transaction('Do Task'):
     >>>         # Do Stuff
+
+    Document caches are invalidated when the group ends, whether it
+    commits or rolls back. See :any:`rpw.db.cache`
     """
 
     _revit_object_class = DB.TransactionGroup
@@ -115,27 +128,32 @@ class TransactionGroup(BaseObjectWrapper):
         super(TransactionGroup, self).__init__(DB.TransactionGroup(doc, name))
         self.transaction_group = self._revit_object
         self.assimilate = assimilate
+        self.doc = doc
 
     def __enter__(self):
         self.transaction_group.Start()
         return self.transaction_group
 
     def __exit__(self, exception, exception_msg, tb):
-        if exception:
-            self.transaction_group.RollBack()
-            logger.error('Error in TransactionGroup Context: has rolled back.')
-        else:
-            try:
-                if self.assimilate:
-                    self.transaction_group.Assimilate()
-                else:
-                    self.transaction_group.Commit()
-            except Exception as exc:
+        try:
+            if exception:
                 self.transaction_group.RollBack()
-                logger.error('Error in TransactionGroup Commit: \
-                              has rolled back.')
-                logger.error(exc)
-                raise exc
+                logger.error('Error in TransactionGroup Context: has rolled back.')
+            else:
+                try:
+                    if self.assimilate:
+                        self.transaction_group.Assimilate()
+                    else:
+                        self.transaction_group.Commit()
+                except Exception as exc:
+                    self.transaction_group.RollBack()
+                    logger.error('Error in TransactionGroup Commit: \
+                                  has rolled back.')
+                    logger.error(exc)
+                    raise exc
+        finally:
+            # Rolling back the group also undoes its committed transactions
+            DocumentCache.invalidate(self.doc)
 
 
 class DynamoTransaction(object):
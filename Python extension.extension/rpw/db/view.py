@@ -57,6 +57,7 @@ class View(Element):
 
     _revit_object_category = DB.BuiltInCategory.OST_Views
     _revit_object_class = DB.View
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class, 'is_type': False}
 
     @property
@@ -119,6 +120,7 @@ class ViewPlan(View):
 
     """
     _revit_object_class = DB.ViewPlan
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class, 'is_type': False}
 
     @property
@@ -129,30 +131,35 @@ class ViewPlan(View):
 class ViewSheet(View):
     """ ViewSheet Wrapper. ``ViewType`` is ViewType.DrawingSheet """
     _revit_object_class = DB.ViewSheet
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class, 'is_type': False}
 
 
 class ViewSchedule(View):
     """ ViewSchedule Wrapper. ``ViewType`` is ViewType.Schedule """
     _revit_object_class = DB.ViewSchedule
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class, 'is_type': False}
 
 
 class ViewSection(View):
     """ DB.ViewSection Wrapper. ``ViewType`` is ViewType.DrawingSheet """
     _revit_object_class = DB.ViewSection
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class, 'is_type': False}
 
 
 class View3D(View):
     """ DB.View3D Wrapper. ``ViewType`` is ViewType.ThreeD """
     _revit_object_class = DB.View3D
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class, 'is_type': False}
 
 
 class ViewFamilyType(Element):
     """ View Family Type Wrapper """
     _revit_object_class = DB.ViewFamilyType
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class, 'is_type': True}
 
     @property
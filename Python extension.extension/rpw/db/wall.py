@@ -11,6 +11,7 @@ from rpw.base import BaseObjectWrapper
 from rpw.utils.logger import logger, deprecate_warning
 from rpw.utils.coerce import to_element_id
 from rpw.db.builtins import BipEnum
+from rpw.db.cache import element_cache
 from rpw.exceptions import RpwTypeError, RpwCoerceError
 from rpw.utils.mixins import ByNameCollectMixin
 
@@ -23,6 +24,7 @@ class Wall(FamilyInstance):
 
     _revit_object_category = DB.BuiltInCategory.OST_Walls
     _revit_object_class = DB.Wall
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class, 'is_type': False}
 
     def change_type(self, wall_type_reference):
@@ -47,9 +49,7 @@ class Wall(FamilyInstance):
 
     def get_wall_type(self, wrapped=True):
         """ Get Wall Type """
-        wall_type_id = self._revit_object.GetTypeId()
-        wall_type = self.doc.GetElement(wall_type_id)
-        return WallType(wall_type) if wrapped else wall_type
+        return element_cache.get_type(self._revit_object, wrapped=wrapped)
 
     @property
     def wall_type(self):
@@ -93,6 +93,7 @@ class WallType(FamilySymbol, ByNameCollectMixin):
     """
 
     _revit_object_class = DB.WallType
+    __slots__ = ()
     _collector_params = {'of_class': _revit_object_class, 'is_type': True}
 
     def get_family(self, wrapped=True):
@@ -192,9 +193,13 @@ class WallKind(BaseObjectWrapper):
 
     def get_instances(self, wrapped=True):
         """ Returns all Wall instances of this given Wall Kind"""
+        # One collector grouped by type, instead of one collector per type
+        instance_ids = rpw.db.Wall.collect().group_by('type')
         instances = []
-        for wall_type in self.get_wall_types(wrapped=True):
-            instances.extend(wall_type.get_instances(wrapped=wrapped))
+        for wall_type in self.get_wall_types(wrapped=False):
+            elements = [revit.doc.GetElement(element_id) for element_id
+                        in instance_ids.get(wall_type.Id, [])]
+            instances.extend([Element(e) for e in elements] if wrapped else elements)
         return instances
 
     @property
@@ -26,6 +26,7 @@ class XYZ(BaseObjectWrapper):
     """
 
     _revit_object_class = DB.XYZ
+    __slots__ = ()
 
     def __init__(self, *point_reference):
         """
@@ -57,6 +57,16 @@ class RpwParameterNotFound(RpwException, KeyError):
         super(RpwParameterNotFound, self).__init__(msg)
 
 
+class RpwElementNotFound(RpwException, KeyError):
+    """ Element Ids not found in Document """
+    def __init__(self, element_ids, doc=None):
+        self.element_ids = element_ids
+        msg = 'elements not found [doc:{}]:[ids:{}]'.format(
+                                    getattr(doc, 'Title', doc),
+                                    [element_id.IntegerValue for element_id in element_ids])
+        super(RpwElementNotFound, self).__init__(msg)
+
+
 class RpwWrongStorageType(RpwException, TypeError):
     """ Wrong Storage Type """
     def __init__(self, storage_type, value):
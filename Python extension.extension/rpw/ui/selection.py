@@ -64,7 +64,7 @@ class Selection(BaseObjectWrapper, ElementSet):
 
         if not elements_or_ids:
             # Is List of elements is not provided, uses uidoc selection
-            elements_or_ids = [e for e in uidoc.Selection.GetElementIds()]
+            elements_or_ids = uidoc.Selection.GetElementIds()
 
         ElementSet.__init__(self, elements_or_ids, doc=self.uidoc.Document)
 
@@ -84,8 +84,15 @@ class Selection(BaseObjectWrapper, ElementSet):
         if select:
             self.update()
 
-    def update(self):
-        """ Forces UI selection to match the Selection() object """
+    def update(self, elements_or_ids=None):
+        """
+        Forces UI selection to match the Selection() object.
+        Elements or ElementIds are added first, if provided.
+
+        >>> selection.update([element_ids])
+        """
+        if elements_or_ids is not None:
+            ElementSet.update(self, elements_or_ids)
         self._revit_object.SetElementIds(self.get_element_ids(as_list=True))
 
     def clear(self):
@@ -106,11 +113,13 @@ class Selection(BaseObjectWrapper, ElementSet):
         based on index.
         """
         # https://github.com/gtalarico/revitpythonwrapper/issues/32
-        for n, element in enumerate(self.__iter__()):
-            if n ==index:
-                return element
-        else:
+        # Only the element at index is wrapped
+        element_ids = self.get_element_ids(as_list=False)
+        try:
+            element_id = element_ids[index]
+        except (IndexError, TypeError):
             raise IndexError('Index is out of range')
+        return Element.from_id(element_id, doc=self.doc)
 
     def __bool__(self):
         """
@@ -122,7 +131,9 @@ class Selection(BaseObjectWrapper, ElementSet):
         >>> Selection() is True
         True
         """
-        return super(Selection, obj).__bool__()
+        return ElementSet.__bool__(self)
+
+    __nonzero__ = __bool__
 
     def __repr__(self):
         return super(Selection, self).__repr__(data={'count': len(self)})
@@ -3,14 +3,46 @@ Type Casting Utilities
 
 """
 
+from array import array
+
 import rpw
 from rpw import revit, DB
-from rpw.base import BaseObjectWrapper
+from rpw.base import BaseObjectWrapper, BaseObject
 from rpw.db.builtins import BicEnum
 from rpw.utils.dotnet import List
 from rpw.exceptions import RpwTypeError
 
 
+def _get_int64_typecode():
+    """
+    Signed 64-bit ``array`` typecode. IronPython 2.7 has no ``'q'`` and
+    its ``'l'`` is 32-bit, so the buffer falls back to ``'d'`` doubles,
+    which hold ids exactly up to ``2**53``.
+    """
+    for typecode in ('q', 'l'):
+        try:
+            if array(typecode).itemsize == 8:
+                return typecode
+        except ValueError:
+            pass
+    return 'd'
+
+
+if hasattr(DB.ElementId, 'Value'):
+    # Revit 2024+: Int64 ElementId
+    def get_id_value(element_id):
+        """ Value of an ``ElementId``: ``Value`` in Revit 2024+ """
+        return element_id.Value
+    ID_VALUE_TYPE = long
+    ID_TYPECODE = _get_int64_typecode()
+else:
+    def get_id_value(element_id):
+        """ Value of an ``ElementId``: ``IntegerValue`` before Revit 2024 """
+        return element_id.IntegerValue
+    ID_VALUE_TYPE = int
+    ID_TYPECODE = 'i'
+
+
 def to_element_id(element_reference):
     """
     Coerces Element References (Element, ElementId, ...) to Element Id
@@ -20,19 +52,10 @@ def to_element_id(element_reference):
     <Element Id>
 
     """
-    if hasattr(element_reference, 'Id'):
-        element_id = element_reference.Id
-    elif isinstance(element_reference, DB.Reference):
-        element_id = element_reference.ElementId
-    elif isinstance(element_reference, int):
-        element_id = DB.ElementId(element_reference)
-    elif isinstance(element_reference, DB.ElementId):
-        element_id = element_reference
-    elif element_reference == DB.ElementId.InvalidElementId:
-        element_id = element_reference
-    else:
-        raise RpwTypeError('Element, ElementId, or int', type(element_reference))
-    return element_id
+    getter = _element_id_getters.get(type(element_reference))
+    if getter is None:
+        getter = _get_element_id_getter(element_reference)
+    return getter(element_reference)
 
 
 def to_element_ids(element_references):
@@ -56,9 +79,148 @@ def to_element_ids(element_references):
     Returns:
         [``DB.ElementId``, ... ]: List of Element Ids.
     """
+    if isinstance(element_references, IdBuffer):
+        return list(element_references)
     element_references = to_iterable(element_references)
     return [to_element_id(e_ref) for e_ref in element_references]
 
+
+# Type: function returning the ElementId of a reference of that type
+_element_id_getters = {}
+
+
+def _get_element_id_getter(element_reference):
+    """
+    Picks how to get the ElementId of a reference, and keeps it for
+    its type, so lists of references are not checked item by item.
+    """
+    reference_type = type(element_reference)
+    if isinstance(element_reference, DB.ElementId):
+        getter = _get_self
+    elif isinstance(element_reference, int):
+        getter = DB.ElementId
+    elif hasattr(element_reference, 'Id'):
+        # Elements, wrapped elements, categories...
+        getter = _get_id
+    elif isinstance(element_reference, DB.Reference):
+        getter = _get_reference_id
+    else:
+        raise RpwTypeError('Element, ElementId, or int', reference_type)
+    _element_id_getters[reference_type] = getter
+    return getter
+
+
+def _get_self(element_id):
+    return element_id
+
+
+def _get_id(element):
+    return element.Id
+
+
+def _get_reference_id(reference):
+    return reference.ElementId
+
+
+class IdBuffer(BaseObject):
+    """
+    Compact buffer of ElementId values, for bulk coercion and for passing
+    many ids to the Revit API.
+
+    Values are kept in an ``array``. Revit 2024+ ids use a 64-bit
+    integer typecode where the runtime has one. On IronPython 2.7 the
+    array is float-backed (``'d'``), which is exact for ids up to
+    ``2**53``. ElementIds are created from ``long`` values either way.
+    The ``List[DB.ElementId]`` is created once, on first use, and kept
+    until the buffer changes.
+
+    >>> from rpw.utils.coerce import IdBuffer
+    >>> buffer = IdBuffer([wall, 20001, element_id])
+    >>> buffer.extend(Collector(of_category='Rooms'))
+    >>> uidoc.Selection.SetElementIds(buffer.to_list())
+
+    Any element reference accepted by :any:`to_element_id` can be added.
+    Collectors and ``ICollection<ElementId>`` are read with
+    ``ToElementIds`` or iterated directly.
+    """
+
+    def __init__(self, element_references=None):
+        """
+        Args:
+            element_references (``list``, optional): Element references,
+                ``List[DB.ElementId]``, or Collector
+        """
+        self._values = array(ID_TYPECODE)
+        self._list = None    # Cached List[DB.ElementId]
+        if element_references is not None:
+            self.extend(element_references)
+
+    @classmethod
+    def from_values(cls, values):
+        """ Buffer of ElementId values, ie: ``IntegerValue`` """
+        buffer = cls()
+        buffer._values.extend(values)
+        return buffer
+
+    @property
+    def values(self):
+        """ ``array`` of ElementId values """
+        return self._values
+
+    def append(self, element_reference):
+        """ Adds one element reference """
+        self._values.append(get_id_value(to_element_id(element_reference)))
+        self._list = None
+
+    def extend(self, element_references):
+        """ Adds element references. Handles single or list """
+        if isinstance(element_references, IdBuffer):
+            self._values.extend(element_references._values)
+            self._list = None
+            return
+        if hasattr(element_references, 'ToElementIds'):
+            element_references = element_references.ToElementIds()
+        append = self._values.append
+        getters = _element_id_getters
+        for element_reference in to_iterable(element_references):
+            getter = getters.get(type(element_reference))
+            if getter is None:
+                getter = _get_element_id_getter(element_reference)
+            append(get_id_value(getter(element_reference)))
+        self._list = None
+
+    def clear(self):
+        self._values = array(ID_TYPECODE)
+        self._list = None
+
+    def to_list(self):
+        """
+        Returns:
+            (``List[DB.ElementId]``): Ids of the buffer. The same list is
+            returned until the buffer changes, so it should not be modified
+        """
+        if self._list is None:
+            element_ids = List[DB.ElementId](len(self._values))
+            add = element_ids.Add
+            for value in self._values:
+                add(DB.ElementId(ID_VALUE_TYPE(value)))
+            self._list = element_ids
+        return self._list
+
+    def __iter__(self):
+        """ Iterates ``DB.ElementId`` """
+        return iter(self.to_list())
+
+    def __contains__(self, element_reference):
+        return get_id_value(to_element_id(element_reference)) in self._values
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return super(IdBuffer, self).__repr__(data={'count': len(self)})
+
+
 # TODO: Add case to unwrap rpw elements
 def to_element(element_reference, doc=revit.doc):
     """ Same as to_elements but for a single object """
@@ -99,7 +261,62 @@ def to_elements(element_references, doc=revit.doc):
         [``DB.Element``]: Elements
     """
     element_references = to_iterable(element_references)
-    return [to_element(e_ref) for e_ref in element_references]
+    return [to_element(e_ref, doc=doc) for e_ref in element_references]
+
+
+def to_xyz(point_reference):
+    """
+    Coerces a point-like reference into ``DB.XYZ``
+
+    >>> from rpw.utils.coerce import to_xyz
+    >>> to_xyz((0, 0, 10))
+    DB.XYZ
+    >>> to_xyz(rpw.db.XYZ(0, 0))
+    DB.XYZ
+
+    Args:
+        point_reference ([``DB.XYZ``, :any:`XYZ`, ``tuple``, ``list``]): Point like data
+
+    Returns:
+        [``DB.XYZ``]: Point
+    """
+    if isinstance(point_reference, DB.XYZ):
+        return point_reference
+    if hasattr(point_reference, 'unwrap'):
+        return point_reference.unwrap()
+    if isinstance(point_reference, (tuple, list)) and len(point_reference) in (2, 3):
+        return DB.XYZ(*(list(point_reference) + [0])[:3])
+    raise RpwTypeError('XYZ, point tuple', type(point_reference))
+
+
+def to_outline(outline_reference):
+    """
+    Coerces an outline reference into ``DB.Outline``.
+    Outlines are always axis aligned: the ``Transform`` of a
+    ``DB.BoundingBoxXYZ`` is ignored.
+
+    >>> from rpw.utils.coerce import to_outline
+    >>> to_outline(((0, 0, 0), (10, 10, 3)))
+    DB.Outline
+    >>> to_outline(element.get_BoundingBox(None))
+    DB.Outline
+
+    Args:
+        outline_reference ([``DB.Outline``, ``DB.BoundingBoxXYZ``, ``(min, max)``]): Outline,
+                        BoundingBox or tuple of two point-like references
+
+    Returns:
+        [``DB.Outline``]: Outline
+    """
+    if isinstance(outline_reference, DB.Outline):
+        return outline_reference
+    if isinstance(outline_reference, DB.BoundingBoxXYZ):
+        return DB.Outline(outline_reference.Min, outline_reference.Max)
+    if isinstance(outline_reference, (tuple, list)) and len(outline_reference) == 2:
+        min_point, max_point = outline_reference
+        return DB.Outline(to_xyz(min_point), to_xyz(max_point))
+    raise RpwTypeError('Outline, BoundingBoxXYZ, (min, max) tuple',
+                       type(outline_reference))
 
 
 def to_class(class_reference):
@@ -3,7 +3,7 @@
 
 This module ensures most commonly used .NET classes are loaded for you.for
 
->>> from rpw.utils.dotnet import List, Enum, Process
+>>> from rpw.utils.dotnet import List, Enum, Type, Guid, Process, Stopwatch
 
 """
 
@@ -29,6 +29,6 @@ clr.AddReference('System')                 # Enum, Diagnostics
 clr.AddReference('System.Collections')     # List
 
 # Core Imports
-from System import Enum
+from System import Enum, Type, Guid
 from System.Collections.Generic import List
-from System.Diagnostics import Process
+from System.Diagnostics import Process, Stopwatch
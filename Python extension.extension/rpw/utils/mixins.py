@@ -6,12 +6,14 @@ from rpw.exceptions import RpwCoerceError
 from rpw.utils.logger import deprecate_warning
 
 
-class ByNameCollectMixin():
+class ByNameCollectMixin(object):
 
     """ Adds name, by_name(), and by_name_or_element_ref() methods.
     This is for class inheritance only, used to reduce duplication
     """
 
+    __slots__ = ()
+
     @property
     def name(self):
         """ Returns object's Name attribute """
@@ -53,11 +55,13 @@ class ByNameCollectMixin():
 
 
 
-class CategoryMixin():
+class CategoryMixin(object):
 
     """ Adds category and get_category methods.
     """
 
+    __slots__ = ()
+
     @property
     def _category(self):
         """